@@ -8,8 +8,21 @@ framework used in organizational excellence assessment.
 Modules:
     adli_scoring: ADLI (Approach-Deployment-Learning-Integration) scoring for processes
     letci_scoring: LeTCI (Levels-Trends-Comparisons-Integration) scoring for results
-    gap_analysis: Gap analysis and improvement prioritization (coming soon)
-    integration_health: Integration Health Index computation (coming soon)
+    indicator_arrays: Shared coercion and validation of batch indicator matrices
+    item_table: Columnar ItemTable shared by all scorers
+    weights: Frozen, pre-validated weight vectors
+    rollup: Segmented category/organization rollups for many organizations
+    gap_analysis: Gap analysis and improvement prioritization
+    integration_health: Sparse-incidence Integration Health Index for dependency graphs
+    incremental: Dirty-propagation scorecards for interactive editing
+    score_cache: Optional LRU memoization of item scores
+    parallel: Process-pool scoring of sharded corpora
+    uncertainty: Monte Carlo uncertainty bands for category and organization scores
+    sensitivity: Vectorized weight sensitivity sweeps
+    planner: Budget-constrained improvement planning
+    scenarios: Batched what-if scenarios against a compiled baseline
+    marginal_gains: Closed-form org score and IHI derivatives per indicator
+    calibration: Constrained least-squares weight calibration against expert scores
 
 Example:
     >>> from src.algorithms import compute_adli_score, compute_letci_score
@@ -25,8 +38,35 @@ Example:
     ... })
 """
 
-from .adli_scoring import ADLIScorer, compute_adli_score
-from .letci_scoring import LeTCIScorer, compute_letci_score
+from .adli_scoring import ADLIScorer, compute_adli_score, get_adli_scorer
+from .letci_scoring import LeTCIScorer, TrendState, compute_letci_score, get_letci_scorer
+from .indicator_arrays import IndicatorRangeError
+from .item_table import ItemTable
+from .weights import ADLIWeights, LeTCIWeights, CategoryWeights
+from .rollup import RollupResult, rollup_scores
+from .gap_analysis import (
+    gap_frame,
+    classify_gap_status,
+    StreamingGapAnalyzer,
+    StreamingGapResult,
+    stream_gap_analysis,
+)
+from .integration_health import IntegrationGraph
+from .incremental import IncrementalScorecard
+from .score_cache import ScoreCache
+from .parallel import ParallelScoringResult, score_corpus
+from .uncertainty import UncertaintyEngine, UncertaintyResult, simulate_uncertainty
+from .sensitivity import (
+    SweepResult,
+    project_to_simplex,
+    sample_simplex_weights,
+    simplex_grid,
+    sweep_weights,
+)
+from .planner import ImprovementPlan, plan_improvements
+from .scenarios import Scenario, ScenarioEngine, ScenarioResult
+from .marginal_gains import MarginalGainIndex, marginal_gain_index
+from .calibration import CalibrationFit, CalibrationResult, calibrate_weights
 
 __version__ = "1.0.0"
 __author__ = "Rungtiva Saosing, Chatchai Tritham, Chattabhorn Tritham, Sudasawan Ngammongkolwong"
@@ -34,6 +74,44 @@ __author__ = "Rungtiva Saosing, Chatchai Tritham, Chattabhorn Tritham, Sudasawan
 __all__ = [
     'ADLIScorer',
     'LeTCIScorer',
+    'TrendState',
     'compute_adli_score',
     'compute_letci_score',
+    'get_adli_scorer',
+    'get_letci_scorer',
+    'IndicatorRangeError',
+    'ItemTable',
+    'ADLIWeights',
+    'LeTCIWeights',
+    'CategoryWeights',
+    'RollupResult',
+    'rollup_scores',
+    'gap_frame',
+    'classify_gap_status',
+    'StreamingGapAnalyzer',
+    'StreamingGapResult',
+    'stream_gap_analysis',
+    'IntegrationGraph',
+    'IncrementalScorecard',
+    'ScoreCache',
+    'ParallelScoringResult',
+    'score_corpus',
+    'UncertaintyEngine',
+    'UncertaintyResult',
+    'simulate_uncertainty',
+    'SweepResult',
+    'project_to_simplex',
+    'sample_simplex_weights',
+    'simplex_grid',
+    'sweep_weights',
+    'ImprovementPlan',
+    'plan_improvements',
+    'Scenario',
+    'ScenarioEngine',
+    'ScenarioResult',
+    'MarginalGainIndex',
+    'marginal_gain_index',
+    'CalibrationFit',
+    'CalibrationResult',
+    'calibrate_weights',
 ]
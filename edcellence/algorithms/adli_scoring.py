@@ -20,8 +20,20 @@ Reference:
     IEEE ACCESS (under review).
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 import numpy as np
+import pandas as pd
+
+from .indicator_arrays import (
+    ADLI_INDICATOR_KEYS,
+    as_indicator_matrix,
+    validate_indicator_matrix,
+)
+from .item_table import ItemTable, score_table_rows
+from .score_cache import ScoreCache, weights_fingerprint
+from .weights import ADLIWeights, compile_weights
 
 
 class ADLIScorer:
@@ -35,30 +47,128 @@ class ADLIScorer:
         'w_I': 0.20   # Integration
     }
 
-    def __init__(self, weights: Optional[Dict[str, float]] = None):
+    # Column order of indicator matrices, breakdown labels and matching weight keys
+    INDICATOR_KEYS = ADLI_INDICATOR_KEYS
+    DIMENSION_LABELS = ('Approach', 'Deployment', 'Learning', 'Integration')
+    WEIGHT_KEYS = ('w_A', 'w_D', 'w_L', 'w_I')
+
+    # Scoring method label used in cache keys and result metadata
+    SCORING_METHOD = 'ADLI'
+
+    def __init__(
+        self,
+        weights: Optional[Union[Dict[str, float], ADLIWeights]] = None,
+        cache: Optional[ScoreCache] = None
+    ):
         """
         Initialize ADLI scorer.
 
         Args:
             weights: Custom weights for ADLI dimensions. If None, uses defaults.
-                    Must sum to 1.0.
+                    Must sum to 1.0. A pre-validated ADLIWeights skips validation.
+            cache: Optional ScoreCache memoizing compute_score by indicator vector.
 
         Raises:
             ValueError: If weights don't sum to 1.0 or are out of range [0,1].
         """
-        self.weights = weights if weights else self.DEFAULT_WEIGHTS.copy()
-        self._validate_weights()
-
-    def _validate_weights(self):
+        self._cache = cache
+
+        if not isinstance(weights, ADLIWeights):
+            weights = weights if weights else self.DEFAULT_WEIGHTS
+            self._validate_weights(weights)
+            weights = ADLIWeights(*self._compile_weights(weights))
+
+        # Scalar and batch paths both read the one frozen, read-only vector
+        self._weight_vector = weights.vector
+        self._weight_values = tuple(self._weight_vector.tolist())
+        self._weights = MappingProxyType(dict(zip(self.WEIGHT_KEYS, self._weight_values)))
+        self._weight_fingerprint = weights_fingerprint(self._weight_vector)
+
+    @property
+    def weights(self) -> Mapping[str, float]:
+        """Read-only view of the weights, keyed by WEIGHT_KEYS."""
+        return self._weights
+
+    @property
+    def weight_vector(self) -> np.ndarray:
+        """Read-only weight vector aligned with INDICATOR_KEYS."""
+        return self._weight_vector
+
+    @property
+    def cache(self) -> Optional[ScoreCache]:
+        """ScoreCache given at construction, or None."""
+        return self._cache
+
+    def _validate_weights(self, weights: Dict[str, float]):
         """Validate that weights sum to 1.0 and are in valid range."""
-        weight_sum = sum(self.weights.values())
+        weight_sum = sum(weights.values())
         if not np.isclose(weight_sum, 1.0, atol=1e-6):
             raise ValueError(f"Weights must sum to 1.0, got {weight_sum}")
 
-        for key, value in self.weights.items():
+        for key, value in weights.items():
             if not 0 <= value <= 1:
                 raise ValueError(f"Weight {key}={value} out of range [0,1]")
 
+    def _compile_weights(self, weights: Dict[str, float]) -> Tuple[float, ...]:
+        """Order weights like INDICATOR_KEYS."""
+        missing = set(self.WEIGHT_KEYS) - weights.keys()
+        if missing:
+            raise ValueError(f"Missing weights: {missing}")
+        return tuple(float(weights[key]) for key in self.WEIGHT_KEYS)
+
+    def validate_indicators(self, indicators: Dict[str, float]) -> List[float]:
+        """
+        Extract indicators in INDICATOR_KEYS order, checking presence and range.
+
+        Raises:
+            ValueError: If indicators are missing or out of range.
+        """
+        required_keys = set(self.INDICATOR_KEYS)
+        if not required_keys.issubset(indicators.keys()):
+            missing = required_keys - indicators.keys()
+            raise ValueError(f"Missing indicators: {missing}")
+
+        # Validate indicator ranges
+        values = [indicators[key] for key in self.INDICATOR_KEYS]
+        for key, value in zip(self.INDICATOR_KEYS, values):
+            if not 0 <= value <= 1:
+                raise ValueError(f"Indicator {key}={value} out of range [0,1]")
+
+        return values
+
+    def _score_values(self, values: List[float]) -> float:
+        """Weighted score of validated indicator values."""
+        p_a, p_d, p_l, p_i = values
+        w_A, w_D, w_L, w_I = self._weight_values
+
+        # Compute weighted score
+        score = 100 * (
+            w_A * p_a +
+            w_D * p_d +
+            w_L * p_l +
+            w_I * p_i
+        )
+
+        return round(score, 2)
+
+    def _breakdown_values(self, values: List[float], total_score: float) -> Dict[str, float]:
+        """Per-dimension contributions of validated indicator values."""
+        p_a, p_d, p_l, p_i = values
+        w_A, w_D, w_L, w_I = self._weight_values
+
+        return {
+            'Approach': round(100 * w_A * p_a, 2),
+            'Deployment': round(100 * w_D * p_d, 2),
+            'Learning': round(100 * w_L * p_l, 2),
+            'Integration': round(100 * w_I * p_i, 2),
+            'Total': total_score
+        }
+
+    def _score_entry(self, values: List[float]) -> Tuple[float, Dict[str, float]]:
+        """Score and breakdown of validated values, as stored in a ScoreCache."""
+        score = self._score_values(values)
+        return score, self._breakdown_values(values, score)
+
     def compute_score(self, indicators: Dict[str, float]) -> float:
         """
         Compute ADLI score for a process item.
@@ -85,26 +195,87 @@ class ADLIScorer:
             >>> print(f"ADLI Score: {score}")
             ADLI Score: 59.0
         """
-        required_keys = {'P_A', 'P_D', 'P_L', 'P_I'}
-        if not required_keys.issubset(indicators.keys()):
-            missing = required_keys - indicators.keys()
-            raise ValueError(f"Missing indicators: {missing}")
+        values = self.validate_indicators(indicators)
+        if self.cache is None:
+            return self._score_values(values)
+        return self.cache.get_or_compute(
+            self._weight_fingerprint, self.SCORING_METHOD, values, self._score_entry
+        )[0]
+
+    def compute_score_batch(
+        self,
+        indicators: Union[np.ndarray, pd.DataFrame, ItemTable]
+    ) -> np.ndarray:
+        """
+        Compute ADLI scores for many process items at once.
 
-        # Validate indicator ranges
-        for key, value in indicators.items():
-            if key in required_keys:
-                if not 0 <= value <= 1:
-                    raise ValueError(f"Indicator {key}={value} out of range [0,1]")
+        Args:
+            indicators: (N, 4) array with columns ordered as INDICATOR_KEYS, or a
+                       DataFrame with 'P_A', 'P_D', 'P_L', 'P_I' columns, or an ItemTable.
+                       For an ItemTable only the process rows are scored and the
+                       result stays aligned with the table (other rows are NaN).
 
-        # Compute weighted score
-        score = 100 * (
-            self.weights['w_A'] * indicators['P_A'] +
-            self.weights['w_D'] * indicators['P_D'] +
-            self.weights['w_L'] * indicators['P_L'] +
-            self.weights['w_I'] * indicators['P_I']
-        )
+        Returns:
+            Array of N ADLI scores in range [0, 100], rounded like compute_score.
 
-        return round(score, 2)
+        Raises:
+            ValueError: If columns are missing or the array shape is wrong.
+            IndicatorRangeError: If any indicator is out of range; lists every
+                                 offending row.
+
+        Example:
+            >>> scorer = ADLIScorer()
+            >>> scorer.compute_score_batch(np.array([[0.75, 0.45, 0.60, 0.55],
+            ...                                      [1.0, 1.0, 1.0, 1.0]]))
+            array([ 59., 100.])
+        """
+        if isinstance(indicators, ItemTable):
+            return score_table_rows(indicators, True, self.compute_score_batch)
+
+        matrix = as_indicator_matrix(indicators, self.INDICATOR_KEYS)
+        validate_indicator_matrix(matrix, self.INDICATOR_KEYS)
+
+        return np.round(100 * (matrix @ self._weight_vector), 2)
+
+    def get_diagnostic_breakdown_batch(
+        self,
+        indicators: Union[np.ndarray, pd.DataFrame, ItemTable],
+        as_frame: bool = False
+    ) -> Union[np.ndarray, pd.DataFrame]:
+        """
+        Get per-dimension contributions for many items at once.
+
+        Indicators are validated once and all contributions come from a single
+        elementwise product with the compiled weight vector.
+
+        Args:
+            indicators: Same inputs as compute_score_batch
+            as_frame: Return a DataFrame labelled like get_diagnostic_breakdown
+
+        Returns:
+            (N, 5) matrix with columns DIMENSION_LABELS + ('Total',), rounded to
+            2 decimals; 'Total' equals compute_score_batch. For an ItemTable,
+            non-process rows are NaN.
+
+        Example:
+            >>> scorer = ADLIScorer()
+            >>> scorer.get_diagnostic_breakdown_batch(np.array([[0.75, 0.45, 0.60, 0.55]]))
+            array([[22.5, 13.5, 12. , 11. , 59. ]])
+        """
+        if isinstance(indicators, ItemTable):
+            matrix = score_table_rows(indicators, True, self.get_diagnostic_breakdown_batch)
+        else:
+            matrix = as_indicator_matrix(indicators, self.INDICATOR_KEYS)
+            validate_indicator_matrix(matrix, self.INDICATOR_KEYS)
+
+            breakdown = np.empty((len(matrix), 5))
+            np.multiply(100 * matrix, self._weight_vector, out=breakdown[:, :4])
+            breakdown[:, 4] = 100 * (matrix @ self._weight_vector)
+            matrix = np.round(breakdown, 2, out=breakdown)
+
+        if as_frame:
+            return pd.DataFrame(matrix, columns=list(self.DIMENSION_LABELS) + ['Total'])
+        return matrix
 
     def compute_category_score(
         self,
@@ -170,17 +341,8 @@ class ADLIScorer:
             Learning: 12.0
             Integration: 11.0
         """
-        total_score = self.compute_score(indicators)
-
-        breakdown = {
-            'Approach': round(100 * self.weights['w_A'] * indicators['P_A'], 2),
-            'Deployment': round(100 * self.weights['w_D'] * indicators['P_D'], 2),
-            'Learning': round(100 * self.weights['w_L'] * indicators['P_L'], 2),
-            'Integration': round(100 * self.weights['w_I'] * indicators['P_I'], 2),
-            'Total': total_score
-        }
-
-        return breakdown
+        values = self.validate_indicators(indicators)
+        return self._breakdown_values(values, self._score_values(values))
 
 
 def compute_adli_score(indicators: Dict[str, float], weights: Optional[Dict[str, float]] = None) -> float:
@@ -199,8 +361,35 @@ def compute_adli_score(indicators: Dict[str, float], weights: Optional[Dict[str,
         >>> print(score)
         59.0
     """
-    scorer = ADLIScorer(weights)
-    return scorer.compute_score(indicators)
+    return get_adli_scorer(weights).compute_score(indicators)
+
+
+@lru_cache(maxsize=128)
+def _adli_scorer_for(weights: ADLIWeights) -> ADLIScorer:
+    """Build one shared scorer per distinct set of compiled weights."""
+    return ADLIScorer(weights)
+
+
+def get_adli_scorer(weights: Optional[Union[Dict[str, float], ADLIWeights]] = None) -> ADLIScorer:
+    """
+    Return a process-wide shared ADLIScorer for the given weights.
+
+    Identical weights, whether passed as a dict or an ADLIWeights, map to the same
+    scorer instance, so validation and compilation happen once per distinct
+    weighting. Cached scorers are shared across callers and threads; their
+    weights and cache are read-only, so sharing needs no locks.
+
+    Args:
+        weights: Optional weights dict or ADLIWeights; None uses the defaults
+
+    Returns:
+        Shared ADLIScorer instance
+
+    Example:
+        >>> get_adli_scorer() is get_adli_scorer(ADLIScorer.DEFAULT_WEIGHTS)
+        True
+    """
+    return _adli_scorer_for(compile_weights(weights, ADLIWeights))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,322 @@
+"""
+Weight Calibration
+==================
+
+Fit ADLI and LeTCI weights to expert item scores.
+
+For the items of one scoring method with indicator matrix X (items × 4) and
+expert scores y, the calibrated weights solve the simplex-constrained least
+squares problem
+
+    min_w ‖100 · X w - y‖²   s.t.  Σ w = 1,  w ≥ 0
+
+which are the constraints ADLIScorer/LeTCIScorer._validate_weights enforce
+(w ≤ 1 follows). The problem only depends on the Gram matrix G = XᵀX / n,
+b = Xᵀy / (100 n) and yᵀy / (100² n), scaled so that problems of any size
+are equally well conditioned. With four weights it is solved exactly by
+enumerating the 15 possible supports: each support's equality-constrained
+KKT system is solved in one batched call, and the feasible candidate with
+the smallest residual is the optimum (the problem is convex).
+
+Bootstrap replicates only change the Gram matrices, which are computed for
+all replicates at once as a (replicates × items) resampling-count matrix
+times per-item outer products, and solved in the same batched call.
+
+Items without an expert score or with missing indicators are ignored.
+
+Example:
+    >>> from edcellence.data import load_sample_data
+    >>> table = ItemTable.from_organization_data(load_sample_data())
+    >>> result = calibrate_weights(table, n_bootstrap=200, seed=0)
+    >>> sorted(result.adli.weights)
+    ['w_A', 'w_D', 'w_I', 'w_L']
+    >>> bool(result.adli.rmse < 2.0)
+    True
+"""
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Dict, Optional, Tuple, Type, Union
+import numpy as np
+import pandas as pd
+
+from .adli_scoring import ADLIScorer
+from .item_table import ItemTable
+from .letci_scoring import LeTCIScorer
+from .organizational_scoring import OrganizationalScorer
+
+# Bootstrap replicates whose resampling counts are held in memory at once
+BOOTSTRAP_CHUNK = 64
+
+# Tolerance below which candidate weights are treated as zero
+_FEASIBILITY_TOL = 1e-10
+
+# The 15 non-empty supports of four weights, as a (15, 4) bool matrix
+_SUPPORTS = np.array([s for s in product([False, True], repeat=4) if any(s)])
+
+
+def _simplex_lstsq(gram: np.ndarray, cross: np.ndarray, yy: np.ndarray) -> np.ndarray:
+    """
+    Solve batched simplex-constrained least squares over all supports.
+
+    Args:
+        gram: (B, 4, 4) Gram matrices
+        cross: (B, 4) cross products Xᵀy
+        yy: (B,) squared norms of y
+
+    Returns:
+        (B, 4) optimal weights
+    """
+    n_batch, n_supports = len(gram), len(_SUPPORTS)
+    inside = _SUPPORTS.astype(np.float64)
+
+    # KKT system per (batch, support): [G_SS 1; 1ᵀ 0][w; λ] = [b_S; 1], with
+    # rows and columns outside the support replaced by the identity
+    kkt = np.zeros((n_batch, n_supports, 5, 5))
+    mask = inside[:, :, None] * inside[:, None, :]
+    kkt[:, :, :4, :4] = gram[:, None] * mask + np.eye(4) * (1.0 - inside)[:, None, :]
+    kkt[:, :, :4, 4] = inside
+    kkt[:, :, 4, :4] = inside
+    rhs = np.zeros((n_batch, n_supports, 5))
+    rhs[:, :, :4] = cross[:, None] * inside
+    rhs[:, :, 4] = 1.0
+
+    # pinv handles singular Gram blocks (e.g. constant indicators)
+    solution = (np.linalg.pinv(kkt) @ rhs[..., None])[..., 0]
+    weights = solution[..., :4] * inside
+
+    objective = (np.einsum('bsi,bij,bsj->bs', weights, gram, weights)
+                 - 2 * np.einsum('bsi,bi->bs', weights, cross) + yy[:, None])
+    feasible = ((weights >= -_FEASIBILITY_TOL).all(axis=2)
+                & np.isclose(weights.sum(axis=2), 1.0, atol=1e-6))
+    best = np.argmin(np.where(feasible, objective, np.inf), axis=1)
+
+    weights = np.clip(weights[np.arange(n_batch), best], 0.0, None)
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+@dataclass
+class CalibrationFit:
+    """Calibrated weights and diagnostics of one scoring method.
+
+    Attributes:
+        method: 'ADLI' or 'LeTCI'
+        weights: {weight key: value}, e.g. {'w_A': 0.3, ...}
+        rows: (n,) table rows used for the fit
+        expert: (n,) expert scores
+        fitted: (n,) scores under the calibrated weights
+        bootstrap: (B, 4) bootstrap weight replicates (empty if B = 0)
+    """
+    method: str
+    weights: Dict[str, float]
+    rows: np.ndarray
+    expert: np.ndarray
+    fitted: np.ndarray
+    bootstrap: np.ndarray
+
+    @property
+    def residuals(self) -> np.ndarray:
+        """Expert minus fitted scores."""
+        return self.expert - self.fitted
+
+    @property
+    def rmse(self) -> float:
+        return float(np.sqrt(np.mean(self.residuals ** 2)))
+
+    @property
+    def mae(self) -> float:
+        return float(np.mean(np.abs(self.residuals)))
+
+    @property
+    def bias(self) -> float:
+        """Mean residual; positive if experts score higher than the model."""
+        return float(np.mean(self.residuals))
+
+    @property
+    def r_squared(self) -> float:
+        variance = np.sum((self.expert - self.expert.mean()) ** 2)
+        return float(1.0 - np.sum(self.residuals ** 2) / variance) if variance > 0 else np.nan
+
+    def diagnostics(self) -> Dict[str, float]:
+        """Residual diagnostics: n_items, rmse, mae, max_abs_residual, bias, r_squared."""
+        return {
+            'n_items': len(self.rows),
+            'rmse': self.rmse,
+            'mae': self.mae,
+            'max_abs_residual': float(np.max(np.abs(self.residuals))),
+            'bias': self.bias,
+            'r_squared': self.r_squared
+        }
+
+    def intervals(self, level: float = 0.95) -> pd.DataFrame:
+        """
+        Bootstrap percentile intervals of every weight.
+
+        Args:
+            level: Central coverage of the intervals
+
+        Returns:
+            DataFrame with weight, estimate, std, lower and upper
+
+        Raises:
+            ValueError: If the fit has no bootstrap replicates.
+        """
+        if len(self.bootstrap) == 0:
+            raise ValueError("Fit has no bootstrap replicates")
+        tail = 100 * (1 - level) / 2
+        lower, upper = np.percentile(self.bootstrap, [tail, 100 - tail], axis=0)
+        return pd.DataFrame({
+            'weight': list(self.weights),
+            'estimate': list(self.weights.values()),
+            'std': self.bootstrap.std(axis=0),
+            'lower': lower,
+            'upper': upper
+        })
+
+
+@dataclass
+class CalibrationResult:
+    """Calibrated ADLI and LeTCI fits (None if a method had no usable items)."""
+    adli: Optional[CalibrationFit]
+    letci: Optional[CalibrationFit]
+
+    def summary(self) -> pd.DataFrame:
+        """One row per fitted method with its weights and residual diagnostics."""
+        rows = []
+        for fit in (self.adli, self.letci):
+            if fit is not None:
+                rows.append({'method': fit.method, **fit.weights, **fit.diagnostics()})
+        return pd.DataFrame(rows)
+
+    def residual_frame(self, table: ItemTable) -> pd.DataFrame:
+        """
+        Expert, fitted and residual score of every fitted item.
+
+        Args:
+            table: The table the calibration was run on
+
+        Returns:
+            DataFrame with org_id, category, item, expert, fitted and residual
+        """
+        frames = []
+        for fit in (self.adli, self.letci):
+            if fit is not None:
+                frames.append(pd.DataFrame({
+                    'org_id': table.org_id[fit.rows],
+                    'category': table.category[fit.rows],
+                    'item': table.item[fit.rows],
+                    'expert': fit.expert,
+                    'fitted': fit.fitted,
+                    'residual': fit.residuals
+                }))
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def scorer(
+        self,
+        category_weights: Optional[Dict[int, float]] = None
+    ) -> OrganizationalScorer:
+        """
+        OrganizationalScorer using the calibrated weights.
+
+        Methods without a fit keep their default weights.
+
+        Args:
+            category_weights: Optional category weights
+
+        Returns:
+            OrganizationalScorer
+        """
+        return OrganizationalScorer(
+            category_weights=category_weights,
+            adli_weights=self.adli.weights if self.adli is not None else None,
+            letci_weights=self.letci.weights if self.letci is not None else None
+        )
+
+
+def _bootstrap_systems(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_bootstrap: int,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Scaled Gram matrices, cross products and norms of every bootstrap replicate."""
+    n = len(y)
+    outer = (x[:, :, None] * x[:, None, :]).reshape(n, 16)
+    xy = x * y[:, None]
+    grams, crosses, norms = [], [], []
+    for start in range(0, n_bootstrap, BOOTSTRAP_CHUNK):
+        size = min(BOOTSTRAP_CHUNK, n_bootstrap - start)
+        # Resampling counts of every replicate from one flat bincount
+        draws = rng.integers(0, n, size=(size, n)) + n * np.arange(size)[:, None]
+        counts = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n) / n
+        grams.append((counts @ outer).reshape(size, 4, 4))
+        crosses.append(counts @ xy)
+        norms.append(counts @ y ** 2)
+    return np.concatenate(grams), np.concatenate(crosses), np.concatenate(norms)
+
+
+def _fit_method(
+    table: ItemTable,
+    rows: np.ndarray,
+    scorer_class: Type[Union[ADLIScorer, LeTCIScorer]],
+    n_bootstrap: int,
+    rng: np.random.Generator
+) -> Optional[CalibrationFit]:
+    """Calibrate one scoring method on the given table rows."""
+    x = table.indicators[rows]
+    y = table.score[rows]
+    usable = np.isfinite(y) & np.isfinite(x).all(axis=1)
+    rows, x, y = rows[usable], x[usable], y[usable]
+    if len(rows) == 0:
+        return None
+    if ((x < 0) | (x > 1)).any():
+        raise ValueError(f"{scorer_class.SCORING_METHOD} indicators must be in [0, 1]")
+
+    n = len(rows)
+    target = y / 100
+    weights = _simplex_lstsq(
+        (x.T @ x / n)[None], (x.T @ target / n)[None], np.array([target @ target / n])
+    )[0]
+    bootstrap = (
+        _simplex_lstsq(*_bootstrap_systems(x, target, n_bootstrap, rng))
+        if n_bootstrap > 0 else np.empty((0, 4))
+    )
+    return CalibrationFit(
+        method=scorer_class.SCORING_METHOD,
+        weights=dict(zip(scorer_class.WEIGHT_KEYS, weights.tolist())),
+        rows=rows,
+        expert=y,
+        fitted=100 * x @ weights,
+        bootstrap=bootstrap
+    )
+
+
+def calibrate_weights(
+    table: ItemTable,
+    n_bootstrap: int = 1000,
+    seed: Optional[int] = None
+) -> CalibrationResult:
+    """
+    Fit ADLI and LeTCI weights to the expert scores in ``table.score``.
+
+    Args:
+        table: Items with indicators and expert scores, e.g. from
+               ItemTable.from_organization_data on assessment JSON
+        n_bootstrap: Bootstrap replicates for weight intervals (0 to skip)
+        seed: Optional RNG seed for the bootstrap
+
+    Returns:
+        CalibrationResult
+
+    Raises:
+        ValueError: If n_bootstrap is negative or indicators are out of range.
+    """
+    if n_bootstrap < 0:
+        raise ValueError(f"n_bootstrap must be non-negative, got {n_bootstrap}")
+    rng = np.random.default_rng(seed)
+    return CalibrationResult(
+        adli=_fit_method(table, np.flatnonzero(table.process_mask), ADLIScorer,
+                         n_bootstrap, rng),
+        letci=_fit_method(table, np.flatnonzero(table.results_mask), LeTCIScorer,
+                          n_bootstrap, rng)
+    )
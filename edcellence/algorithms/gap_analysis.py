@@ -0,0 +1,358 @@
+"""
+Gap Analysis
+============
+
+Vectorized gap analysis and improvement prioritization.
+
+For every item the gap to target, its priority and its status are computed
+from aligned arrays:
+
+    gap[c,i]      = max(0, target[c,i] - current[c,i])
+    priority[c,i] = gap[c,i] × criticality[c,i] × risk[c,i]
+    status        = 'Critical' if gap > 20, 'Monitor' if gap > 10, else 'On Track'
+
+As with Python's max(0, nan), an unscored (NaN) current score has a gap of 0
+and is 'On Track'. NaN priorities rank below every other priority.
+
+Rows are returned in descending priority. With ``top_k`` only the highest
+priorities are selected (via ``np.partition``) and sorted, so large
+portfolios never need a full sort. StreamingGapAnalyzer processes chunks of
+items with bounded memory, keeping only the top-K rows and running totals.
+
+Example:
+    >>> frame = gap_frame(
+    ...     category=np.array([1, 1, 2]), item=np.array([1, 2, 1]),
+    ...     current=np.array([70.0, 75.0, 60.0]), target=np.array([85.0, 85.0, 80.0])
+    ... )
+    >>> frame['gap'].tolist()
+    [20.0, 15.0, 10.0]
+    >>> frame['status'].tolist()
+    ['Monitor', 'Monitor', 'On Track']
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+
+# Gap thresholds separating 'On Track' | 'Monitor' | 'Critical'
+GAP_STATUS_THRESHOLDS = (10.0, 20.0)
+GAP_STATUS_LABELS = ('On Track', 'Monitor', 'Critical')
+
+# Default criticality/risk for items without an explicit value
+DEFAULT_CRITICALITY = 0.5
+DEFAULT_RISK = 0.5
+
+GAP_COLUMNS = [
+    'category', 'item', 'current_score', 'target_score', 'gap',
+    'criticality', 'risk', 'priority', 'status'
+]
+
+
+def classify_gap_status(gap: np.ndarray) -> np.ndarray:
+    """
+    Classify gaps into status labels using the 10/20 thresholds.
+
+    Args:
+        gap: Array of non-negative gaps; NaN gaps are 'On Track'
+
+    Returns:
+        Array of status labels ('On Track', 'Monitor' or 'Critical')
+    """
+    gap = np.asarray(gap, dtype=np.float64)
+    codes = np.digitize(gap, GAP_STATUS_THRESHOLDS, right=True)
+    codes[np.isnan(gap)] = 0
+    return np.asarray(GAP_STATUS_LABELS, dtype=object)[codes]
+
+
+def top_k_indices(priority: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of the highest priorities in descending order.
+
+    Ties are broken by row order, also at the top-K boundary, so results are
+    deterministic. NaN priorities rank last.
+
+    Args:
+        priority: (N,) priorities
+        top_k: Number of rows to keep; None keeps all rows
+
+    Returns:
+        Row indices sorted by descending priority
+    """
+    priority = np.asarray(priority, dtype=np.float64)
+    priority = np.where(np.isnan(priority), -np.inf, priority)
+    n = len(priority)
+    if top_k is None or top_k >= n:
+        return np.argsort(-priority, kind='stable')
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    kth = np.partition(priority, n - top_k)[n - top_k]
+    above = np.flatnonzero(priority > kth)
+    tied = np.flatnonzero(priority == kth)[:top_k - len(above)]
+    selected = np.concatenate([above, tied])
+    return selected[np.argsort(-priority[selected], kind='stable')]
+
+
+def gap_frame(
+    category: np.ndarray,
+    item: np.ndarray,
+    current: np.ndarray,
+    target: Optional[np.ndarray] = None,
+    criticality: Optional[np.ndarray] = None,
+    risk: Optional[np.ndarray] = None,
+    top_k: Optional[int] = None,
+    org_id: Optional[np.ndarray] = None
+) -> pd.DataFrame:
+    """
+    Build the gap analysis DataFrame from aligned item arrays.
+
+    Args:
+        category: (N,) category ids
+        item: (N,) item ids
+        current: (N,) current scores
+        target: Optional (N,) targets; missing (NaN) targets default to 100
+        criticality: Optional (N,) criticality weights [0,1]; default 0.5
+        risk: Optional (N,) risk factors [0,1]; default 0.5
+        top_k: Keep only the K highest priorities
+        org_id: Optional (N,) organization ids, added as a leading column
+
+    Returns:
+        DataFrame with GAP_COLUMNS, sorted by descending priority
+    """
+    current = np.asarray(current, dtype=np.float64)
+    n = len(current)
+
+    target = np.full(n, 100.0) if target is None else np.asarray(target, dtype=np.float64)
+    target = np.where(np.isnan(target), 100.0, target)
+    criticality = (np.full(n, DEFAULT_CRITICALITY) if criticality is None
+                   else np.asarray(criticality, dtype=np.float64))
+    risk = np.full(n, DEFAULT_RISK) if risk is None else np.asarray(risk, dtype=np.float64)
+
+    gap = np.fmax(0.0, target - current)
+    priority = gap * criticality * risk
+    order = top_k_indices(priority, top_k)
+
+    columns = {}
+    if org_id is not None:
+        columns['org_id'] = np.asarray(org_id)[order]
+    columns.update({
+        'category': np.asarray(category)[order],
+        'item': np.asarray(item)[order],
+        'current_score': current[order],
+        'target_score': target[order],
+        'gap': gap[order],
+        'criticality': criticality[order],
+        'risk': risk[order],
+        'priority': priority[order],
+        'status': classify_gap_status(gap[order])
+    })
+    return pd.DataFrame(columns)
+
+
+def lookup_pairs(
+    values: Optional[Union[dict, np.ndarray]],
+    category: np.ndarray,
+    item: np.ndarray,
+    default: float
+) -> Optional[np.ndarray]:
+    """
+    Align optional per-item values with item arrays.
+
+    Args:
+        values: None, an aligned array, or a {(category, item): value} dict
+        category: (N,) category ids
+        item: (N,) item ids
+        default: Value for items missing from the dict
+
+    Returns:
+        Aligned (N,) array, or None if ``values`` is None/empty
+    """
+    if values is None or (isinstance(values, dict) and not values):
+        return None
+    if not isinstance(values, dict):
+        return np.asarray(values, dtype=np.float64)
+    return np.array(
+        [values.get(key, default) for key in zip(category.tolist(), item.tolist())],
+        dtype=np.float64
+    )
+
+
+@dataclass
+class StreamingGapResult:
+    """Result of a streaming gap analysis.
+
+    Attributes:
+        top: Top-K rows, same columns and order as compute_gap_analysis
+        summary: Running totals over all items (counts, status counts,
+                 per-category gap totals)
+    """
+    top: pd.DataFrame
+    summary: Dict
+
+
+class StreamingGapAnalyzer:
+    """
+    Bounded-memory gap analysis over a stream of item chunks.
+
+    Only the current top-K rows, per-status counts and per-category gap
+    totals are retained, so memory stays O(K + categories) regardless of how
+    many items are streamed. Ties are broken by arrival order, so the top-K
+    equals the head of the full in-memory gap analysis.
+
+    Example:
+        >>> analyzer = StreamingGapAnalyzer(top_k=2)
+        >>> analyzer.update([1, 1], [1, 2], [70.0, 75.0], [85.0, 85.0])
+        >>> analyzer.update([2, 2], [1, 2], [60.0, 65.0], [80.0, 80.0])
+        >>> result = analyzer.result()
+        >>> result.top[['category', 'item']].values.tolist()
+        [[2, 1], [1, 1]]
+        >>> result.summary['status_counts']
+        {'On Track': 1, 'Monitor': 3, 'Critical': 0}
+    """
+
+    _ARRAYS = ('category', 'item', 'current', 'target', 'criticality', 'risk', 'priority')
+
+    def __init__(self, top_k: int = 100):
+        """
+        Initialize analyzer.
+
+        Args:
+            top_k: Number of highest-priority rows to retain
+        """
+        if top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {top_k}")
+
+        self.top_k = top_k
+        self.n_items = 0
+        self._top = {name: np.empty(0) for name in self._ARRAYS}
+        self._status_counts = np.zeros(len(GAP_STATUS_LABELS), dtype=np.int64)
+        self._category_gap = np.zeros(0)
+        self._category_count = np.zeros(0, dtype=np.int64)
+
+    def update(
+        self,
+        category: np.ndarray,
+        item: np.ndarray,
+        current: np.ndarray,
+        target: Optional[np.ndarray] = None,
+        criticality: Optional[np.ndarray] = None,
+        risk: Optional[np.ndarray] = None
+    ):
+        """
+        Consume one chunk of aligned item arrays.
+
+        Args:
+            category: (M,) category ids
+            item: (M,) item ids
+            current: (M,) current scores
+            target: Optional (M,) targets; missing (NaN) targets default to 100
+            criticality: Optional (M,) criticality weights; default 0.5
+            risk: Optional (M,) risk factors; default 0.5
+        """
+        category = np.asarray(category, dtype=np.int64)
+        current = np.asarray(current, dtype=np.float64)
+        m = len(current)
+        if m == 0:
+            return
+
+        target = np.full(m, 100.0) if target is None else np.asarray(target, dtype=np.float64)
+        target = np.where(np.isnan(target), 100.0, target)
+        criticality = (np.full(m, DEFAULT_CRITICALITY) if criticality is None
+                       else np.asarray(criticality, dtype=np.float64))
+        risk = np.full(m, DEFAULT_RISK) if risk is None else np.asarray(risk, dtype=np.float64)
+
+        gap = np.fmax(0.0, target - current)
+        priority = gap * criticality * risk
+
+        # Running summaries
+        self.n_items += m
+        codes = np.digitize(gap, GAP_STATUS_THRESHOLDS, right=True)
+        self._status_counts += np.bincount(codes, minlength=len(GAP_STATUS_LABELS))
+        size = max(len(self._category_gap), int(category.max()) + 1)
+        self._category_gap = np.pad(self._category_gap, (0, size - len(self._category_gap)))
+        self._category_count = np.pad(self._category_count, (0, size - len(self._category_count)))
+        self._category_gap += np.bincount(category, weights=gap, minlength=size)
+        self._category_count += np.bincount(category, minlength=size)
+
+        # Merge this chunk's candidates into the retained top-K. Retained rows
+        # come first, so position order equals arrival order among ties.
+        chunk = dict(zip(self._ARRAYS, (
+            category, np.asarray(item), current, target, criticality, risk, priority
+        )))
+        candidates = top_k_indices(priority, self.top_k)
+        merged = {
+            name: np.concatenate([self._top[name], chunk[name][candidates]])
+            for name in self._ARRAYS
+        }
+        keep = top_k_indices(merged['priority'], self.top_k)
+        self._top = {name: values[keep] for name, values in merged.items()}
+
+    def update_frame(self, frame: pd.DataFrame):
+        """
+        Consume one chunk given as a DataFrame.
+
+        Args:
+            frame: Columns 'category', 'item', 'current_score' and optionally
+                   'target_score', 'criticality', 'risk'
+        """
+        optional = {
+            name: frame[column].to_numpy() if column in frame.columns else None
+            for name, column in (('target', 'target_score'),
+                                 ('criticality', 'criticality'), ('risk', 'risk'))
+        }
+        self.update(frame['category'].to_numpy(), frame['item'].to_numpy(),
+                    frame['current_score'].to_numpy(), **optional)
+
+    def result(self) -> StreamingGapResult:
+        """
+        Return the current top-K rows and running summary.
+
+        Returns:
+            StreamingGapResult
+        """
+        top = self._top
+        if len(top['priority']) == 0:
+            frame = pd.DataFrame(columns=GAP_COLUMNS)
+        else:
+            frame = gap_frame(
+                top['category'].astype(np.int64), top['item'].astype(np.int64),
+                top['current'], top['target'], top['criticality'], top['risk']
+            )
+
+        present = np.flatnonzero(self._category_count)
+        summary = {
+            'n_items': self.n_items,
+            'n_beyond_top_k': self.n_items - len(frame),
+            'status_counts': dict(zip(GAP_STATUS_LABELS, self._status_counts.tolist())),
+            'category_gap_totals': dict(zip(present.tolist(),
+                                            self._category_gap[present].tolist())),
+            'category_item_counts': dict(zip(present.tolist(),
+                                             self._category_count[present].tolist())),
+        }
+        return StreamingGapResult(top=frame, summary=summary)
+
+
+def stream_gap_analysis(
+    chunks: Iterable[Union[Tuple, pd.DataFrame]],
+    top_k: int = 100
+) -> StreamingGapResult:
+    """
+    Run a bounded-memory gap analysis over an iterator of chunks.
+
+    Args:
+        chunks: Iterable of (category, item, current, target, criticality, risk)
+                array tuples (trailing entries may be omitted or None), or of
+                DataFrames accepted by StreamingGapAnalyzer.update_frame
+        top_k: Number of highest-priority rows to retain
+
+    Returns:
+        StreamingGapResult with the top-K rows and a summary of all items
+    """
+    analyzer = StreamingGapAnalyzer(top_k=top_k)
+    for chunk in chunks:
+        if isinstance(chunk, pd.DataFrame):
+            analyzer.update_frame(chunk)
+        else:
+            analyzer.update(*chunk)
+    return analyzer.result()
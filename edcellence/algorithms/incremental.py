@@ -0,0 +1,331 @@
+"""
+Incremental Scorecards
+======================
+
+Dirty-propagation evaluation layer around OrganizationalScorer for
+interactive editing of a single organization's assessment.
+
+Results are nodes of a fixed dependency graph:
+
+    indicator → item score → category score → organizational score
+                                            → integration edges → IHI
+              item score → gap table row
+
+An edit marks only its item dirty. Reading any result first flushes the dirty
+nodes along their paths: each dirty item is rescored, only categories whose
+item scores actually changed are re-aggregated, and only integration edges
+touching a changed category are re-evaluated. Unchanged values stop the
+propagation early. The gap table keeps aligned per-item arrays that are
+patched in place and only rebuilt as a DataFrame when requested.
+
+Example:
+    >>> from edcellence.data import load_sample_data
+    >>> card = IncrementalScorecard(load_sample_data())
+    >>> before = card.organizational_score().score
+    >>> card.set_indicator(1, 1, 'P_D', 0.95)
+    >>> card.organizational_score().score > before
+    True
+"""
+
+from typing import Dict, List, Optional, Set, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from .adli_scoring import ADLIScorer
+from .gap_analysis import DEFAULT_CRITICALITY, DEFAULT_RISK, GAP_COLUMNS, gap_frame, lookup_pairs
+from .item_table import LAST_PROCESS_CATEGORY
+from .letci_scoring import LeTCIScorer
+from .organizational_scoring import CATEGORY_NAMES, OrganizationalScorer, ScoreResult
+
+ItemKey = Tuple[int, int]
+
+
+class IncrementalScorecard:
+    """
+    Incrementally maintained scorecard for one organization.
+
+    Attributes:
+        scorer: OrganizationalScorer used for every node
+        recompute_counts: Number of item, category and edge evaluations
+                          performed so far (useful to check the cost of edits)
+    """
+
+    def __init__(
+        self,
+        data: Dict,
+        scorer: Optional[OrganizationalScorer] = None,
+        category_targets: Optional[Dict] = None,
+        criticality: Optional[Dict[ItemKey, float]] = None,
+        risk: Optional[Dict[ItemKey, float]] = None
+    ):
+        """
+        Build the dependency graph and evaluate every node once.
+
+        Args:
+            data: Organization data with a 'categories' mapping, in the schema
+                  accepted by ItemTable.from_organization_data. Items without
+                  'indicators' keep their given 'score' until indicators are set.
+            scorer: Optional scorer; defaults to OrganizationalScorer()
+            category_targets: Optional {category: target} for items without
+                              their own 'target' (e.g. data['targets_2025'])
+            criticality: Optional {(category, item): criticality} for gap priorities
+            risk: Optional {(category, item): risk} for gap priorities
+        """
+        self.scorer = scorer or OrganizationalScorer()
+        self.recompute_counts = {'items': 0, 'categories': 0, 'edges': 0}
+
+        self._indicators: Dict[ItemKey, Optional[Dict[str, float]]] = {}
+        self._item_scores: Dict[ItemKey, float] = {}
+        self._category_items: Dict[int, List[int]] = {}
+        self._row: Dict[ItemKey, int] = {}
+        targets = []
+
+        category_targets = category_targets or {}
+        for cat_key, cat_data in data['categories'].items():
+            category = int(cat_key)
+            if not 1 <= category <= 7:
+                raise ValueError(f"Category must be 1-7, got {category}")
+            cat_target = category_targets.get(
+                category, category_targets.get(str(category), np.nan)
+            )
+
+            for item_key, item_data in cat_data['items'].items():
+                if not isinstance(item_data, dict):
+                    item_data = {'score': item_data}
+                key = (category, int(item_key))
+
+                self._row[key] = len(self._row)
+                self._category_items.setdefault(category, []).append(key[1])
+                indicators = item_data.get('indicators')
+                self._indicators[key] = dict(indicators) if indicators else None
+                self._item_scores[key] = float(item_data.get('score', np.nan))
+                targets.append(item_data.get('target', cat_target))
+
+        # Aligned gap arrays, patched in place as item scores change
+        keys = list(self._row)
+        self._gap_category = np.array([c for c, _ in keys], dtype=np.int64)
+        self._gap_item = np.array([i for _, i in keys], dtype=np.int64)
+        self._gap_current = np.array([self._item_scores[k] for k in keys], dtype=np.float64)
+        self._gap_target = np.array(targets, dtype=np.float64)
+        self._gap_criticality = lookup_pairs(
+            criticality, self._gap_category, self._gap_item, DEFAULT_CRITICALITY)
+        self._gap_risk = lookup_pairs(risk, self._gap_category, self._gap_item, DEFAULT_RISK)
+        self._gap_cache: Optional[pd.DataFrame] = None
+
+        # Integration edges incident to each category
+        self._edges = [
+            edge for edge in self.scorer.INTEGRATION_EDGES
+            if edge[0] in self._category_items and edge[1] in self._category_items
+        ]
+        self._category_edges: Dict[int, List[int]] = {}
+        for e, (source, target) in enumerate(self._edges):
+            self._category_edges.setdefault(source, []).append(e)
+            self._category_edges.setdefault(target, []).append(e)
+        self._edge_coherence = [0.0] * len(self._edges)
+
+        # NaN never equals a computed score, so every category starts as changed
+        self._category_scores: Dict[int, float] = dict.fromkeys(self._category_items, np.nan)
+
+        # Everything starts dirty; evaluate the full graph once
+        self._dirty_items: Set[ItemKey] = {
+            key for key, indicators in self._indicators.items() if indicators is not None
+        }
+        self._dirty_categories: Set[int] = set(self._category_items)
+        self._update_categories()
+        self._org_result: ScoreResult
+        self._ihi: float
+        self._update_results(set(self._category_items))
+
+    # ------------------------------------------------------------------ edits
+
+    def set_indicator(self, category: int, item: int, key: str, value: float):
+        """
+        Change one indicator of an item.
+
+        Args:
+            category: Category number (1-7)
+            item: Item identifier
+            key: Indicator key ('P_*' for categories 1-6, 'R_*' for category 7)
+            value: New normalized value [0,1]
+
+        Raises:
+            ValueError: If the item or key is unknown, the value is out of
+                        range, or the item has no complete indicator set.
+        """
+        self.update_indicators(category, item, {key: value})
+
+    def update_indicators(self, category: int, item: int, indicators: Dict[str, float]):
+        """
+        Change several indicators of an item at once.
+
+        The edit is validated before any state changes, so a rejected edit
+        leaves the scorecard untouched.
+
+        Args:
+            category: Category number (1-7)
+            item: Item identifier
+            indicators: {key: value} of indicators to change
+
+        Raises:
+            ValueError: As for set_indicator.
+        """
+        item_key = self._item_key(category, item)
+        scorer = self._item_scorer(category)
+        unknown = indicators.keys() - set(scorer.INDICATOR_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown indicators for category {category}: {unknown}")
+
+        merged = dict(self._indicators[item_key] or {})
+        merged.update(indicators)
+        scorer.validate_indicators(merged)
+
+        self._indicators[item_key] = merged
+        self._dirty_items.add(item_key)
+
+    def set_target(self, category: int, item: int, target: float):
+        """
+        Change the target score of an item (affects only the gap table).
+
+        Args:
+            category: Category number (1-7)
+            item: Item identifier
+            target: New target score
+        """
+        row = self._row[self._item_key(category, item)]
+        self._gap_target[row] = target
+        self._gap_cache = None
+
+    # ---------------------------------------------------------------- results
+
+    def item_score(self, category: int, item: int) -> float:
+        """Current score of one item."""
+        self._flush()
+        return self._item_scores[self._item_key(category, item)]
+
+    def category_score(self, category: int) -> float:
+        """Current score of one category."""
+        self._flush()
+        if category not in self._category_scores:
+            raise ValueError(f"Unknown category {category}")
+        return self._category_scores[category]
+
+    def category_scores(self) -> Dict[int, float]:
+        """Current {category: score} for every category."""
+        self._flush()
+        return dict(self._category_scores)
+
+    def organizational_score(self) -> ScoreResult:
+        """Current organizational ScoreResult."""
+        self._flush()
+        return self._org_result
+
+    def integration_health_index(self) -> float:
+        """Current Integration Health Index."""
+        self._flush()
+        return self._ihi
+
+    def gap_analysis(self, top_k: Optional[int] = None) -> pd.DataFrame:
+        """
+        Current gap analysis, sorted by descending priority.
+
+        Args:
+            top_k: Optional number of highest-priority rows to return
+
+        Returns:
+            DataFrame in the format of OrganizationalScorer.compute_gap_analysis
+        """
+        self._flush()
+        if not self._row:
+            return pd.DataFrame(columns=GAP_COLUMNS)
+        if self._gap_cache is None:
+            self._gap_cache = gap_frame(
+                self._gap_category, self._gap_item, self._gap_current, self._gap_target,
+                criticality=self._gap_criticality, risk=self._gap_risk
+            )
+        frame = self._gap_cache if top_k is None else self._gap_cache.head(top_k)
+        return frame.copy()
+
+    def scorecard(self) -> Dict:
+        """
+        Current scorecard in the format of OrganizationalScorer.generate_scorecard.
+
+        Returns:
+            Scorecard dictionary
+        """
+        self._flush()
+        return {
+            'organizational_score': self._org_result.score,
+            'confidence': self._org_result.confidence,
+            'category_scores': dict(self._category_scores),
+            'category_names': CATEGORY_NAMES.copy(),
+            'integration_health_index': round(self._ihi, 3),
+            'ihi_interpretation': self.scorer.interpret_ihi(self._ihi),
+            'maturity_level': self.scorer.maturity_level(self._org_result.score)
+        }
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if edits are pending evaluation."""
+        return bool(self._dirty_items or self._dirty_categories)
+
+    # --------------------------------------------------------------- internals
+
+    def _item_key(self, category: int, item: int) -> ItemKey:
+        key = (category, item)
+        if key not in self._row:
+            raise ValueError(f"Unknown item {item} in category {category}")
+        return key
+
+    def _item_scorer(self, category: int) -> Union[ADLIScorer, LeTCIScorer]:
+        if category <= LAST_PROCESS_CATEGORY:
+            return self.scorer.adli_scorer
+        return self.scorer.letci_scorer
+
+    def _flush(self):
+        """Re-evaluate dirty nodes, stopping where values do not change."""
+        if not self.is_dirty:
+            return
+        changed = self._update_categories()
+        if changed:
+            self._update_results(changed)
+
+    def _update_categories(self) -> Set[int]:
+        """Rescore dirty items and re-aggregate their categories; return those that changed."""
+        for key in self._dirty_items:
+            indicators = self._indicators[key]
+            assert indicators is not None, "only items with indicators are marked dirty"
+            score = self._item_scorer(key[0]).compute_score(indicators)
+            self.recompute_counts['items'] += 1
+            if score != self._item_scores[key]:
+                self._item_scores[key] = score
+                self._gap_current[self._row[key]] = score
+                self._gap_cache = None
+                self._dirty_categories.add(key[0])
+        self._dirty_items.clear()
+
+        changed = set()
+        for category in self._dirty_categories:
+            # Equal-weight item average, the same aggregation for every category
+            score = self.scorer.adli_scorer.compute_category_score({
+                item: self._item_scores[(category, item)]
+                for item in self._category_items[category]
+            })
+            self.recompute_counts['categories'] += 1
+            if score != self._category_scores[category]:
+                self._category_scores[category] = score
+                changed.add(category)
+        self._dirty_categories.clear()
+        return changed
+
+    def _update_results(self, changed: Set[int]):
+        """Recompute the organizational score and the edges touching changed categories."""
+        self._org_result = self.scorer.compute_organizational_score(self._category_scores)
+
+        dirty_edges = {e for category in changed for e in self._category_edges.get(category, [])}
+        for e in sorted(dirty_edges):
+            source, target = self._edges[e]
+            self._edge_coherence[e] = 1.0 - abs(
+                self._category_scores[source] - self._category_scores[target]
+            ) / 100.0
+            self.recompute_counts['edges'] += 1
+        self._ihi = float(np.mean(self._edge_coherence)) if self._edges else 0.0
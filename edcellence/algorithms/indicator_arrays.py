@@ -0,0 +1,97 @@
+"""
+Indicator Array Utilities
+=========================
+
+Helpers shared by the ADLI and LeTCI scorers for working with indicator
+matrices, i.e. (N, 4) float arrays whose columns follow the scorer's
+indicator order ('P_A', 'P_D', 'P_L', 'P_I' or 'R_Lv', 'R_Tr', 'R_Cp', 'R_I').
+
+Batch entry points validate the whole matrix at once and report every
+offending row, rather than stopping at the first bad value like the
+single-item dictionary API does.
+"""
+
+from typing import Sequence, Union
+import numpy as np
+import pandas as pd
+
+# Indicator column order for process (ADLI) and results (LeTCI) items
+ADLI_INDICATOR_KEYS = ('P_A', 'P_D', 'P_L', 'P_I')
+LETCI_INDICATOR_KEYS = ('R_Lv', 'R_Tr', 'R_Cp', 'R_I')
+
+
+class IndicatorRangeError(ValueError):
+    """Raised when one or more indicator rows fall outside [0, 1].
+
+    Attributes:
+        rows: Indices of every offending row (sorted, unique)
+        columns: Indicator keys with at least one offending value
+    """
+
+    #: Maximum number of row indices spelled out in the error message
+    MAX_REPORTED_ROWS = 10
+
+    def __init__(self, rows: np.ndarray, columns: Sequence[str]):
+        self.rows = rows
+        self.columns = list(columns)
+
+        shown = ', '.join(str(r) for r in rows[:self.MAX_REPORTED_ROWS])
+        if len(rows) > self.MAX_REPORTED_ROWS:
+            shown += f", ... ({len(rows) - self.MAX_REPORTED_ROWS} more)"
+        super().__init__(
+            f"Indicators {self.columns} out of range [0,1] in {len(rows)} row(s): [{shown}]"
+        )
+
+
+def as_indicator_matrix(
+    indicators: Union[np.ndarray, pd.DataFrame],
+    keys: Sequence[str]
+) -> np.ndarray:
+    """
+    Coerce batch indicator input to a contiguous (N, len(keys)) float array.
+
+    Args:
+        indicators: (N, 4) array whose columns follow ``keys``, or a DataFrame
+                    containing a column for every key (extra columns are ignored).
+        keys: Indicator keys in column order.
+
+    Returns:
+        Contiguous float64 array of shape (N, len(keys)).
+
+    Raises:
+        ValueError: If DataFrame columns are missing or the array has the wrong shape.
+    """
+    if isinstance(indicators, pd.DataFrame):
+        missing = set(keys) - set(indicators.columns)
+        if missing:
+            raise ValueError(f"Missing indicators: {missing}")
+        matrix = indicators[list(keys)].to_numpy(dtype=np.float64)
+    else:
+        matrix = np.asarray(indicators, dtype=np.float64)
+
+    if matrix.ndim != 2 or matrix.shape[1] != len(keys):
+        raise ValueError(
+            f"Indicator matrix must have shape (N, {len(keys)}), got {matrix.shape}"
+        )
+
+    return np.ascontiguousarray(matrix)
+
+
+def validate_indicator_matrix(matrix: np.ndarray, keys: Sequence[str]) -> None:
+    """
+    Check that every indicator lies in [0, 1].
+
+    NaN values are treated as out of range, matching the scalar scorers.
+
+    Args:
+        matrix: (N, len(keys)) indicator array
+        keys: Indicator keys in column order
+
+    Raises:
+        IndicatorRangeError: Listing every offending row.
+    """
+    invalid = ~((matrix >= 0.0) & (matrix <= 1.0))
+    if invalid.any():
+        rows = np.flatnonzero(invalid.any(axis=1))
+        columns = [key for key, bad in zip(keys, invalid.any(axis=0)) if bad]
+        raise IndicatorRangeError(rows, columns)
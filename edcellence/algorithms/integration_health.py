@@ -0,0 +1,208 @@
+"""
+Integration Health Index
+========================
+
+Sparse-incidence computation of the Integration Health Index (IHI) for
+configurable, weighted dependency graphs over many organizations.
+
+An IntegrationGraph compiles its edge list once into an (edges × nodes)
+incidence matrix B with +1 at each edge's source and -1 at its target, so the
+score differences along every edge of every organization come from a single
+sparse product:
+
+    D = S · Bᵀ                                  (orgs × edges)
+    coherence[o,e] = 1 - |D[o,e]| / 100
+    IHI[o] = Σ_e w_e · coherence[o,e] / Σ_e w_e     (over edges present for o)
+
+Missing node scores are NaN. Because the sparse product only touches stored
+entries, an edge is NaN exactly when one of its endpoints is missing, and such
+edges are skipped, matching OrganizationalScorer.compute_integration_health_index.
+Organizations without any present edge get an IHI of 0.0.
+
+Example:
+    >>> graph = IntegrationGraph.from_categories()
+    >>> scores = np.array([
+    ...     [75, 65, 82, 70, 75, 70, 78],
+    ...     [80, 80, 80, 80, 80, 80, 80]
+    ... ], dtype=float)
+    >>> graph.health(scores).round(3)
+    array([0.937, 1.   ])
+"""
+
+from typing import Hashable, Optional, Sequence, Tuple
+import numpy as np
+from scipy import sparse
+
+# Default BEB-EdPEx category dependencies (source → target)
+DEFAULT_INTEGRATION_EDGES = (
+    (1, 2),  # Leadership → Strategy
+    (2, 5),  # Strategy → Workforce
+    (2, 6),  # Strategy → Operations
+    (5, 4),  # Workforce → Measurement
+    (6, 4),  # Operations → Measurement
+    (4, 7)   # Measurement → Results
+)
+
+# Categories 1-7, in score matrix column order
+DEFAULT_CATEGORY_NODES = tuple(range(1, 8))
+
+
+class IntegrationGraph:
+    """
+    Weighted dependency graph compiled to a sparse incidence matrix.
+
+    Attributes:
+        nodes: Node labels in score matrix column order
+        edges: (source, target) node label pairs
+        edge_weights: Read-only (edges,) non-negative weights
+        incidence: (edges × nodes) CSR incidence matrix
+    """
+
+    def __init__(
+        self,
+        edges: Sequence[Tuple[Hashable, Hashable]],
+        nodes: Optional[Sequence[Hashable]] = None,
+        edge_weights: Optional[Sequence[float]] = None,
+        scale: float = 100.0
+    ):
+        """
+        Compile a dependency graph.
+
+        Args:
+            edges: (source, target) pairs of node labels
+            nodes: Node labels in score matrix column order; defaults to the
+                   sorted edge endpoints
+            edge_weights: Optional non-negative weight per edge; equal if None
+            scale: Score range used to normalize differences (100 for 0-100 scores)
+
+        Raises:
+            ValueError: If an edge references an unknown node, or the edge
+                        weights have the wrong length or are negative.
+        """
+        self.edges = tuple((source, target) for source, target in edges)
+        if nodes is None:
+            nodes = sorted({node for edge in self.edges for node in edge})
+        self.nodes = tuple(nodes)
+        self.scale = float(scale)
+
+        index = {node: i for i, node in enumerate(self.nodes)}
+        unknown = {node for edge in self.edges for node in edge} - index.keys()
+        if unknown:
+            raise ValueError(f"Edges reference unknown nodes: {sorted(unknown, key=str)}")
+
+        n_edges = len(self.edges)
+        if edge_weights is None:
+            weights = np.ones(n_edges)
+        else:
+            weights = np.array(edge_weights, dtype=np.float64)
+            if weights.shape != (n_edges,):
+                raise ValueError(f"Expected {n_edges} edge weights, got {weights.shape}")
+            if (weights < 0).any():
+                raise ValueError("Edge weights must be non-negative")
+        weights.flags.writeable = False
+        self.edge_weights = weights
+
+        rows = np.repeat(np.arange(n_edges), 2)
+        columns = [index[node] for edge in self.edges for node in edge]
+        signs = np.tile([1.0, -1.0], n_edges)
+        self.incidence = sparse.csr_matrix(
+            (signs, (rows, columns)), shape=(n_edges, len(self.nodes))
+        )
+
+    @classmethod
+    def from_categories(
+        cls,
+        edges: Sequence[Tuple[int, int]] = DEFAULT_INTEGRATION_EDGES,
+        edge_weights: Optional[Sequence[float]] = None
+    ) -> 'IntegrationGraph':
+        """
+        Graph over the seven categories, columns ordered 1-7.
+
+        Args:
+            edges: Category dependencies; defaults to DEFAULT_INTEGRATION_EDGES
+            edge_weights: Optional weight per edge
+
+        Returns:
+            IntegrationGraph whose score matrix column c - 1 holds category c
+        """
+        return cls(edges, nodes=DEFAULT_CATEGORY_NODES, edge_weights=edge_weights)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.edges)
+
+    def _as_score_matrix(self, scores: np.ndarray) -> np.ndarray:
+        """Coerce (nodes,) or (orgs × nodes) scores to a 2-D float matrix."""
+        matrix = np.atleast_2d(np.asarray(scores, dtype=np.float64))
+        if matrix.ndim != 2 or matrix.shape[1] != self.n_nodes:
+            raise ValueError(
+                f"Score matrix must have shape (orgs, {self.n_nodes}), got {matrix.shape}"
+            )
+        return matrix
+
+    def edge_coherence(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Coherence of every edge for every organization.
+
+        Args:
+            scores: (orgs × nodes) scores, NaN for missing nodes
+
+        Returns:
+            (orgs × edges) coherences; NaN where an endpoint is missing
+        """
+        matrix = self._as_score_matrix(scores)
+        differences = np.asarray(self.incidence @ matrix.T).T
+        return 1.0 - np.abs(differences) / self.scale
+
+    def health(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Integration Health Index for every organization.
+
+        Args:
+            scores: (orgs × nodes) scores, NaN for missing nodes. A 1-D
+                    (nodes,) vector is treated as a single organization.
+
+        Returns:
+            (orgs,) IHI values; 0.0 for organizations without present edges
+        """
+        coherence = self.edge_coherence(scores)
+        present = ~np.isnan(coherence)
+        weights = np.where(present, self.edge_weights, 0.0)
+        total = weights.sum(axis=1)
+        weighted = (weights * np.where(present, coherence, 0.0)).sum(axis=1)
+        return np.divide(weighted, total, out=np.zeros(len(coherence)), where=total > 0)
+
+    def health_gradient(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Derivative of the IHI with respect to every node score, for increases.
+
+        IHI is piecewise linear in the node scores. Along an edge with score
+        difference D the coherence changes at -sign(D) · B[e,n] / scale per
+        point; at D = 0 any change lowers it, so the one-sided derivative
+        -|B[e,n]| / scale is used.
+
+        Args:
+            scores: (orgs × nodes) scores, NaN for missing nodes
+
+        Returns:
+            (orgs × nodes) derivatives; 0 for missing nodes and for
+            organizations without present edges
+        """
+        matrix = self._as_score_matrix(scores)
+        differences = np.asarray(self.incidence @ matrix.T).T
+        present = ~np.isnan(differences)
+        weights = np.where(present, self.edge_weights, 0.0)
+        total = weights.sum(axis=1, keepdims=True)
+        weights = np.divide(weights, total, out=np.zeros_like(weights), where=total > 0)
+
+        signed = weights * np.sign(np.where(present, differences, 1.0))
+        tied = weights * (differences == 0)
+        gradient = -(self.incidence.T @ signed.T).T - (abs(self.incidence).T @ tied.T).T
+        return np.asarray(gradient) / self.scale + 0.0  # normalize -0.0
+
+    def __repr__(self) -> str:
+        return f"IntegrationGraph(nodes={self.n_nodes}, edges={self.n_edges})"
@@ -0,0 +1,333 @@
+"""
+Columnar Item Table
+===================
+
+Struct-of-arrays representation of assessment items, shared by the ADLI,
+LeTCI and organizational scorers.
+
+Each row is one (organization, category, item) triple. Identifiers are kept
+in contiguous int32 arrays, the four normalized indicators of each item in an
+(N, 4) float64 block, and score/target in float64 columns. Indicator columns
+are positional: process items (categories 1-6) store P_A, P_D, P_L, P_I and
+results items (category 7) store R_Lv, R_Tr, R_Cp, R_I. Unknown values are NaN.
+
+Example:
+    >>> from edcellence.data import load_sample_data
+    >>> table = ItemTable.from_organization_data(load_sample_data())
+    >>> len(table)
+    21
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Optional, Union
+import numpy as np
+import pandas as pd
+
+from .indicator_arrays import ADLI_INDICATOR_KEYS, LETCI_INDICATOR_KEYS, IndicatorRangeError
+
+# Last process category; categories above this are scored with LeTCI
+LAST_PROCESS_CATEGORY = 6
+
+
+@dataclass
+class ItemTable:
+    """Columnar table of assessment items across one or more organizations."""
+    org_id: np.ndarray
+    category: np.ndarray
+    item: np.ndarray
+    indicators: np.ndarray
+    # Omitted score/target columns become all-NaN columns of the table's length
+    score: np.ndarray = field(default_factory=lambda: np.empty(0))
+    target: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    def __post_init__(self):
+        self.org_id = np.ascontiguousarray(self.org_id, dtype=np.int32)
+        self.category = np.ascontiguousarray(self.category, dtype=np.int32)
+        self.item = np.ascontiguousarray(self.item, dtype=np.int32)
+        self.indicators = np.ascontiguousarray(self.indicators, dtype=np.float64)
+
+        n = len(self.category)
+        if self.indicators.size == 0:
+            self.indicators = self.indicators.reshape(n, 4)
+        self.score = self._float_column(self.score, n)
+        self.target = self._float_column(self.target, n)
+
+        if len(self.org_id) != n or len(self.item) != n:
+            raise ValueError("org_id, category and item must have the same length")
+        if self.indicators.shape != (n, 4):
+            raise ValueError(f"indicators must have shape ({n}, 4), got {self.indicators.shape}")
+
+    @staticmethod
+    def _float_column(values: np.ndarray, n: int) -> np.ndarray:
+        """Coerce a column to float64; an empty column becomes all-NaN."""
+        column = np.ascontiguousarray(values, dtype=np.float64)
+        if column.size == 0:
+            return np.full(n, np.nan)
+        if column.shape != (n,):
+            raise ValueError(f"Column must have shape ({n},), got {column.shape}")
+        return column
+
+    def __len__(self) -> int:
+        return len(self.category)
+
+    @property
+    def process_mask(self) -> np.ndarray:
+        """Boolean mask of process (ADLI) rows, categories 1-6."""
+        return self.category <= LAST_PROCESS_CATEGORY
+
+    @property
+    def results_mask(self) -> np.ndarray:
+        """Boolean mask of results (LeTCI) rows, category 7."""
+        return self.category > LAST_PROCESS_CATEGORY
+
+    def take(self, rows: Union[np.ndarray, slice]) -> 'ItemTable':
+        """
+        Select rows by boolean mask, integer index or slice.
+
+        Args:
+            rows: Boolean mask of length N, array of row indices, or a slice
+
+        Returns:
+            New ItemTable containing only the selected rows
+        """
+        return ItemTable(
+            org_id=self.org_id[rows],
+            category=self.category[rows],
+            item=self.item[rows],
+            indicators=self.indicators[rows],
+            score=self.score[rows],
+            target=self.target[rows]
+        )
+
+    def with_scores(self, score: np.ndarray) -> 'ItemTable':
+        """Return a copy sharing all columns except ``score``."""
+        return ItemTable(
+            org_id=self.org_id,
+            category=self.category,
+            item=self.item,
+            indicators=self.indicators,
+            score=score,
+            target=self.target
+        )
+
+    @classmethod
+    def concat(cls, tables: Iterable['ItemTable']) -> 'ItemTable':
+        """Concatenate tables row-wise."""
+        tables = list(tables)
+        if not tables:
+            return cls.empty()
+        return cls(
+            org_id=np.concatenate([t.org_id for t in tables]),
+            category=np.concatenate([t.category for t in tables]),
+            item=np.concatenate([t.item for t in tables]),
+            indicators=np.concatenate([t.indicators for t in tables]),
+            score=np.concatenate([t.score for t in tables]),
+            target=np.concatenate([t.target for t in tables])
+        )
+
+    @classmethod
+    def empty(cls) -> 'ItemTable':
+        """Create a table with no rows."""
+        return cls(
+            org_id=np.empty(0), category=np.empty(0), item=np.empty(0),
+            indicators=np.empty((0, 4))
+        )
+
+    @classmethod
+    def from_organization_data(
+        cls,
+        data: Dict,
+        org_id: int = 0,
+        category_targets: Optional[Dict] = None
+    ) -> 'ItemTable':
+        """
+        Convert one organization's JSON assessment tree to an ItemTable.
+
+        Accepts the schema of ``edcellence/data/sample/organizational_data.json``
+        (``categories -> items -> {score, indicators}``) as well as the flat
+        ``categories -> items -> score`` form returned by
+        ``create_sample_organization_data``. Category and item keys may be
+        strings or ints.
+
+        Args:
+            data: Organization data with a 'categories' mapping
+            org_id: Organization identifier written to every row
+            category_targets: Optional {category: target}, applied to items
+                              without their own 'target' (e.g. data['targets_2025'])
+
+        Returns:
+            ItemTable with one row per item
+        """
+        org_ids, categories, items, indicators, scores, targets = [], [], [], [], [], []
+
+        for cat_key, cat_data in data['categories'].items():
+            category = int(cat_key)
+            is_process = category <= LAST_PROCESS_CATEGORY
+            keys = ADLI_INDICATOR_KEYS if is_process else LETCI_INDICATOR_KEYS
+            cat_target = np.nan
+            if category_targets is not None:
+                cat_target = category_targets.get(
+                    category, category_targets.get(str(category), np.nan)
+                )
+
+            for item_key, item_data in cat_data['items'].items():
+                if not isinstance(item_data, dict):
+                    item_data = {'score': item_data}
+                item_indicators = item_data.get('indicators', {})
+
+                org_ids.append(org_id)
+                categories.append(category)
+                items.append(int(item_key))
+                indicators.append([item_indicators.get(key, np.nan) for key in keys])
+                scores.append(item_data.get('score', np.nan))
+                targets.append(item_data.get('target', cat_target))
+
+        if not categories:
+            return cls.empty()
+
+        return cls(
+            org_id=np.array(org_ids),
+            category=np.array(categories),
+            item=np.array(items),
+            indicators=np.array(indicators, dtype=np.float64),
+            score=np.array(scores, dtype=np.float64),
+            target=np.array(targets, dtype=np.float64)
+        )
+
+    @classmethod
+    def from_organizations(cls, organizations: Iterable[Dict], **kwargs) -> 'ItemTable':
+        """
+        Convert several organizations' JSON trees, numbering them 0, 1, 2, ...
+
+        Args:
+            organizations: Iterable of organization data dicts
+            **kwargs: Forwarded to from_organization_data
+
+        Returns:
+            Concatenated ItemTable
+        """
+        return cls.concat(
+            cls.from_organization_data(data, org_id=i, **kwargs)
+            for i, data in enumerate(organizations)
+        )
+
+    @classmethod
+    def from_score_dicts(
+        cls,
+        current_scores: Dict[int, Dict[int, float]],
+        target_scores: Optional[Dict[int, Dict[int, float]]] = None,
+        org_id: int = 0
+    ) -> 'ItemTable':
+        """
+        Build a score-only table from nested {category: {item: score}} dicts.
+
+        Args:
+            current_scores: {category: {item: score}}
+            target_scores: Optional {category: {item: target}}
+            org_id: Organization identifier written to every row
+
+        Returns:
+            ItemTable with NaN indicators
+        """
+        target_scores = target_scores or {}
+        rows = [
+            (category, item, score, target_scores.get(category, {}).get(item, np.nan))
+            for category, items in current_scores.items()
+            for item, score in items.items()
+        ]
+        if not rows:
+            return cls.empty()
+
+        categories, items, scores, targets = zip(*rows)
+        n = len(rows)
+        return cls(
+            org_id=np.full(n, org_id),
+            category=np.array(categories),
+            item=np.array(items),
+            indicators=np.full((n, 4), np.nan),
+            score=np.array(scores, dtype=np.float64),
+            target=np.array(targets, dtype=np.float64)
+        )
+
+    def to_score_dict(self, column: str = 'score') -> Dict[int, Dict[int, float]]:
+        """
+        Convert a column back to nested {category: {item: value}} form.
+
+        Rows from all organizations are merged, so this is intended for
+        single-organization tables.
+
+        Args:
+            column: 'score' or 'target'
+
+        Returns:
+            Nested dictionary keyed by category then item
+        """
+        values = getattr(self, column)
+        nested: Dict[int, Dict[int, float]] = {}
+        rows = zip(self.category.tolist(), self.item.tolist(), values.tolist())
+        for category, item, value in rows:
+            nested.setdefault(category, {})[item] = value
+        return nested
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the table as a DataFrame with indicator columns ind_0..ind_3."""
+        frame = pd.DataFrame({
+            'org_id': self.org_id,
+            'category': self.category,
+            'item': self.item,
+        })
+        for j in range(self.indicators.shape[1]):
+            frame[f'ind_{j}'] = self.indicators[:, j]
+        frame['score'] = self.score
+        frame['target'] = self.target
+        return frame
+
+
+def score_table_rows(
+    table: ItemTable,
+    process: bool,
+    score_rows: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    """
+    Apply a batch scoring function to the process or results rows of a table.
+
+    Args:
+        table: Items to score
+        process: True for process (ADLI) rows, False for results (LeTCI) rows
+        score_rows: Function mapping an (M, 4) indicator block to M scores
+                    (or to an (M, K) matrix of per-row values)
+
+    Returns:
+        Array aligned with the table rows; rows of the other type are NaN.
+
+    Raises:
+        IndicatorRangeError: With row indices relative to the whole table.
+    """
+    rows = np.flatnonzero(table.process_mask if process else table.results_mask)
+    try:
+        selected = np.asarray(score_rows(table.indicators[rows]))
+    except IndicatorRangeError as e:
+        raise IndicatorRangeError(rows[e.rows], e.columns) from None
+
+    scores = np.full((len(table),) + selected.shape[1:], np.nan)
+    scores[rows] = selected
+    return scores
+
+
+def indicator_weights(
+    table: ItemTable,
+    adli_weights: np.ndarray,
+    letci_weights: np.ndarray
+) -> np.ndarray:
+    """
+    Score points per unit of each indicator of every row.
+
+    Args:
+        table: Items to weight
+        adli_weights: (4,) ADLI weight vector, used for process rows
+        letci_weights: (4,) LeTCI weight vector, used for results rows
+
+    Returns:
+        (N, 4) array of 100 × the row's dimension weights
+    """
+    return 100 * np.where(table.process_mask[:, None], adli_weights, letci_weights)
@@ -20,8 +20,21 @@ Reference:
     IEEE ACCESS (under review).
 """
 
-from typing import Dict, Optional, List
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, List, Tuple, Union
 import numpy as np
+import pandas as pd
+
+from .indicator_arrays import (
+    LETCI_INDICATOR_KEYS,
+    as_indicator_matrix,
+    validate_indicator_matrix,
+)
+from .item_table import ItemTable, score_table_rows
+from .score_cache import ScoreCache, weights_fingerprint
+from .weights import LeTCIWeights, compile_weights
 
 
 class LeTCIScorer:
@@ -35,30 +48,128 @@ class LeTCIScorer:
         'w_I': 0.15    # Integration
     }
 
-    def __init__(self, weights: Optional[Dict[str, float]] = None):
+    # Column order of indicator matrices, breakdown labels and matching weight keys
+    INDICATOR_KEYS = LETCI_INDICATOR_KEYS
+    DIMENSION_LABELS = ('Levels', 'Trends', 'Comparisons', 'Integration')
+    WEIGHT_KEYS = ('w_Lv', 'w_Tr', 'w_Cp', 'w_I')
+
+    # Scoring method label used in cache keys and result metadata
+    SCORING_METHOD = 'LeTCI'
+
+    def __init__(
+        self,
+        weights: Optional[Union[Dict[str, float], LeTCIWeights]] = None,
+        cache: Optional[ScoreCache] = None
+    ):
         """
         Initialize LeTCI scorer.
 
         Args:
             weights: Custom weights for LeTCI dimensions. If None, uses defaults.
-                    Must sum to 1.0.
+                    Must sum to 1.0. A pre-validated LeTCIWeights skips validation.
+            cache: Optional ScoreCache memoizing compute_score by indicator vector.
 
         Raises:
             ValueError: If weights don't sum to 1.0 or are out of range [0,1].
         """
-        self.weights = weights if weights else self.DEFAULT_WEIGHTS.copy()
-        self._validate_weights()
-
-    def _validate_weights(self):
+        self._cache = cache
+
+        if not isinstance(weights, LeTCIWeights):
+            weights = weights if weights else self.DEFAULT_WEIGHTS
+            self._validate_weights(weights)
+            weights = LeTCIWeights(*self._compile_weights(weights))
+
+        # Scalar and batch paths both read the one frozen, read-only vector
+        self._weight_vector = weights.vector
+        self._weight_values = tuple(self._weight_vector.tolist())
+        self._weights = MappingProxyType(dict(zip(self.WEIGHT_KEYS, self._weight_values)))
+        self._weight_fingerprint = weights_fingerprint(self._weight_vector)
+
+    @property
+    def weights(self) -> Mapping[str, float]:
+        """Read-only view of the weights, keyed by WEIGHT_KEYS."""
+        return self._weights
+
+    @property
+    def weight_vector(self) -> np.ndarray:
+        """Read-only weight vector aligned with INDICATOR_KEYS."""
+        return self._weight_vector
+
+    @property
+    def cache(self) -> Optional[ScoreCache]:
+        """ScoreCache given at construction, or None."""
+        return self._cache
+
+    def _validate_weights(self, weights: Dict[str, float]):
         """Validate that weights sum to 1.0 and are in valid range."""
-        weight_sum = sum(self.weights.values())
+        weight_sum = sum(weights.values())
         if not np.isclose(weight_sum, 1.0, atol=1e-6):
             raise ValueError(f"Weights must sum to 1.0, got {weight_sum}")
 
-        for key, value in self.weights.items():
+        for key, value in weights.items():
             if not 0 <= value <= 1:
                 raise ValueError(f"Weight {key}={value} out of range [0,1]")
 
+    def _compile_weights(self, weights: Dict[str, float]) -> Tuple[float, ...]:
+        """Order weights like INDICATOR_KEYS."""
+        missing = set(self.WEIGHT_KEYS) - weights.keys()
+        if missing:
+            raise ValueError(f"Missing weights: {missing}")
+        return tuple(float(weights[key]) for key in self.WEIGHT_KEYS)
+
+    def validate_indicators(self, indicators: Dict[str, float]) -> List[float]:
+        """
+        Extract indicators in INDICATOR_KEYS order, checking presence and range.
+
+        Raises:
+            ValueError: If indicators are missing or out of range.
+        """
+        required_keys = set(self.INDICATOR_KEYS)
+        if not required_keys.issubset(indicators.keys()):
+            missing = required_keys - indicators.keys()
+            raise ValueError(f"Missing indicators: {missing}")
+
+        # Validate indicator ranges
+        values = [indicators[key] for key in self.INDICATOR_KEYS]
+        for key, value in zip(self.INDICATOR_KEYS, values):
+            if not 0 <= value <= 1:
+                raise ValueError(f"Indicator {key}={value} out of range [0,1]")
+
+        return values
+
+    def _score_values(self, values: List[float]) -> float:
+        """Weighted score of validated indicator values."""
+        r_lv, r_tr, r_cp, r_i = values
+        w_Lv, w_Tr, w_Cp, w_I = self._weight_values
+
+        # Compute weighted score
+        score = 100 * (
+            w_Lv * r_lv +
+            w_Tr * r_tr +
+            w_Cp * r_cp +
+            w_I * r_i
+        )
+
+        return round(score, 2)
+
+    def _breakdown_values(self, values: List[float], total_score: float) -> Dict[str, float]:
+        """Per-dimension contributions of validated indicator values."""
+        r_lv, r_tr, r_cp, r_i = values
+        w_Lv, w_Tr, w_Cp, w_I = self._weight_values
+
+        return {
+            'Levels': round(100 * w_Lv * r_lv, 2),
+            'Trends': round(100 * w_Tr * r_tr, 2),
+            'Comparisons': round(100 * w_Cp * r_cp, 2),
+            'Integration': round(100 * w_I * r_i, 2),
+            'Total': total_score
+        }
+
+    def _score_entry(self, values: List[float]) -> Tuple[float, Dict[str, float]]:
+        """Score and breakdown of validated values, as stored in a ScoreCache."""
+        score = self._score_values(values)
+        return score, self._breakdown_values(values, score)
+
     def compute_score(self, indicators: Dict[str, float]) -> float:
         """
         Compute LeTCI score for a results item.
@@ -85,26 +196,86 @@ class LeTCIScorer:
             >>> print(f"LeTCI Score: {score}")
             LeTCI Score: 81.25
         """
-        required_keys = {'R_Lv', 'R_Tr', 'R_Cp', 'R_I'}
-        if not required_keys.issubset(indicators.keys()):
-            missing = required_keys - indicators.keys()
-            raise ValueError(f"Missing indicators: {missing}")
+        values = self.validate_indicators(indicators)
+        if self.cache is None:
+            return self._score_values(values)
+        return self.cache.get_or_compute(
+            self._weight_fingerprint, self.SCORING_METHOD, values, self._score_entry
+        )[0]
+
+    def compute_score_batch(
+        self,
+        indicators: Union[np.ndarray, pd.DataFrame, ItemTable]
+    ) -> np.ndarray:
+        """
+        Compute LeTCI scores for many results items at once.
 
-        # Validate indicator ranges
-        for key, value in indicators.items():
-            if key in required_keys:
-                if not 0 <= value <= 1:
-                    raise ValueError(f"Indicator {key}={value} out of range [0,1]")
+        Args:
+            indicators: (N, 4) array with columns ordered as INDICATOR_KEYS, or a
+                       DataFrame with 'R_Lv', 'R_Tr', 'R_Cp', 'R_I' columns, or an ItemTable.
+                       For an ItemTable only the results rows are scored and the
+                       result stays aligned with the table (other rows are NaN).
 
-        # Compute weighted score
-        score = 100 * (
-            self.weights['w_Lv'] * indicators['R_Lv'] +
-            self.weights['w_Tr'] * indicators['R_Tr'] +
-            self.weights['w_Cp'] * indicators['R_Cp'] +
-            self.weights['w_I'] * indicators['R_I']
-        )
+        Returns:
+            Array of N LeTCI scores in range [0, 100], rounded like compute_score.
 
-        return round(score, 2)
+        Raises:
+            ValueError: If columns are missing or the array shape is wrong.
+            IndicatorRangeError: If any indicator is out of range; lists every
+                                 offending row.
+
+        Example:
+            >>> scorer = LeTCIScorer()
+            >>> scorer.compute_score_batch(np.array([[0.85, 0.90, 0.75, 0.70]]))
+            array([81.5])
+        """
+        if isinstance(indicators, ItemTable):
+            return score_table_rows(indicators, False, self.compute_score_batch)
+
+        matrix = as_indicator_matrix(indicators, self.INDICATOR_KEYS)
+        validate_indicator_matrix(matrix, self.INDICATOR_KEYS)
+
+        return np.round(100 * (matrix @ self._weight_vector), 2)
+
+    def get_diagnostic_breakdown_batch(
+        self,
+        indicators: Union[np.ndarray, pd.DataFrame, ItemTable],
+        as_frame: bool = False
+    ) -> Union[np.ndarray, pd.DataFrame]:
+        """
+        Get per-dimension contributions for many items at once.
+
+        Indicators are validated once and all contributions come from a single
+        elementwise product with the compiled weight vector.
+
+        Args:
+            indicators: Same inputs as compute_score_batch
+            as_frame: Return a DataFrame labelled like get_diagnostic_breakdown
+
+        Returns:
+            (N, 5) matrix with columns DIMENSION_LABELS + ('Total',), rounded to
+            2 decimals; 'Total' equals compute_score_batch. For an ItemTable,
+            non-results rows are NaN.
+
+        Example:
+            >>> scorer = LeTCIScorer()
+            >>> scorer.get_diagnostic_breakdown_batch(np.array([[0.85, 0.90, 0.75, 0.70]]))
+            array([[29.75, 22.5 , 18.75, 10.5 , 81.5 ]])
+        """
+        if isinstance(indicators, ItemTable):
+            matrix = score_table_rows(indicators, False, self.get_diagnostic_breakdown_batch)
+        else:
+            matrix = as_indicator_matrix(indicators, self.INDICATOR_KEYS)
+            validate_indicator_matrix(matrix, self.INDICATOR_KEYS)
+
+            breakdown = np.empty((len(matrix), 5))
+            np.multiply(100 * matrix, self._weight_vector, out=breakdown[:, :4])
+            breakdown[:, 4] = 100 * (matrix @ self._weight_vector)
+            matrix = np.round(breakdown, 2, out=breakdown)
+
+        if as_frame:
+            return pd.DataFrame(matrix, columns=list(self.DIMENSION_LABELS) + ['Total'])
+        return matrix
 
     def normalize_level(self, actual: float, target: float, max_value: float) -> float:
         """
@@ -129,6 +300,47 @@ class LeTCIScorer:
 
         return min(actual / max_value, 1.0)
 
+    def normalize_level_batch(
+        self,
+        actual: np.ndarray,
+        target: np.ndarray,
+        max_value: np.ndarray
+    ) -> np.ndarray:
+        """
+        Normalize many outcome levels at once; array version of normalize_level.
+
+        Arguments are broadcast against each other, so a scalar ``max_value``
+        may be combined with column arrays.
+
+        Args:
+            actual: Actual performance values
+            target: Target performance values (unused, as in normalize_level)
+            max_value: Maximum possible values; must be positive
+
+        Returns:
+            Array of normalized levels, capped at 1.0
+
+        Raises:
+            ValueError: If any max_value is not positive; lists every offending row.
+
+        Example:
+            >>> scorer = LeTCIScorer()
+            >>> scorer.normalize_level_batch(np.array([85, 120]), 80, np.array([100, 100]))
+            array([0.85, 1.  ])
+        """
+        actual, _, max_value = np.broadcast_arrays(
+            np.asarray(actual, dtype=np.float64),
+            np.asarray(target, dtype=np.float64),
+            np.asarray(max_value, dtype=np.float64)
+        )
+
+        invalid = ~(max_value > 0)
+        if invalid.any():
+            rows = np.flatnonzero(invalid.ravel())
+            raise ValueError(f"max_value must be positive; offending rows: {rows.tolist()}")
+
+        return np.minimum(actual / max_value, 1.0)
+
     def normalize_trend(self, values: List[float], periods: int = 3) -> float:
         """
         Normalize trend stability to [0,1] scale based on linear regression.
@@ -175,6 +387,76 @@ class LeTCIScorer:
         trend_score = 0.5 + (normalized_slope / 2)
         return np.clip(trend_score, 0.0, 1.0)
 
+    def normalize_trend_batch(
+        self,
+        values: np.ndarray,
+        periods: int = 3,
+        decay: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Normalize many trend histories at once using closed-form OLS slopes.
+
+        Applies the same rules as normalize_trend to every row: the last
+        ``periods`` observations are regressed on their position, the slope is
+        scaled by 10% of the window mean and mapped to [0,1] around 0.5.
+        Rows with fewer than two observations score 0.5.
+
+        Args:
+            values: (series × periods) array, most recent last. Unequal
+                    histories are padded with NaN; NaN entries are ignored.
+            periods: Number of most recent observations per series to consider
+            decay: Optional exponential period weighting in (0, 1]; the
+                   observation k periods before the latest gets weight decay**k.
+                   None fits an unweighted slope exactly like normalize_trend.
+
+        Returns:
+            Array of trend scores in [0,1], one per series
+
+        Example:
+            >>> scorer = LeTCIScorer()
+            >>> scorer.normalize_trend_batch(np.array([[70, 75, 80, 85, 90],
+            ...                                        [np.nan, np.nan, 80, 80, 80]]))
+            array([0.79411765, 0.5       ])
+        """
+        y = np.asarray(values, dtype=np.float64)
+        if y.ndim != 2:
+            raise ValueError(f"values must be a 2-D (series × periods) array, got {y.shape}")
+        if periods < 1:
+            raise ValueError(f"periods must be at least 1, got {periods}")
+        if decay is not None and not 0 < decay <= 1:
+            raise ValueError(f"decay must be in (0, 1], got {decay}")
+
+        # Rank observations from the most recent and keep the last `periods`
+        valid = ~np.isnan(y)
+        age = np.cumsum(valid[:, ::-1], axis=1)[:, ::-1] - 1
+        keep = valid & (age < periods)
+        n = keep.sum(axis=1)
+
+        x = np.where(keep, (n[:, None] - 1) - age, 0.0)
+        y = np.where(keep, y, 0.0)
+        w = keep.astype(np.float64)
+        if decay is not None:
+            w *= decay ** np.where(keep, age, 0)
+
+        # Weighted least-squares slope from sums of the regression terms
+        sw = w.sum(axis=1)
+        swx = (w * x).sum(axis=1)
+        swy = (w * y).sum(axis=1)
+        swxx = (w * x * x).sum(axis=1)
+        swxy = (w * x * y).sum(axis=1)
+        denominator = sw * swxx - swx ** 2
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(denominator > 0, (sw * swxy - swx * swy) / denominator, 0.0)
+            max_expected_slope = y.sum(axis=1) / n * 0.1
+            normalized_slope = np.where(
+                max_expected_slope > 0, slope / max_expected_slope, 0.0
+            )
+
+        trend_score = np.clip(0.5 + normalized_slope / 2, 0.0, 1.0)
+        trend_score[n < 2] = 0.5
+        return trend_score
+
     def normalize_comparison(self, actual: float, benchmark: float) -> float:
         """
         Normalize comparative positioning to [0,1] scale.
@@ -213,6 +495,45 @@ class LeTCIScorer:
 
         return np.clip(score, 0.0, 1.0)
 
+    def normalize_comparison_batch(
+        self,
+        actual: np.ndarray,
+        benchmark: np.ndarray
+    ) -> np.ndarray:
+        """
+        Normalize many comparisons at once; array version of normalize_comparison.
+
+        Applies the same piecewise mapping without Python branching: ratios in
+        [1, 2] map to [0.5, 1.0], ratios in [0, 1) to [0, 0.5), and rows with a
+        non-positive benchmark score 0.5.
+
+        Args:
+            actual: Actual performance values
+            benchmark: Benchmark/competitor values (broadcast against actual)
+
+        Returns:
+            Array of comparison scores in [0,1]
+
+        Example:
+            >>> scorer = LeTCIScorer()
+            >>> scorer.normalize_comparison_batch(np.array([90, 40, 70]), np.array([80, 80, 0]))
+            array([0.5625, 0.25  , 0.5   ])
+        """
+        actual, benchmark = np.broadcast_arrays(
+            np.asarray(actual, dtype=np.float64),
+            np.asarray(benchmark, dtype=np.float64)
+        )
+
+        has_benchmark = ~(benchmark <= 0)
+        ratio = np.divide(actual, benchmark, out=np.ones_like(actual), where=has_benchmark)
+        score = np.where(
+            ratio >= 1.0,
+            0.5 + np.minimum((ratio - 1.0) / 2.0, 0.5),  # Above benchmark
+            0.5 * ratio                                   # Below benchmark
+        )
+
+        return np.where(has_benchmark, np.clip(score, 0.0, 1.0), 0.5)
+
     def get_diagnostic_breakdown(self, indicators: Dict[str, float]) -> Dict[str, float]:
         """
         Get diagnostic breakdown showing contribution of each LeTCI dimension.
@@ -235,17 +556,108 @@ class LeTCIScorer:
             Integration: 10.5
             Total: 81.5
         """
-        total_score = self.compute_score(indicators)
+        values = self.validate_indicators(indicators)
+        return self._breakdown_values(values, self._score_values(values))
 
-        breakdown = {
-            'Levels': round(100 * self.weights['w_Lv'] * indicators['R_Lv'], 2),
-            'Trends': round(100 * self.weights['w_Tr'] * indicators['R_Tr'], 2),
-            'Comparisons': round(100 * self.weights['w_Cp'] * indicators['R_Cp'], 2),
-            'Integration': round(100 * self.weights['w_I'] * indicators['R_I'], 2),
-            'Total': total_score
-        }
 
-        return breakdown
+class TrendState:
+    """
+    Incremental trend normalization for one KPI series.
+
+    Keeps running regression sums (n, Σx, Σy, Σxy, Σx²) over a sliding window
+    of the last ``periods`` values, so appending a new assessment period
+    updates the slope and trend score in constant time. Scores match
+    LeTCIScorer.normalize_trend over the full history.
+
+    Example:
+        >>> state = TrendState(periods=3)
+        >>> for value in [70, 75, 80, 85]:
+        ...     _ = state.append(value)
+        >>> round(state.append(90), 4)
+        0.7941
+        >>> TrendState.from_dict(state.to_dict()).score == state.score
+        True
+    """
+
+    __slots__ = ('periods', '_window', '_n', '_sx', '_sy', '_sxy', '_sxx')
+
+    def __init__(self, periods: int = 3, values: Iterable[float] = ()):
+        """
+        Initialize trend state.
+
+        Args:
+            periods: Number of most recent periods in the regression window
+            values: Optional initial history (most recent last)
+        """
+        if periods < 1:
+            raise ValueError(f"periods must be at least 1, got {periods}")
+
+        self.periods = periods
+        self._window = deque(maxlen=periods)
+        self._n = 0
+        self._sx = self._sy = self._sxy = self._sxx = 0.0
+
+        for value in values:
+            self.append(value)
+
+    def append(self, value: float) -> float:
+        """
+        Append the value of a new period and return the updated trend score.
+
+        Args:
+            value: Observation for the new period
+
+        Returns:
+            Normalized trend score in [0,1]
+        """
+        value = float(value)
+
+        if self._n == self.periods:
+            # Drop the oldest point (x = 0) and shift the remaining x down by one
+            self._sy -= self._window[0]
+            self._n -= 1
+            self._sxx += self._n - 2 * self._sx
+            self._sx -= self._n
+            self._sxy -= self._sy
+
+        x = self._n
+        self._n += 1
+        self._sx += x
+        self._sxx += x * x
+        self._sy += value
+        self._sxy += x * value
+        self._window.append(value)
+
+        return self.score
+
+    @property
+    def slope(self) -> float:
+        """OLS slope of the values in the current window."""
+        n = self._n
+        denominator = n * self._sxx - self._sx ** 2
+        if n < 2 or denominator <= 0:
+            return 0.0
+        return (n * self._sxy - self._sx * self._sy) / denominator
+
+    @property
+    def score(self) -> float:
+        """Normalized trend score in [0,1], as computed by normalize_trend."""
+        if self._n < 2:
+            return 0.5
+
+        max_expected_slope = self._sy / self._n * 0.1  # 10% improvement per period
+        normalized_slope = self.slope / max_expected_slope if max_expected_slope > 0 else 0
+
+        return float(np.clip(0.5 + normalized_slope / 2, 0.0, 1.0))
+
+    def to_dict(self) -> Dict:
+        """Serialize compactly; only the window values are stored."""
+        return {'periods': self.periods, 'window': list(self._window)}
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'TrendState':
+        """Restore a state produced by to_dict."""
+        return cls(periods=state['periods'], values=state['window'])
 
 
 def compute_letci_score(indicators: Dict[str, float], weights: Optional[Dict[str, float]] = None) -> float:
@@ -264,8 +676,37 @@ def compute_letci_score(indicators: Dict[str, float], weights: Optional[Dict[str
         >>> print(score)
         81.25
     """
-    scorer = LeTCIScorer(weights)
-    return scorer.compute_score(indicators)
+    return get_letci_scorer(weights).compute_score(indicators)
+
+
+@lru_cache(maxsize=128)
+def _letci_scorer_for(weights: LeTCIWeights) -> LeTCIScorer:
+    """Build one shared scorer per distinct set of compiled weights."""
+    return LeTCIScorer(weights)
+
+
+def get_letci_scorer(
+    weights: Optional[Union[Dict[str, float], LeTCIWeights]] = None
+) -> LeTCIScorer:
+    """
+    Return a process-wide shared LeTCIScorer for the given weights.
+
+    Identical weights, whether passed as a dict or a LeTCIWeights, map to the same
+    scorer instance, so validation and compilation happen once per distinct
+    weighting. Cached scorers are shared across callers and threads; their
+    weights and cache are read-only, so sharing needs no locks.
+
+    Args:
+        weights: Optional weights dict or LeTCIWeights; None uses the defaults
+
+    Returns:
+        Shared LeTCIScorer instance
+
+    Example:
+        >>> get_letci_scorer() is get_letci_scorer(LeTCIScorer.DEFAULT_WEIGHTS)
+        True
+    """
+    return _letci_scorer_for(compile_weights(weights, LeTCIWeights))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,157 @@
+"""
+Marginal-Gain Index
+===================
+
+Closed-form derivatives of the organizational score and the Integration
+Health Index with respect to every indicator of a portfolio.
+
+The organizational score is linear in each indicator x[i,k] of item i in
+(org o, category c):
+
+    ∂S_item[i]/∂x[i,k] = 100 · w_k          (ADLI or LeTCI weight)
+    ∂S_cat[o,c]/∂S_item[i] = v_i            (item weight, 1/n_oc if equal)
+    ∂S_org[o]/∂S_cat[o,c] = w_c             (category weight)
+
+and IHI is piecewise linear in the category scores, so
+
+    ∂S_org/∂x[i,k] = 100 · w_k · v_i · w_c
+    ∂IHI/∂x[i,k]   = 100 · w_k · v_i · ∂IHI[o]/∂S_cat[o,c]
+
+with ∂IHI/∂S_cat from IntegrationGraph.health_gradient (one-sided, for
+increases). All derivatives are computed in one vectorized pass and are per
+unit of indicator (a change of 1.0); multiply by a planned change such as
+0.1 to estimate its effect. The IHI derivative holds only until an edge's
+score difference changes sign.
+
+Example:
+    >>> from edcellence.data import load_sample_data
+    >>> index = marginal_gain_index(ItemTable.from_organization_data(load_sample_data()))
+    >>> index.top(1)[['category', 'item', 'indicator']].values.tolist()
+    [[7, 1, 'R_Lv']]
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+from .indicator_arrays import ADLI_INDICATOR_KEYS, LETCI_INDICATOR_KEYS
+from .item_table import ItemTable, indicator_weights
+from .organizational_scoring import OrganizationalScorer
+from .rollup import _category_weight_lookup, segment_index
+
+# Columns of MarginalGainIndex.frame(), in order
+MARGINAL_GAIN_COLUMNS = [
+    'org_id', 'category', 'item', 'indicator', 'value',
+    'd_org_score', 'd_ihi', 'org_gain_to_max'
+]
+
+
+@dataclass
+class MarginalGainIndex:
+    """Derivatives of org score and IHI for every (item, indicator).
+
+    Array attributes are (N, 4) and aligned with the table rows, columns in
+    the item's INDICATOR_KEYS order (ADLI for process, LeTCI for results).
+
+    Attributes:
+        org_id, category, item: (N,) item identifiers
+        process: (N,) True for process (ADLI) items
+        value: Current indicator values
+        d_org_score: ∂(organizational score)/∂(indicator)
+        d_ihi: ∂(IHI)/∂(indicator), one-sided for increases
+    """
+    org_id: np.ndarray
+    category: np.ndarray
+    item: np.ndarray
+    process: np.ndarray
+    value: np.ndarray
+    d_org_score: np.ndarray
+    d_ihi: np.ndarray
+
+    def frame(self, by: str = 'd_org_score') -> pd.DataFrame:
+        """
+        Long table of every (item, indicator) sorted by descending ``by``.
+
+        Args:
+            by: Sort column, e.g. 'd_org_score', 'd_ihi' or 'org_gain_to_max'
+                (the org score gain of raising the indicator to 1.0)
+
+        Returns:
+            DataFrame with MARGINAL_GAIN_COLUMNS; ties keep table order
+        """
+        if by not in MARGINAL_GAIN_COLUMNS[5:]:
+            raise ValueError(f"by must be one of {MARGINAL_GAIN_COLUMNS[5:]}, got {by!r}")
+        keys = np.where(self.process[:, None], np.array(ADLI_INDICATOR_KEYS),
+                        np.array(LETCI_INDICATOR_KEYS))
+        frame = pd.DataFrame({
+            'org_id': np.repeat(self.org_id, 4),
+            'category': np.repeat(self.category, 4),
+            'item': np.repeat(self.item, 4),
+            'indicator': keys.ravel(),
+            'value': self.value.ravel(),
+            'd_org_score': self.d_org_score.ravel(),
+            'd_ihi': self.d_ihi.ravel(),
+            'org_gain_to_max': (self.d_org_score * (1.0 - self.value)).ravel()
+        })
+        order = np.argsort(-frame[by].to_numpy(), kind='stable')
+        return frame.iloc[order].reset_index(drop=True)
+
+    def top(self, k: int = 10, by: str = 'd_org_score') -> pd.DataFrame:
+        """The ``k`` indicators with the largest ``by`` (see frame)."""
+        return self.frame(by).head(k)
+
+
+def marginal_gain_index(
+    table: ItemTable,
+    scorer: Optional[OrganizationalScorer] = None,
+    item_weights: Optional[np.ndarray] = None
+) -> MarginalGainIndex:
+    """
+    Derivatives of org score and IHI for every indicator of a portfolio.
+
+    Args:
+        table: Items with normalized indicators, possibly many organizations
+        scorer: Scorer providing weights and the integration graph; defaults
+                to OrganizationalScorer()
+        item_weights: Optional (N,) item weights summing to 1.0 per
+                      (org, category); equal weights if None
+
+    Returns:
+        MarginalGainIndex
+
+    Raises:
+        ValueError: If the table is empty or item weights or indicators are invalid.
+    """
+    if len(table) == 0:
+        raise ValueError("table has no items")
+    scorer = scorer or OrganizationalScorer()
+    scored = scorer.score_item_table(table)
+    rollup = scorer.compute_rollups(scored, item_weights=item_weights)
+
+    # Rollup segments follow the same (org, category) order
+    _, _, segment = segment_index(table.org_id, table.category)
+    if item_weights is None:
+        item_weight = 1.0 / rollup.item_count[segment]
+    else:
+        item_weight = np.asarray(item_weights, dtype=np.float64)
+
+    # ∂S_item/∂x, scaled by each item's weight in its category score
+    item_gradient = indicator_weights(
+        table, scorer.adli_scorer.weight_vector, scorer.letci_scorer.weight_vector
+    ) * item_weight[:, None]
+
+    category = table.category.astype(np.int64)
+    category_weight = _category_weight_lookup(scorer.category_weights, category)
+    ihi_gradient = scorer.integration_graph.health_gradient(rollup.category_matrix())
+    org_row = np.searchsorted(rollup.org_id, table.org_id)
+
+    return MarginalGainIndex(
+        org_id=table.org_id,
+        category=table.category,
+        item=table.item,
+        process=table.process_mask,
+        value=table.indicators,
+        d_org_score=item_gradient * category_weight[:, None],
+        d_ihi=item_gradient * ihi_gradient[org_row, category - 1][:, None]
+    )
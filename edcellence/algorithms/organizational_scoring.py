@@ -14,15 +14,33 @@ Reference:
     IEEE ACCESS.
 """
 
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import logging
+import sys
+
+from ..instrumentation import instrumented
+from .adli_scoring import ADLIScorer, get_adli_scorer
+from .letci_scoring import LeTCIScorer, get_letci_scorer
+from .gap_analysis import (
+    DEFAULT_CRITICALITY,
+    DEFAULT_RISK,
+    GAP_COLUMNS,
+    gap_frame,
+    lookup_pairs,
+)
+from .integration_health import DEFAULT_INTEGRATION_EDGES, IntegrationGraph
+from .item_table import LAST_PROCESS_CATEGORY, ItemTable
+from .rollup import RollupResult, rollup_scores
+from .score_cache import ScoreCache
+from .weights import ADLIWeights, CategoryWeights, LeTCIWeights, compile_weights
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +55,52 @@ class CategoryType(Enum):
     RESULTS = 7
 
 
-@dataclass
+# Display names of the seven categories
+CATEGORY_NAMES = {
+    1: 'Leadership',
+    2: 'Strategy',
+    3: 'Customers',
+    4: 'Measurement',
+    5: 'Workforce',
+    6: 'Operations',
+    7: 'Results'
+}
+
+# Band lower bounds (ascending) and labels (lowest band first). A value falls
+# in band i when THRESHOLDS[i-1] <= value < THRESHOLDS[i]; NaN falls in the
+# lowest band.
+MATURITY_THRESHOLDS = (40.0, 60.0, 75.0, 90.0)
+MATURITY_LEVELS = (
+    "Initial - Reactive approach",
+    "Emerging - Beginning systematic approach",
+    "Developing - Early systematic approach",
+    "Mature - Strong systematic approach",
+    "Advanced - World-class performance"
+)
+IHI_THRESHOLDS = (0.7, 0.8, 0.9)
+IHI_INTERPRETATIONS = (
+    "Poor - Significant alignment gaps require intervention",
+    "Fair - Some alignment issues need attention",
+    "Good - Moderate alignment with minor gaps",
+    "Excellent - Strong cross-category alignment"
+)
+
+# Compact per-item result record used by the batch scoring path
+ITEM_RESULT_DTYPE = np.dtype([
+    ('org_id', np.int32),
+    ('category', np.int32),
+    ('item', np.int32),
+    ('score', np.float64),
+    ('confidence', np.float64),
+    ('breakdown', np.float64, (5,)),
+])
+
+
+# Slotted records (no per-instance __dict__) where dataclasses support it
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ScoreResult:
     """Score result with metadata."""
     score: float
@@ -48,6 +111,163 @@ class ScoreResult:
     metadata: Optional[Dict] = None
 
 
+class ScoreResultSet:
+    """
+    Array-backed collection of item score results.
+
+    Stores org id, category, item, score, confidence and the five-column
+    breakdown (four dimensions plus total) as parallel NumPy arrays. Indexing
+    with an int materializes a ScoreResult for that row on demand; slices,
+    masks and index arrays return a new ScoreResultSet without creating any
+    per-row objects.
+
+    Example:
+        >>> from edcellence.data import load_sample_data
+        >>> scorer = OrganizationalScorer()
+        >>> results = scorer.compute_item_results(ItemTable.from_organization_data(
+        ...     load_sample_data()))
+        >>> len(results), results[0].score
+        (21, 75.0)
+    """
+
+    __slots__ = ('org_id', 'category', 'item', 'score', 'confidence', 'breakdown')
+
+    def __init__(
+        self,
+        score: np.ndarray,
+        category: np.ndarray,
+        item: np.ndarray,
+        confidence: np.ndarray,
+        breakdown: np.ndarray,
+        org_id: Optional[np.ndarray] = None
+    ):
+        """
+        Initialize result set from parallel arrays.
+
+        Args:
+            score: (N,) item scores
+            category: (N,) category numbers
+            item: (N,) item identifiers
+            confidence: (N,) confidence values
+            breakdown: (N, 5) dimension contributions plus total, in the
+                       DIMENSION_LABELS order of each row's scorer
+            org_id: Optional (N,) organization ids; zeros if None
+
+        Raises:
+            ValueError: If array lengths differ.
+        """
+        self.score = np.ascontiguousarray(score, dtype=np.float64)
+        n = len(self.score)
+        self.category = np.ascontiguousarray(category, dtype=np.int32)
+        self.item = np.ascontiguousarray(item, dtype=np.int32)
+        self.confidence = np.ascontiguousarray(confidence, dtype=np.float64)
+        self.breakdown = np.ascontiguousarray(breakdown, dtype=np.float64).reshape(n, 5)
+        self.org_id = (np.zeros(n, dtype=np.int32) if org_id is None
+                       else np.ascontiguousarray(org_id, dtype=np.int32))
+
+        if not (len(self.category) == len(self.item) == len(self.confidence)
+                == len(self.org_id) == n):
+            raise ValueError("All result arrays must have the same length")
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> 'ScoreResultSet':
+        """
+        Build from a structured array of ITEM_RESULT_DTYPE.
+
+        Args:
+            records: Output of OrganizationalScorer.compute_item_score_batch
+
+        Returns:
+            ScoreResultSet with one row per record
+        """
+        return cls(
+            score=records['score'],
+            category=records['category'],
+            item=records['item'],
+            confidence=records['confidence'],
+            breakdown=records['breakdown'],
+            org_id=records['org_id']
+        )
+
+    def to_records(self) -> np.ndarray:
+        """Return the results as a structured array of ITEM_RESULT_DTYPE."""
+        records = np.empty(len(self), dtype=ITEM_RESULT_DTYPE)
+        for field in ITEM_RESULT_DTYPE.names:
+            records[field] = getattr(self, field)
+        return records
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the results as a DataFrame with breakdown columns dim_0..dim_3."""
+        frame = pd.DataFrame({
+            'org_id': self.org_id,
+            'category': self.category,
+            'item': self.item,
+            'score': self.score,
+            'confidence': self.confidence
+        })
+        for j in range(4):
+            frame[f'dim_{j}'] = self.breakdown[:, j]
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self._result(index)
+        return ScoreResultSet(
+            score=self.score[index],
+            category=self.category[index],
+            item=self.item[index],
+            confidence=self.confidence[index],
+            breakdown=self.breakdown[index],
+            org_id=self.org_id[index]
+        )
+
+    def __iter__(self) -> Iterator[ScoreResult]:
+        for row in range(len(self)):
+            yield self._result(row)
+
+    def _result(self, row: int) -> ScoreResult:
+        """Materialize one row as a ScoreResult, like compute_item_score returns."""
+        category = int(self.category[row])
+        scorer = ADLIScorer if category <= LAST_PROCESS_CATEGORY else LeTCIScorer
+        values = self.breakdown[row].tolist()
+        return ScoreResult(
+            score=values[4],
+            category=category,
+            item=int(self.item[row]),
+            breakdown=dict(zip(scorer.DIMENSION_LABELS + ('Total',), values)),
+            confidence=float(self.confidence[row]),
+            metadata={'method': scorer.SCORING_METHOD}
+        )
+
+    def __repr__(self) -> str:
+        return f"ScoreResultSet(n={len(self)})"
+
+
+def _table_rows(scorer, table: ItemTable, *args, **kwargs) -> int:
+    """Items processed by a table stage (for instrumentation)."""
+    return len(table)
+
+
+def _matrix_rows(scorer, score_matrix: np.ndarray, *args, **kwargs) -> int:
+    """Organizations processed by a score matrix stage (for instrumentation)."""
+    return len(score_matrix)
+
+
+def _category_items(scorer, category: int, item_scores: Dict, *args, **kwargs) -> int:
+    """Items aggregated by a category stage (for instrumentation)."""
+    return len(item_scores)
+
+
+def _gap_items(scorer, current_scores, *args, **kwargs) -> int:
+    """Items processed by gap analysis (for instrumentation)."""
+    if isinstance(current_scores, ItemTable):
+        return len(current_scores)
+    return sum(len(items) for items in current_scores.values())
+
+
 class OrganizationalScorer:
     """
     Comprehensive organizational scoring engine.
@@ -67,49 +287,68 @@ class OrganizationalScorer:
         7: 1/7   # Results
     }
 
-    # Integration dependencies (category relationships)
-    INTEGRATION_EDGES = [
-        (1, 2),  # Leadership → Strategy
-        (2, 5),  # Strategy → Workforce
-        (2, 6),  # Strategy → Operations
-        (5, 4),  # Workforce → Measurement
-        (6, 4),  # Operations → Measurement
-        (4, 7)   # Measurement → Results
-    ]
+    # Integration dependencies (category relationships), see DEFAULT_INTEGRATION_EDGES
+    INTEGRATION_EDGES = list(DEFAULT_INTEGRATION_EDGES)
 
     def __init__(
         self,
-        category_weights: Optional[Dict[int, float]] = None,
-        adli_weights: Optional[Dict[str, float]] = None,
-        letci_weights: Optional[Dict[str, float]] = None
+        category_weights: Optional[Union[Dict[int, float], CategoryWeights]] = None,
+        adli_weights: Optional[Union[Dict[str, float], ADLIWeights]] = None,
+        letci_weights: Optional[Union[Dict[str, float], LeTCIWeights]] = None,
+        cache: Optional[ScoreCache] = None
     ):
         """
         Initialize organizational scorer.
 
+        ADLI and LeTCI scorers are taken from the process-wide scorer cache, so
+        identical weights share one pre-validated instance.
+
         Args:
-            category_weights: Custom weights for 7 categories
-            adli_weights: Custom ADLI weights
-            letci_weights: Custom LeTCI weights
+            category_weights: Custom weights for 7 categories (dict or CategoryWeights)
+            adli_weights: Custom ADLI weights (dict or ADLIWeights)
+            letci_weights: Custom LeTCI weights (dict or LeTCIWeights)
+            cache: Optional ScoreCache memoizing compute_item_score by
+                   (weights, method, indicator vector)
         """
-        self.category_weights = category_weights or self.DEFAULT_CATEGORY_WEIGHTS.copy()
+        self._cache = cache
+
+        if isinstance(category_weights, CategoryWeights):
+            category_weights = category_weights.as_dict()
+        else:
+            category_weights = dict(category_weights or self.DEFAULT_CATEGORY_WEIGHTS)
+            self._validate_category_weights(category_weights)
+        self._category_weights = MappingProxyType(category_weights)
 
-        # Import scorers
-        from .adli_scoring import ADLIScorer
-        from .letci_scoring import LeTCIScorer
+        self.adli_scorer = get_adli_scorer(adli_weights)
+        self.letci_scorer = get_letci_scorer(letci_weights)
+        self.integration_graph = _category_graph(tuple(self.INTEGRATION_EDGES))
 
-        self.adli_scorer = ADLIScorer(adli_weights)
-        self.letci_scorer = LeTCIScorer(letci_weights)
+        logger.debug("OrganizationalScorer initialized successfully")
 
-        self._validate_category_weights()
+    @property
+    def category_weights(self) -> Mapping[int, float]:
+        """Read-only view of the category weights, keyed by category."""
+        return self._category_weights
 
-        logger.info("OrganizationalScorer initialized successfully")
+    @property
+    def cache(self) -> Optional[ScoreCache]:
+        """ScoreCache given at construction, or None."""
+        return self._cache
 
-    def _validate_category_weights(self):
+    def _validate_category_weights(self, category_weights: Dict[int, float]):
         """Validate category weights sum to 1.0."""
-        weight_sum = sum(self.category_weights.values())
+        weight_sum = sum(category_weights.values())
         if not np.isclose(weight_sum, 1.0, atol=1e-6):
             raise ValueError(f"Category weights must sum to 1.0, got {weight_sum}")
 
+    def _validate_table_categories(self, table: ItemTable):
+        """Validate that every table row belongs to categories 1-7."""
+        invalid = (table.category < 1) | (table.category > 7)
+        if invalid.any():
+            bad = np.unique(table.category[invalid]).tolist()
+            raise ValueError(f"Category must be 1-7, got {bad}")
+
+    @instrumented('item_score')
     def compute_item_score(
         self,
         category: int,
@@ -131,28 +370,111 @@ class OrganizationalScorer:
             raise ValueError(f"Category must be 1-7, got {category}")
 
         try:
-            if category <= 6:
-                # Process category - use ADLI
-                score = self.adli_scorer.compute_score(indicators)
-                breakdown = self.adli_scorer.get_diagnostic_breakdown(indicators)
+            # Process categories use ADLI, results category uses LeTCI.
+            # Indicators are validated once and reused for score, breakdown and confidence.
+            scorer = self.adli_scorer if category <= 6 else self.letci_scorer
+            values = scorer.validate_indicators(indicators)
+            if self.cache is None:
+                score, breakdown = scorer._score_entry(values)
             else:
-                # Results category - use LeTCI
-                score = self.letci_scorer.compute_score(indicators)
-                breakdown = self.letci_scorer.get_diagnostic_breakdown(indicators)
+                score, breakdown = self.cache.get_or_compute(
+                    scorer._weight_fingerprint, scorer.SCORING_METHOD, values,
+                    scorer._score_entry
+                )
+                breakdown = dict(breakdown)
 
             return ScoreResult(
                 score=score,
                 category=category,
                 item=item_id,
                 breakdown=breakdown,
-                confidence=self._compute_confidence(indicators),
-                metadata={'method': 'ADLI' if category <= 6 else 'LeTCI'}
+                confidence=self._compute_confidence(values),
+                metadata={'method': scorer.SCORING_METHOD}
             )
 
         except Exception as e:
             logger.error(f"Error computing item score: {e}")
             raise
 
+    @instrumented('item_score_batch', items=_table_rows)
+    def compute_item_score_batch(self, table: ItemTable) -> np.ndarray:
+        """
+        Compute scores, breakdowns and confidence for every item of a table.
+
+        Batch counterpart of compute_item_score: indicators are validated once
+        per scorer type and results are written to one structured array instead
+        of a ScoreResult per item.
+
+        Args:
+            table: Items with normalized indicators
+
+        Returns:
+            Structured array of ITEM_RESULT_DTYPE, one record per table row.
+            'breakdown' holds the four dimension contributions plus total, in
+            the scorer's DIMENSION_LABELS order (ADLI for categories 1-6,
+            LeTCI for category 7).
+        """
+        self._validate_table_categories(table)
+
+        breakdown = self.adli_scorer.get_diagnostic_breakdown_batch(table)
+        results_rows = table.results_mask
+        if results_rows.any():
+            breakdown[results_rows] = self.letci_scorer.get_diagnostic_breakdown_batch(
+                table
+            )[results_rows]
+
+        variance = np.var(table.indicators, axis=1)
+
+        records = np.empty(len(table), dtype=ITEM_RESULT_DTYPE)
+        records['org_id'] = table.org_id
+        records['category'] = table.category
+        records['item'] = table.item
+        records['score'] = breakdown[:, 4]
+        records['confidence'] = 1.0 - np.minimum(variance, 1.0)
+        records['breakdown'] = breakdown
+        return records
+
+    @instrumented('item_results', items=_table_rows)
+    def compute_item_results(self, table: ItemTable) -> ScoreResultSet:
+        """
+        Score every item of a table into an array-backed ScoreResultSet.
+
+        Bulk counterpart of compute_item_score: rows behave like the
+        ScoreResult it returns, but no per-item objects are allocated until a
+        row is accessed.
+
+        Args:
+            table: Items with normalized indicators
+
+        Returns:
+            ScoreResultSet aligned with the table rows
+        """
+        return ScoreResultSet.from_records(self.compute_item_score_batch(table))
+
+    @instrumented('item_score_table', items=_table_rows)
+    def score_item_table(self, table: ItemTable) -> ItemTable:
+        """
+        Score every item of a columnar ItemTable.
+
+        Process rows (categories 1-6) are scored with ADLI and results rows
+        (category 7) with LeTCI, each in a single vectorized pass.
+
+        Args:
+            table: Items with normalized indicators
+
+        Returns:
+            ItemTable sharing the input columns, with the score column filled
+        """
+        self._validate_table_categories(table)
+
+        scores = self.adli_scorer.compute_score_batch(table)
+        results_rows = table.results_mask
+        if results_rows.any():
+            scores[results_rows] = self.letci_scorer.compute_score_batch(table)[results_rows]
+
+        return table.with_scores(scores)
+
+    @instrumented('category_score', items=_category_items)
     def compute_category_score(
         self,
         category: int,
@@ -185,6 +507,30 @@ class OrganizationalScorer:
             confidence=np.mean([1.0] * len(item_scores))  # Simplified
         )
 
+    @instrumented('rollup', items=_table_rows)
+    def compute_rollups(
+        self,
+        table: ItemTable,
+        item_weights: Optional[np.ndarray] = None
+    ) -> RollupResult:
+        """
+        Roll scored items up to every category and organization score at once.
+
+        Args:
+            table: Scored items (see score_item_table), possibly many orgs
+            item_weights: Optional (N,) item weights summing to 1.0 per
+                          (org, category); equal weights if None
+
+        Returns:
+            RollupResult with category and organization scores
+        """
+        return rollup_scores(
+            table.score, table.category, table.org_id,
+            item_weights=item_weights,
+            category_weights=self.category_weights
+        )
+
+    @instrumented('org_score')
     def compute_organizational_score(
         self,
         category_scores: Dict[int, float]
@@ -214,6 +560,7 @@ class OrganizationalScorer:
             confidence=self._compute_org_confidence(category_scores)
         )
 
+    @instrumented('ihi')
     def compute_integration_health_index(
         self,
         category_scores: Dict[int, float]
@@ -239,57 +586,80 @@ class OrganizationalScorer:
 
         return np.mean(coherences) if coherences else 0.0
 
+    @instrumented('ihi_batch', items=_matrix_rows)
+    def compute_integration_health_index_batch(self, score_matrix: np.ndarray) -> np.ndarray:
+        """
+        Compute the IHI of many organizations with one sparse product.
+
+        Args:
+            score_matrix: (orgs × 7) category scores, NaN for missing categories
+
+        Returns:
+            (orgs,) IHI values in [0, 1]; edges with a missing category are
+            skipped, and organizations without present edges get 0.0
+        """
+        return self.integration_graph.health(score_matrix)
+
+    @instrumented('gap_analysis', items=_gap_items)
     def compute_gap_analysis(
         self,
-        current_scores: Dict[int, Dict[int, float]],
-        target_scores: Dict[int, Dict[int, float]],
-        criticality: Optional[Dict[Tuple[int, int], float]] = None,
-        risk: Optional[Dict[Tuple[int, int], float]] = None
+        current_scores: Union[Dict[int, Dict[int, float]], ItemTable],
+        target_scores: Optional[Dict[int, Dict[int, float]]] = None,
+        criticality: Optional[Union[Dict[Tuple[int, int], float], np.ndarray]] = None,
+        risk: Optional[Union[Dict[Tuple[int, int], float], np.ndarray]] = None,
+        top_k: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Compute gap analysis with prioritization.
 
         Args:
-            current_scores: {category: {item: score}}
-            target_scores: {category: {item: target}}
-            criticality: Optional criticality weights [0,1]
-            risk: Optional risk factors [0,1]
+            current_scores: {category: {item: score}}, or a scored ItemTable
+                            whose target column supplies the targets
+            target_scores: {category: {item: target}}; missing targets default
+                           to 100 (ignored for ItemTable input)
+            criticality: Optional criticality weights [0,1], keyed by
+                         (category, item) or aligned with ItemTable rows
+            risk: Optional risk factors [0,1], keyed like criticality
+            top_k: Optional number of highest-priority rows to return; avoids
+                   sorting the full table
 
         Returns:
-            DataFrame with gap analysis results
+            DataFrame with gap analysis results, sorted by descending priority.
+            ItemTable input adds a leading 'org_id' column.
         """
-        gaps = []
-
-        for category, items in current_scores.items():
-            for item, current in items.items():
-                target = target_scores.get(category, {}).get(item, 100.0)
-                gap = max(0, target - current)
-
-                # Default criticality and risk
-                crit = criticality.get((category, item), 0.5) if criticality else 0.5
-                risk_val = risk.get((category, item), 0.5) if risk else 0.5
-
-                priority = gap * crit * risk_val
-
-                gaps.append({
-                    'category': category,
-                    'item': item,
-                    'current_score': current,
-                    'target_score': target,
-                    'gap': gap,
-                    'criticality': crit,
-                    'risk': risk_val,
-                    'priority': priority,
-                    'status': 'Critical' if gap > 20 else 'Monitor' if gap > 10 else 'On Track'
-                })
-
-        df = pd.DataFrame(gaps)
-        return df.sort_values('priority', ascending=False).reset_index(drop=True)
-
-    def _compute_confidence(self, indicators: Dict[str, float]) -> float:
-        """Compute confidence score based on indicator variance."""
-        values = list(indicators.values())
-        variance = np.var(values)
+        if isinstance(current_scores, ItemTable):
+            table = current_scores
+            category, item, current = table.category, table.item, table.score
+            target, org_id = table.target, table.org_id
+        else:
+            rows = [
+                (cat, item, score)
+                for cat, items in current_scores.items()
+                for item, score in items.items()
+            ]
+            if not rows:
+                return pd.DataFrame(columns=GAP_COLUMNS)
+
+            category, item, current = (np.array(column) for column in zip(*rows))
+            target_scores = target_scores or {}
+            target = np.array([
+                target_scores.get(cat, {}).get(it, 100.0)
+                for cat, it, _ in rows
+            ], dtype=np.float64)
+            org_id = None
+
+        return gap_frame(
+            category, item, current, target,
+            criticality=lookup_pairs(criticality, category, item, DEFAULT_CRITICALITY),
+            risk=lookup_pairs(risk, category, item, DEFAULT_RISK),
+            top_k=top_k,
+            org_id=org_id
+        )
+
+    def _compute_confidence(self, values: List[float]) -> float:
+        """Compute confidence score based on the variance of the scored indicators."""
+        mean = sum(values) / len(values)
+        variance = sum((v - mean) ** 2 for v in values) / len(values)
         # Lower variance = higher confidence
         return 1.0 - min(variance, 1.0)
 
@@ -299,6 +669,7 @@ class OrganizationalScorer:
         variance = np.var(values)
         return 1.0 - min(variance / 1000, 1.0)  # Scale for 0-100 scores
 
+    @instrumented('scorecard')
     def generate_scorecard(
         self,
         category_scores: Dict[int, float],
@@ -320,50 +691,174 @@ class OrganizationalScorer:
             'organizational_score': org_result.score,
             'confidence': org_result.confidence,
             'category_scores': category_scores,
-            'category_names': {
-                1: 'Leadership',
-                2: 'Strategy',
-                3: 'Customers',
-                4: 'Measurement',
-                5: 'Workforce',
-                6: 'Operations',
-                7: 'Results'
-            }
+            'category_names': CATEGORY_NAMES.copy()
         }
 
         if include_ihi:
             ihi = self.compute_integration_health_index(category_scores)
             scorecard['integration_health_index'] = round(ihi, 3)
-            scorecard['ihi_interpretation'] = self._interpret_ihi(ihi)
+            scorecard['ihi_interpretation'] = self.interpret_ihi(ihi)
 
         # Add maturity level
-        scorecard['maturity_level'] = self._compute_maturity_level(org_result.score)
+        scorecard['maturity_level'] = self.maturity_level(org_result.score)
+
+        return scorecard
+
+    @instrumented('scorecard_batch', items=_matrix_rows)
+    def generate_scorecard_batch(
+        self,
+        score_matrix: np.ndarray,
+        org_ids: Optional[np.ndarray] = None,
+        include_ihi: bool = True
+    ) -> pd.DataFrame:
+        """
+        Generate scorecards for many organizations at once.
+
+        Vectorized equivalent of generate_scorecard. Missing categories are
+        NaN and are skipped like absent keys of ``category_scores``. Maturity
+        and IHI bands are ordered categoricals, so they can be compared and
+        grouped without repeating label strings per row.
+
+        Args:
+            score_matrix: (orgs × 7) category scores; column c - 1 holds
+                          category c (e.g. RollupResult.category_matrix())
+            org_ids: Optional (orgs,) identifiers; defaults to 0..orgs-1
+            include_ihi: Include Integration Health Index columns
+
+        Returns:
+            DataFrame with one row per organization and columns org_id,
+            organizational_score, confidence, [integration_health_index,
+            ihi_interpretation,] maturity_level
+
+        Raises:
+            ValueError: If the matrix is not (orgs × 7) or org_ids has the
+                        wrong length.
+
+        Example:
+            >>> scorer = OrganizationalScorer()
+            >>> frame = scorer.generate_scorecard_batch(np.array([
+            ...     [75, 65, 82, 70, 75, 70, 78],
+            ...     [92, 90, 95, 91, 93, 90, 94]
+            ... ]))
+            >>> frame['maturity_level'].tolist()
+            ['Developing - Early systematic approach', 'Advanced - World-class performance']
+        """
+        matrix = np.asarray(score_matrix, dtype=np.float64)
+        n_categories = len(CATEGORY_NAMES)
+        if matrix.ndim != 2 or matrix.shape[1] != n_categories:
+            raise ValueError(
+                f"Score matrix must have shape (orgs, {n_categories}), got {matrix.shape}"
+            )
+        n_orgs = len(matrix)
+        org_ids = np.arange(n_orgs) if org_ids is None else np.asarray(org_ids)
+        if len(org_ids) != n_orgs:
+            raise ValueError(f"Expected {n_orgs} org_ids, got {len(org_ids)}")
+
+        present = ~np.isnan(matrix)
+        filled = np.where(present, matrix, 0.0)
+        weights = np.array([self.category_weights[c] for c in CATEGORY_NAMES])
+        org_score = np.round(filled @ weights, 2)
+
+        # Population variance over present categories (as np.var in the scalar path)
+        count = present.sum(axis=1)
+        nonempty = count > 0
+        mean = np.divide(filled.sum(axis=1), count, out=np.full(n_orgs, np.nan), where=nonempty)
+        squared = np.where(present, matrix - mean[:, None], 0.0) ** 2
+        variance = np.divide(
+            squared.sum(axis=1), count, out=np.full(n_orgs, np.nan), where=nonempty
+        )
+
+        scorecard = pd.DataFrame({
+            'org_id': org_ids,
+            'organizational_score': org_score,
+            'confidence': 1.0 - np.minimum(variance / 1000, 1.0)
+        })
+
+        if include_ihi:
+            ihi = self.integration_graph.health(matrix)
+            scorecard['integration_health_index'] = np.round(ihi, 3)
+            scorecard['ihi_interpretation'] = _band_categorical(
+                ihi, IHI_THRESHOLDS, IHI_INTERPRETATIONS
+            )
 
+        scorecard['maturity_level'] = _band_categorical(
+            org_score, MATURITY_THRESHOLDS, MATURITY_LEVELS
+        )
         return scorecard
 
+    def interpret_ihi(self, ihi: float) -> str:
+        """Interpretation band of an Integration Health Index; NaN reads as Poor."""
+        return IHI_INTERPRETATIONS[_band_index(ihi, IHI_THRESHOLDS)]
+
+    def maturity_level(self, score: float) -> str:
+        """Maturity level of an organizational score; NaN reads as Initial."""
+        return MATURITY_LEVELS[_band_index(score, MATURITY_THRESHOLDS)]
+
     def _interpret_ihi(self, ihi: float) -> str:
         """Interpret IHI value."""
-        if ihi >= 0.9:
-            return "Excellent - Strong cross-category alignment"
-        elif ihi >= 0.8:
-            return "Good - Moderate alignment with minor gaps"
-        elif ihi >= 0.7:
-            return "Fair - Some alignment issues need attention"
-        else:
-            return "Poor - Significant alignment gaps require intervention"
+        return self.interpret_ihi(ihi)
 
     def _compute_maturity_level(self, score: float) -> str:
         """Compute organizational maturity level."""
-        if score >= 90:
-            return "Advanced - World-class performance"
-        elif score >= 75:
-            return "Mature - Strong systematic approach"
-        elif score >= 60:
-            return "Developing - Early systematic approach"
-        elif score >= 40:
-            return "Emerging - Beginning systematic approach"
-        else:
-            return "Initial - Reactive approach"
+        return self.maturity_level(score)
+
+
+def _band_index(value: float, thresholds: Tuple[float, ...]) -> int:
+    """Band of a scalar value; NaN falls in the lowest band."""
+    return 0 if np.isnan(value) else bisect_right(thresholds, value)
+
+
+def _band_categorical(
+    values: np.ndarray,
+    thresholds: Tuple[float, ...],
+    labels: Tuple[str, ...]
+) -> pd.Categorical:
+    """Assign each value to its threshold band as an ordered categorical."""
+    codes = np.digitize(values, thresholds)
+    codes[np.isnan(values)] = 0
+    return pd.Categorical.from_codes(codes, categories=list(labels), ordered=True)
+
+
+@lru_cache(maxsize=32)
+def _category_graph(edges: Tuple[Tuple[int, int], ...]) -> IntegrationGraph:
+    """Compile each distinct category edge list once."""
+    return IntegrationGraph.from_categories(edges)
+
+
+@lru_cache(maxsize=128)
+def _organizational_scorer_for(
+    category_weights: CategoryWeights,
+    adli_weights: ADLIWeights,
+    letci_weights: LeTCIWeights
+) -> OrganizationalScorer:
+    """Build one shared scorer per distinct weight combination."""
+    return OrganizationalScorer(category_weights, adli_weights, letci_weights)
+
+
+def get_organizational_scorer(
+    category_weights: Optional[Union[Dict[int, float], CategoryWeights]] = None,
+    adli_weights: Optional[Union[Dict[str, float], ADLIWeights]] = None,
+    letci_weights: Optional[Union[Dict[str, float], LeTCIWeights]] = None
+) -> OrganizationalScorer:
+    """
+    Return a process-wide shared OrganizationalScorer for the given weights.
+
+    Weights may be dicts or compiled weight objects; identical weights map to
+    the same instance. Shared scorers expose read-only weights and cache.
+
+    Args:
+        category_weights: Optional category weights
+        adli_weights: Optional ADLI weights
+        letci_weights: Optional LeTCI weights
+
+    Returns:
+        Shared OrganizationalScorer instance
+    """
+    return _organizational_scorer_for(
+        compile_weights(category_weights, CategoryWeights),
+        compile_weights(adli_weights, ADLIWeights),
+        compile_weights(letci_weights, LeTCIWeights)
+    )
 
 
 def create_sample_organization_data() -> Dict:
@@ -0,0 +1,213 @@
+"""
+Parallel Corpus Scoring
+=======================
+
+Process-pool driver for scoring large assessment corpora.
+
+A corpus is either a list of assessment JSON files (one organization each,
+numbered by position) or a large ItemTable. It is split into shards of
+``shard_size`` files or rows. Each shard is loaded, scored and reduced in a
+worker to
+
+    - partial (org, category) score totals and item counts, and
+    - its local top-K gap rows.
+
+Workers are initialized once with the compiled weights. The parent merges
+partial totals with rollup_from_totals and the local top-K lists in shard
+order, so results do not depend on the number of workers and ties are
+broken by corpus order, exactly as in the single-process gap analysis.
+
+Corpora with a single shard, or ``max_workers=1``, run in-process through the
+same code path.
+
+Example:
+    >>> from edcellence.data import load_sample_data
+    >>> table = ItemTable.from_organizations([load_sample_data()] * 4)
+    >>> result = score_corpus(table, shard_size=30, max_workers=1, top_k=3)
+    >>> result.rollup.org_score.tolist()
+    [74.9, 74.9, 74.9, 74.9]
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+
+from .gap_analysis import GAP_COLUMNS, top_k_indices
+from .item_table import ItemTable
+from .organizational_scoring import OrganizationalScorer, get_organizational_scorer
+from .rollup import RollupResult, rollup_from_totals, segment_totals
+from .weights import ADLIWeights, CategoryWeights, LeTCIWeights, compile_weights
+
+# Default shard sizes: files per shard and table rows per shard
+DEFAULT_FILES_PER_SHARD = 16
+DEFAULT_ROWS_PER_SHARD = 250_000
+
+# Scorer used by tasks in this process (set once per worker by _init_worker)
+_worker_scorer: Optional[OrganizationalScorer] = None
+
+
+@dataclass
+class ParallelScoringResult:
+    """Merged result of a sharded corpus scoring run.
+
+    Attributes:
+        rollup: Category and organization scores of every organization
+        gap: Top-K gap rows across the corpus (with a leading org_id column)
+        n_items: Number of scored items
+        n_shards: Number of shards
+        n_workers: Worker processes used (1 for in-process execution)
+    """
+    rollup: RollupResult
+    gap: pd.DataFrame
+    n_items: int
+    n_shards: int
+    n_workers: int
+
+
+@dataclass
+class _ShardResult:
+    """Partial aggregates returned by one shard."""
+    org_id: np.ndarray
+    category: np.ndarray
+    totals: np.ndarray
+    counts: np.ndarray
+    gap: pd.DataFrame
+    n_items: int
+
+
+def _init_worker(
+    category_weights: CategoryWeights,
+    adli_weights: ADLIWeights,
+    letci_weights: LeTCIWeights
+):
+    """Build the worker's scorer once from compiled weights."""
+    global _worker_scorer
+    _worker_scorer = get_organizational_scorer(category_weights, adli_weights, letci_weights)
+
+
+def _load_files(files: Sequence[Tuple[int, str]], targets_key: Optional[str]) -> ItemTable:
+    """Load (org_id, path) assessment files into one ItemTable."""
+    tables = []
+    for org_id, path in files:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        targets = data.get(targets_key) if targets_key else None
+        tables.append(ItemTable.from_organization_data(data, org_id, category_targets=targets))
+    return ItemTable.concat(tables)
+
+
+def _score_shard(
+    shard: Union[ItemTable, List[Tuple[int, str]]],
+    targets_key: Optional[str],
+    top_k: int
+) -> _ShardResult:
+    """Load, score and reduce one shard with the process's scorer."""
+    assert _worker_scorer is not None, "_init_worker must run before _score_shard"
+    table = shard if isinstance(shard, ItemTable) else _load_files(shard, targets_key)
+    scored = _worker_scorer.score_item_table(table)
+    org_id, category, totals, counts = segment_totals(scored.score, scored.category, scored.org_id)
+    return _ShardResult(
+        org_id=org_id,
+        category=category,
+        totals=totals,
+        counts=counts,
+        gap=_worker_scorer.compute_gap_analysis(scored, top_k=top_k),
+        n_items=len(scored)
+    )
+
+
+def _merge_gaps(gaps: List[pd.DataFrame], top_k: int) -> pd.DataFrame:
+    """Merge per-shard top-K frames; ties keep shard (i.e. corpus) order."""
+    gaps = [gap for gap in gaps if len(gap)]
+    if not gaps:
+        return pd.DataFrame(columns=['org_id'] + GAP_COLUMNS)
+    merged = pd.concat(gaps, ignore_index=True)
+    return merged.iloc[top_k_indices(merged['priority'].to_numpy(), top_k)].reset_index(drop=True)
+
+
+def _shards(
+    corpus: Union[ItemTable, Sequence[str]],
+    shard_size: Optional[int]
+) -> List[Union[ItemTable, List[Tuple[int, str]]]]:
+    """Split a corpus into contiguous shards."""
+    if isinstance(corpus, ItemTable):
+        size = shard_size or DEFAULT_ROWS_PER_SHARD
+        return [corpus.take(slice(start, start + size)) for start in range(0, len(corpus), size)]
+
+    files = [(org_id, os.fspath(path)) for org_id, path in enumerate(corpus)]
+    size = shard_size or DEFAULT_FILES_PER_SHARD
+    return [files[start:start + size] for start in range(0, len(files), size)]
+
+
+def score_corpus(
+    corpus: Union[ItemTable, Sequence[str]],
+    category_weights: Optional[Union[Dict[int, float], CategoryWeights]] = None,
+    adli_weights: Optional[Union[Dict[str, float], ADLIWeights]] = None,
+    letci_weights: Optional[Union[Dict[str, float], LeTCIWeights]] = None,
+    top_k: int = 100,
+    shard_size: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    targets_key: Optional[str] = None
+) -> ParallelScoringResult:
+    """
+    Score a sharded corpus in a process pool and merge rollups and gap top-K.
+
+    Args:
+        corpus: ItemTable with normalized indicators, or a sequence of
+                assessment JSON file paths (organization i = file i)
+        category_weights: Optional category weights (dict or CategoryWeights)
+        adli_weights: Optional ADLI weights (dict or ADLIWeights)
+        letci_weights: Optional LeTCI weights (dict or LeTCIWeights)
+        top_k: Number of highest-priority gap rows to keep
+        shard_size: Files or table rows per shard (DEFAULT_FILES_PER_SHARD /
+                    DEFAULT_ROWS_PER_SHARD if None)
+        max_workers: Worker processes; defaults to os.cpu_count(). With one
+                     worker or one shard the corpus is scored in-process.
+        targets_key: Optional JSON key of per-category targets used for gap
+                     analysis of file corpora (e.g. 'targets_2025')
+
+    Returns:
+        ParallelScoringResult
+
+    Raises:
+        ValueError: If the corpus is empty or indicators are invalid.
+    """
+    weights = (
+        compile_weights(category_weights, CategoryWeights),
+        compile_weights(adli_weights, ADLIWeights),
+        compile_weights(letci_weights, LeTCIWeights)
+    )
+    shards = _shards(corpus, shard_size)
+    if not shards:
+        raise ValueError("Corpus is empty")
+
+    n_workers = min(max_workers or os.cpu_count() or 1, len(shards))
+    if n_workers <= 1:
+        _init_worker(*weights)
+        results = [_score_shard(shard, targets_key, top_k) for shard in shards]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers, initializer=_init_worker, initargs=weights
+        ) as pool:
+            results = list(pool.map(
+                _score_shard, shards, [targets_key] * len(shards), [top_k] * len(shards)
+            ))
+
+    rollup = rollup_from_totals(
+        np.concatenate([r.org_id for r in results]),
+        np.concatenate([r.category for r in results]),
+        np.concatenate([r.totals for r in results]),
+        np.concatenate([r.counts for r in results]),
+        category_weights=weights[0].as_dict()
+    )
+    return ParallelScoringResult(
+        rollup=rollup,
+        gap=_merge_gaps([r.gap for r in results], top_k),
+        n_items=sum(r.n_items for r in results),
+        n_shards=len(shards),
+        n_workers=max(n_workers, 1)
+    )
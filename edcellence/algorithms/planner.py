@@ -0,0 +1,398 @@
+"""
+Budget-Constrained Improvement Planning
+=======================================
+
+Choose which item improvements to fund under a budget.
+
+Every item i of a scored ItemTable has an improvement cost c_i and an
+achievable indicator delta Δ_i. Funding it raises its item score by
+
+    g_i = 100 · w_i · (clip(x_i + Δ_i, 0, 1) - x_i)
+
+(ADLI weights for process items, LeTCI weights for results items), optionally
+capped at the item's gap to target as used by the gap analysis. Two
+objectives are supported:
+
+    'org_score'  Σ_o S_org[o]. Each item adds v_i = w_c · g_i / n_oc to its
+                 organization's score, so planning is a 0/1 knapsack:
+                 max Σ v_i x_i  s.t.  Σ c_i x_i ≤ budget.
+    'ihi'        Σ_o IHI[o]. Item gains interact through the category score
+                 differences on the integration graph, so the objective is
+                 not additive.
+
+Methods:
+    'exact'   org_score: knapsack DP over costs discretized to
+              ``cost_resolution`` (rounded up, so plans never exceed the
+              budget); ihi: exhaustive search over candidate subsets
+    'greedy'  org_score: best gain/cost order, compared with the best single
+              item; ihi: repeatedly fund the item with the best marginal IHI
+              gain per unit cost, re-evaluating only its organization
+    'auto'    'exact' while the DP table (items × budget units) or the subset
+              count stays within DP_MAX_CELLS / EXACT_IHI_MAX_ITEMS, else 'greedy'
+
+For org_score the LP relaxation (fractional knapsack) bound is reported as
+``upper_bound``, so the quality of a greedy plan can be checked.
+
+Category and organization scores are computed from unrounded item gains.
+
+Example:
+    >>> from edcellence.data import load_sample_data
+    >>> table = ItemTable.from_organization_data(load_sample_data())
+    >>> costs = np.full(len(table), 10.0)
+    >>> plan = plan_improvements(table, costs, deltas=0.1, budget=30)
+    >>> len(plan.items), plan.total_cost
+    (3, 30.0)
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+import numpy as np
+import pandas as pd
+
+from .item_table import ItemTable, indicator_weights
+from .organizational_scoring import OrganizationalScorer
+from .rollup import _category_weight_lookup, segment_index
+
+PLAN_OBJECTIVES = ('org_score', 'ihi')
+PLAN_METHODS = ('auto', 'exact', 'greedy')
+
+# Largest knapsack DP table (candidate items × budget units) solved exactly
+DP_MAX_CELLS = 20_000_000
+
+# Largest number of candidate items searched exhaustively for the IHI objective
+EXACT_IHI_MAX_ITEMS = 16
+
+
+@dataclass
+class ImprovementPlan:
+    """Improvements selected under a budget.
+
+    Attributes:
+        objective: 'org_score' or 'ihi'
+        method: Method actually used ('exact' or 'greedy')
+        selected: (N,) bool mask of funded items, aligned with the table rows
+        items: Funded items with cost, current, planned and target scores
+        total_cost: Cost of the funded items
+        gain: Increase of the objective summed over organizations
+        upper_bound: LP relaxation bound on the gain (org_score only, else NaN)
+        org_id: (O,) organization ids
+        before: (O,) objective value per organization before the plan
+        after: (O,) objective value per organization after the plan
+    """
+    objective: str
+    method: str
+    selected: np.ndarray
+    items: pd.DataFrame
+    total_cost: float
+    gain: float
+    upper_bound: float
+    org_id: np.ndarray
+    before: np.ndarray
+    after: np.ndarray
+
+    def org_frame(self) -> pd.DataFrame:
+        """Objective per organization before and after the plan."""
+        return pd.DataFrame({
+            'org_id': self.org_id,
+            'before': self.before,
+            'after': self.after,
+            'gain': self.after - self.before
+        })
+
+
+def _knapsack_dp(values: np.ndarray, units: np.ndarray, capacity: int) -> np.ndarray:
+    """Exact 0/1 knapsack over integer costs; returns a bool selection mask."""
+    best = np.zeros(capacity + 1)
+    take = np.zeros((len(values), capacity + 1), dtype=bool)
+    for j, (value, unit) in enumerate(zip(values, units)):
+        if unit == 0:
+            take[j] = True
+            best += value
+            continue
+        candidate = best[:-unit] + value
+        better = candidate > best[unit:]
+        take[j, unit:] = better
+        best[unit:] = np.where(better, candidate, best[unit:])
+
+    selected = np.zeros(len(values), dtype=bool)
+    remaining = capacity
+    for j in range(len(values) - 1, -1, -1):
+        if take[j, remaining]:
+            selected[j] = True
+            remaining -= units[j]
+    return selected
+
+
+def _ratio_order(values: np.ndarray, costs: np.ndarray) -> np.ndarray:
+    """Indices by descending value per unit cost (free items first), ties stable."""
+    with np.errstate(divide='ignore'):
+        ratio = np.where(costs > 0, values / costs, np.inf)
+    return np.argsort(-ratio, kind='stable')
+
+
+def _knapsack_greedy(values: np.ndarray, costs: np.ndarray, budget: float) -> np.ndarray:
+    """Greedy knapsack by value/cost, or the best single item if that is better."""
+    selected = np.zeros(len(values), dtype=bool)
+    remaining = budget
+    for j in _ratio_order(values, costs):
+        if costs[j] <= remaining:
+            selected[j] = True
+            remaining -= costs[j]
+
+    affordable = np.flatnonzero(costs <= budget)
+    if len(affordable):
+        single = affordable[np.argmax(values[affordable])]
+        if values[single] > values[selected].sum():
+            selected[:] = False
+            selected[single] = True
+    return selected
+
+
+def _lp_bound(values: np.ndarray, costs: np.ndarray, budget: float) -> float:
+    """Optimal value of the fractional knapsack (LP relaxation)."""
+    order = _ratio_order(values, costs)
+    cumulative = np.cumsum(costs[order])
+    whole = int(np.searchsorted(cumulative, budget, side='right'))
+    bound = values[order[:whole]].sum()
+    if whole < len(order):
+        spent = cumulative[whole - 1] if whole else 0.0
+        bound += values[order[whole]] * (budget - spent) / costs[order[whole]]
+    return float(bound)
+
+
+def _ihi_exact(
+    health: Callable[[np.ndarray], np.ndarray],
+    matrix: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray,
+    deltas: np.ndarray,
+    costs: np.ndarray,
+    budget: float
+) -> np.ndarray:
+    """Exhaustive search over all affordable subsets of candidate items."""
+    n = len(costs)
+    masks = (np.arange(2 ** n)[:, None] >> np.arange(n)) & 1
+    masks = masks[masks @ costs <= budget].astype(bool)
+
+    # Only organizations with candidates change; scatter every subset's category
+    # score increase into (subsets × those orgs × nodes)
+    orgs, rows = np.unique(rows, return_inverse=True)
+    matrix = matrix[orgs]
+    increase = np.zeros((len(masks),) + matrix.shape)
+    for j in range(n):
+        increase[masks[:, j], rows[j], columns[j]] += deltas[j]
+    candidates = matrix[None] + increase
+    totals = health(candidates.reshape(-1, matrix.shape[1])).reshape(len(masks), -1).sum(axis=1)
+    return masks[int(np.argmax(totals))]
+
+
+def _ihi_greedy(
+    health: Callable[[np.ndarray], np.ndarray],
+    matrix: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray,
+    deltas: np.ndarray,
+    costs: np.ndarray,
+    budget: float
+) -> np.ndarray:
+    """Fund the best marginal IHI gain per cost until nothing affordable helps."""
+    matrix = matrix.copy()
+    current = health(matrix)
+
+    def marginal(candidates: np.ndarray) -> np.ndarray:
+        updated = matrix[rows[candidates]]
+        updated[np.arange(len(candidates)), columns[candidates]] += deltas[candidates]
+        return health(updated) - current[rows[candidates]]
+
+    gains = marginal(np.arange(len(costs)))
+    selected = np.zeros(len(costs), dtype=bool)
+    remaining = budget
+    while True:
+        open_ = ~selected & (costs <= remaining) & (gains > 0)
+        if not open_.any():
+            break
+        with np.errstate(divide='ignore'):
+            ratio = np.where(costs > 0, gains / costs, np.inf)
+        j = int(np.argmax(np.where(open_, ratio, -np.inf)))
+
+        selected[j] = True
+        remaining -= costs[j]
+        org = rows[j]
+        matrix[org, columns[j]] += deltas[j]
+        current[org] = health(matrix[org])[0]
+
+        # Only candidates of the same organization change their marginal gain
+        same_org = np.flatnonzero((rows == org) & ~selected)
+        if len(same_org):
+            gains[same_org] = marginal(same_org)
+    return selected
+
+
+def plan_improvements(
+    table: ItemTable,
+    costs: np.ndarray,
+    deltas: Union[float, np.ndarray],
+    budget: float,
+    objective: str = 'org_score',
+    method: str = 'auto',
+    scorer: Optional[OrganizationalScorer] = None,
+    cost_resolution: float = 1.0,
+    cap_at_target: bool = False
+) -> ImprovementPlan:
+    """
+    Select item improvements maximizing the org score or IHI under a budget.
+
+    Args:
+        table: Items with normalized indicators; the target column supplies
+               gap-analysis targets (NaN defaults to 100)
+        costs: (N,) non-negative improvement cost per item
+        deltas: Achievable indicator increase, scalar or broadcastable to (N, 4)
+        budget: Total budget
+        objective: One of PLAN_OBJECTIVES
+        method: One of PLAN_METHODS
+        scorer: Scorer providing weights and the integration graph; defaults
+                to OrganizationalScorer()
+        cost_resolution: Cost unit of the exact org_score DP
+        cap_at_target: Limit each item's score gain to its gap to target
+
+    Returns:
+        ImprovementPlan
+
+    Raises:
+        ValueError: If the objective, method, costs, deltas or budget are
+                    invalid, or 'exact' is requested for an instance too large
+                    to solve exactly.
+    """
+    if objective not in PLAN_OBJECTIVES:
+        raise ValueError(f"objective must be one of {PLAN_OBJECTIVES}, got {objective!r}")
+    if method not in PLAN_METHODS:
+        raise ValueError(f"method must be one of {PLAN_METHODS}, got {method!r}")
+    if len(table) == 0:
+        raise ValueError("table has no items")
+    if not np.isfinite(budget) or budget < 0:
+        raise ValueError(f"budget must be a non-negative number, got {budget}")
+    if cost_resolution <= 0:
+        raise ValueError(f"cost_resolution must be positive, got {cost_resolution}")
+
+    n = len(table)
+    costs = np.asarray(costs, dtype=np.float64)
+    if costs.shape != (n,):
+        raise ValueError(f"Expected {n} costs, got shape {costs.shape}")
+    if not np.isfinite(costs).all() or (costs < 0).any():
+        raise ValueError("costs must be finite and non-negative")
+    deltas = np.broadcast_to(np.asarray(deltas, dtype=np.float64), (n, 4))
+    if not np.isfinite(deltas).all():
+        raise ValueError("deltas must be finite")
+
+    scorer = scorer or OrganizationalScorer()
+    scored = scorer.score_item_table(table)
+    current = scored.score
+    target = np.where(np.isnan(table.target), 100.0, table.target)
+
+    weights = indicator_weights(
+        table, scorer.adli_scorer.weight_vector, scorer.letci_scorer.weight_vector
+    )
+    improved = np.clip(table.indicators + deltas, 0.0, 1.0)
+    score_gain = ((improved - table.indicators) * weights).sum(axis=1)
+    if cap_at_target:
+        score_gain = np.minimum(score_gain, np.maximum(0.0, target - current))
+
+    # (org, category) segments and their organizations
+    category = table.category.astype(np.int64)
+    segment_org, segment_category, segment = segment_index(table.org_id, category)
+    counts = np.bincount(segment)
+    org_id, org_index = np.unique(segment_org, return_inverse=True)
+    rows = org_index[segment]
+    category_gain = score_gain / counts[segment]
+    category_score = np.bincount(segment, weights=current) / counts
+
+    candidates = np.flatnonzero(score_gain > 0)
+    selected = np.zeros(n, dtype=bool)
+    upper_bound = np.nan
+
+    if objective == 'org_score':
+        item_weight = _category_weight_lookup(scorer.category_weights, category)
+        values = item_weight * category_gain
+        before = np.bincount(
+            org_index, weights=_category_weight_lookup(scorer.category_weights, segment_category)
+            * category_score, minlength=len(org_id)
+        )
+
+        units = np.ceil(costs / cost_resolution - 1e-9).astype(np.int64)
+        capacity = int(np.floor(budget / cost_resolution + 1e-9))
+        candidates = candidates[units[candidates] <= capacity]
+        # The DP never needs more capacity than all candidates together
+        capacity = min(capacity, int(units[candidates].sum()))
+        exact_fits = len(candidates) * (capacity + 1) <= DP_MAX_CELLS
+        if costs[candidates].sum() <= budget:
+            # No candidates, or all of them fit: funding everything is optimal
+            method = 'exact' if method == 'auto' else method
+            chosen = np.ones(len(candidates), dtype=bool)
+        else:
+            if method == 'exact' and not exact_fits:
+                raise ValueError(
+                    f"Knapsack DP needs {len(candidates) * (capacity + 1)} cells, "
+                    f"more than DP_MAX_CELLS={DP_MAX_CELLS}; increase cost_resolution "
+                    f"or use method='greedy'"
+                )
+            method = 'exact' if method == 'auto' and exact_fits else method
+            method = 'greedy' if method == 'auto' else method
+
+            if method == 'exact':
+                chosen = _knapsack_dp(values[candidates], units[candidates], capacity)
+            else:
+                chosen = _knapsack_greedy(values[candidates], costs[candidates], budget)
+        selected[candidates[chosen]] = True
+        upper_bound = _lp_bound(values[candidates], costs[candidates], budget)
+        after = before + np.bincount(rows[selected], weights=values[selected],
+                                     minlength=len(org_id))
+    else:
+        graph = scorer.integration_graph
+        matrix = np.full((len(org_id), graph.n_nodes), np.nan)
+        matrix[org_index, segment_category - 1] = category_score
+        before = graph.health(matrix)
+
+        candidates = candidates[costs[candidates] <= budget]
+        exact_fits = len(candidates) <= EXACT_IHI_MAX_ITEMS
+        if method == 'exact' and not exact_fits:
+            raise ValueError(
+                f"Exhaustive IHI planning supports at most EXACT_IHI_MAX_ITEMS="
+                f"{EXACT_IHI_MAX_ITEMS} candidate items, got {len(candidates)}; "
+                f"use method='greedy'"
+            )
+        method = 'exact' if method == 'auto' and exact_fits else method
+        method = 'greedy' if method == 'auto' else method
+
+        if len(candidates) == 0:
+            chosen = np.zeros(0, dtype=bool)
+        else:
+            solve = _ihi_exact if method == 'exact' else _ihi_greedy
+            chosen = solve(graph.health, matrix, rows[candidates], category[candidates] - 1,
+                           category_gain[candidates], costs[candidates], budget)
+        selected[candidates[chosen]] = True
+        np.add.at(matrix, (rows[selected], category[selected] - 1), category_gain[selected])
+        after = graph.health(matrix)
+
+    funded = np.flatnonzero(selected)
+    items = pd.DataFrame({
+        'org_id': table.org_id[funded],
+        'category': table.category[funded],
+        'item': table.item[funded],
+        'cost': costs[funded],
+        'current_score': current[funded],
+        'planned_score': current[funded] + score_gain[funded],
+        'target_score': target[funded],
+        'score_gain': score_gain[funded]
+    })
+    return ImprovementPlan(
+        objective=objective,
+        method=method,
+        selected=selected,
+        items=items,
+        total_cost=float(costs[selected].sum()),
+        gain=float((after - before).sum()),
+        upper_bound=upper_bound,
+        org_id=org_id,
+        before=before,
+        after=after
+    )
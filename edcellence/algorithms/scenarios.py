@@ -0,0 +1,353 @@
+"""
+What-If Scenarios
+=================
+
+Batched evaluation of sparse indicator-delta scenarios against a compiled
+baseline.
+
+A ScenarioEngine scores an ItemTable once and caches the baseline item
+scores, (org, category) segment scores, organization scores, IHI and gap
+priorities. A scenario is a small set of indicator deltas, e.g. "Deployment
+in Strategy rises by 0.15":
+
+    Scenario('deploy', {'P_D': 0.15}, category=2)
+
+All scenarios of a batch are flattened into one sparse (scenarios × items)
+matrix of item score changes,
+
+    ΔS_item[s,i] = 100 · Σ_k w[i,k] · (clip(x[i,k] + Δ[s,i,k], 0, 1) - x[i,k])
+    ΔS_cat       = ΔS_item · A          (A: items → segment means, sparse)
+    ΔS_org       = ΔS_cat · C           (C: category weights per org, sparse)
+
+so only segments touched by a scenario carry a change. IHI is recomputed only
+for the (scenario, organization) pairs whose category scores change, and gap
+priorities only for changed items.
+
+Deltas are applied to the rounded baseline item scores without re-rounding,
+so scenario scores may differ from a full re-run by about 0.01.
+
+Example:
+    >>> from edcellence.data import load_sample_data
+    >>> engine = ScenarioEngine(ItemTable.from_organization_data(load_sample_data()))
+    >>> result = engine.run([Scenario('deploy', {'P_D': 0.15}, category=2)])
+    >>> round(float(result.org_scores[0, 0] - engine.org_score[0]), 3)
+    0.643
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .gap_analysis import DEFAULT_CRITICALITY, DEFAULT_RISK, classify_gap_status, lookup_pairs
+from .indicator_arrays import ADLI_INDICATOR_KEYS, LETCI_INDICATOR_KEYS
+from .item_table import ItemTable, indicator_weights
+from .organizational_scoring import OrganizationalScorer
+from .rollup import _category_weight_lookup, segment_index
+
+
+@dataclass
+class Scenario:
+    """Indicator deltas applied to every item matching the selectors.
+
+    Attributes:
+        name: Scenario label
+        deltas: {indicator key: delta}; ADLI keys (P_*) apply to process items
+                and LeTCI keys (R_*) to results items
+        category: Optional category selector
+        item: Optional item selector
+        org_id: Optional organization selector
+    """
+    name: str
+    deltas: Dict[str, float] = field(default_factory=dict)
+    category: Optional[int] = None
+    item: Optional[int] = None
+    org_id: Optional[int] = None
+
+
+@dataclass
+class ScenarioResult:
+    """Scores of a batch of scenarios.
+
+    Attributes:
+        names: (S,) scenario names
+        org_id: (O,) organization ids
+        org_scores: (S, O) organizational scores
+        ihi: (S, O) Integration Health Index
+        category_org, category: (G,) organization and category of each segment
+        baseline_category_scores: (G,) baseline segment scores
+        category_delta: Sparse (S, G) change of every segment score
+        gaps: Gap rows of every changed item
+        baseline_org_scores, baseline_ihi: (O,) baseline values
+    """
+    names: List[str]
+    org_id: np.ndarray
+    org_scores: np.ndarray
+    ihi: np.ndarray
+    category_org: np.ndarray
+    category: np.ndarray
+    baseline_category_scores: np.ndarray
+    category_delta: sparse.csr_matrix
+    gaps: pd.DataFrame
+    baseline_org_scores: np.ndarray
+    baseline_ihi: np.ndarray
+
+    def category_scores(self, scenario: int) -> np.ndarray:
+        """Dense (G,) segment scores of one scenario."""
+        return self.baseline_category_scores + self.category_delta[scenario].toarray()[0]
+
+    def category_frame(self) -> pd.DataFrame:
+        """Changed (org, category) segments of every scenario."""
+        delta = self.category_delta.tocoo()
+        return pd.DataFrame({
+            'scenario': np.asarray(self.names, dtype=object)[delta.row],
+            'org_id': self.category_org[delta.col],
+            'category': self.category[delta.col],
+            'baseline': self.baseline_category_scores[delta.col],
+            'score': self.baseline_category_scores[delta.col] + delta.data,
+            'delta': delta.data
+        })
+
+    def org_frame(self) -> pd.DataFrame:
+        """Organization score and IHI of every (scenario, organization)."""
+        n_scenarios, n_orgs = self.org_scores.shape
+        return pd.DataFrame({
+            'scenario': np.repeat(np.asarray(self.names, dtype=object), n_orgs),
+            'org_id': np.tile(self.org_id, n_scenarios),
+            'org_score': self.org_scores.ravel(),
+            'org_delta': (self.org_scores - self.baseline_org_scores).ravel(),
+            'ihi': self.ihi.ravel(),
+            'ihi_delta': (self.ihi - self.baseline_ihi).ravel()
+        })
+
+
+class ScenarioEngine:
+    """
+    Compiled baseline for batched what-if scenarios.
+
+    Attributes:
+        item_score: (N,) baseline item scores
+        org_id: (O,) organization ids
+        org_score: (O,) baseline organizational scores
+        ihi: (O,) baseline Integration Health Index
+        priority: (N,) baseline gap priorities
+    """
+
+    def __init__(
+        self,
+        table: ItemTable,
+        scorer: Optional[OrganizationalScorer] = None,
+        criticality: Optional[Union[Dict, np.ndarray]] = None,
+        risk: Optional[Union[Dict, np.ndarray]] = None
+    ):
+        """
+        Compile the baseline.
+
+        Args:
+            table: Items with normalized indicators; the target column supplies
+                   gap targets (NaN defaults to 100)
+            scorer: Scorer providing weights and the integration graph;
+                    defaults to OrganizationalScorer()
+            criticality: Optional criticality per item, keyed by (category, item)
+                         or aligned with the table rows
+            risk: Optional risk per item, keyed like criticality
+
+        Raises:
+            ValueError: If the table is empty or indicators are invalid.
+        """
+        if len(table) == 0:
+            raise ValueError("table has no items")
+
+        self.scorer = scorer or OrganizationalScorer()
+        self.table = table
+        self.item_score = self.scorer.score_item_table(table).score
+        n = len(table)
+
+        self._weights = indicator_weights(
+            table, self.scorer.adli_scorer.weight_vector, self.scorer.letci_scorer.weight_vector
+        )
+
+        # items → (org, category) segment means → category-weighted org sums
+        self.category_org, self.category, self._segment = segment_index(
+            table.org_id, table.category
+        )
+        n_segments = len(self.category)
+        counts = np.bincount(self._segment)
+        self._item_to_segment = sparse.csr_matrix(
+            (1.0 / counts[self._segment], (np.arange(n), self._segment)),
+            shape=(n, n_segments)
+        )
+        self.org_id, self._segment_org = np.unique(self.category_org, return_inverse=True)
+        self._segment_to_org = sparse.csr_matrix(
+            (_category_weight_lookup(self.scorer.category_weights, self.category),
+             (np.arange(n_segments), self._segment_org)),
+            shape=(n_segments, len(self.org_id))
+        )
+
+        self.category_score = np.bincount(self._segment, weights=self.item_score) / counts
+        self.org_score = self._segment_to_org.T @ self.category_score
+
+        graph = self.scorer.integration_graph
+        self._category_matrix = np.full((len(self.org_id), graph.n_nodes), np.nan)
+        self._category_matrix[self._segment_org, self.category - 1] = self.category_score
+        self.ihi = graph.health(self._category_matrix)
+
+        self.target = np.where(np.isnan(table.target), 100.0, table.target)
+        self._factor = np.ones(n)
+        for values, default in ((criticality, DEFAULT_CRITICALITY), (risk, DEFAULT_RISK)):
+            aligned = lookup_pairs(values, table.category, table.item, default)
+            self._factor = self._factor * (default if aligned is None else aligned)
+        self.priority = np.maximum(0.0, self.target - self.item_score) * self._factor
+
+    def _scenario_deltas(self, scenario: Scenario) -> tuple:
+        """Resolve a scenario's selectors to (rows, columns, deltas)."""
+        table = self.table
+        mask = np.ones(len(table), dtype=bool)
+        for selector, value in ((table.category, scenario.category),
+                                (table.item, scenario.item),
+                                (table.org_id, scenario.org_id)):
+            if value is not None:
+                mask &= selector == value
+
+        rows, columns, deltas = [], [], []
+        for key, delta in scenario.deltas.items():
+            if key in ADLI_INDICATOR_KEYS:
+                selected = np.flatnonzero(mask & table.process_mask)
+                column = ADLI_INDICATOR_KEYS.index(key)
+            elif key in LETCI_INDICATOR_KEYS:
+                selected = np.flatnonzero(mask & table.results_mask)
+                column = LETCI_INDICATOR_KEYS.index(key)
+            else:
+                raise ValueError(f"Unknown indicator {key!r} in scenario {scenario.name!r}")
+            rows.append(selected)
+            columns.append(np.full(len(selected), column))
+            deltas.append(np.full(len(selected), float(delta)))
+
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+        return np.concatenate(rows), np.concatenate(columns), np.concatenate(deltas)
+
+    def run(self, scenarios: Sequence[Scenario]) -> ScenarioResult:
+        """
+        Evaluate a batch of scenarios.
+
+        Args:
+            scenarios: Scenarios to evaluate independently of each other
+
+        Returns:
+            ScenarioResult
+
+        Raises:
+            ValueError: If a scenario references an unknown indicator.
+        """
+        resolved = [self._scenario_deltas(scenario) for scenario in scenarios]
+        index = np.repeat(np.arange(len(resolved)), [len(r[0]) for r in resolved])
+        if len(index):
+            rows, columns, deltas = (np.concatenate(parts) for parts in zip(*resolved))
+        else:
+            rows = columns = np.empty(0, dtype=np.int64)
+            deltas = np.empty(0)
+        return self.run_deltas(index, rows, columns, deltas,
+                               names=[scenario.name for scenario in scenarios])
+
+    def run_deltas(
+        self,
+        scenario: np.ndarray,
+        row: np.ndarray,
+        column: np.ndarray,
+        delta: np.ndarray,
+        names: Optional[Sequence[str]] = None
+    ) -> ScenarioResult:
+        """
+        Evaluate scenarios given as flat (scenario, row, column, delta) entries.
+
+        Entries for the same (scenario, row, column) are summed before
+        clipping.
+
+        Args:
+            scenario: (E,) scenario index of each entry
+            row: (E,) table row
+            column: (E,) indicator column (0-3, in INDICATOR_KEYS order)
+            delta: (E,) indicator change
+            names: Optional scenario names; defaults to 'scenario_<i>'
+
+        Returns:
+            ScenarioResult
+        """
+        scenario = np.asarray(scenario, dtype=np.int64)
+        row = np.asarray(row, dtype=np.int64)
+        column = np.asarray(column, dtype=np.int64)
+        delta = np.asarray(delta, dtype=np.float64)
+        n = len(self.table)
+        n_scenarios = len(names) if names is not None else int(scenario.max(initial=-1)) + 1
+        names = list(names) if names is not None else [f'scenario_{i}' for i in range(n_scenarios)]
+
+        # Sum duplicate entries, then clip each changed indicator once
+        key, inverse = np.unique((scenario * n + row) * 4 + column, return_inverse=True)
+        total = np.bincount(inverse, weights=delta, minlength=len(key))
+        cell, column = np.divmod(key, 4)
+        cell_scenario, cell_row = np.divmod(cell, n)
+        x = self.table.indicators[cell_row, column]
+        score_change = self._weights[cell_row, column] * (np.clip(x + total, 0.0, 1.0) - x)
+
+        item_delta = sparse.csr_matrix(
+            (score_change, (cell_scenario, cell_row)), shape=(n_scenarios, n)
+        )
+        item_delta.sum_duplicates()
+        category_delta = (item_delta @ self._item_to_segment).tocsr()
+        category_delta.eliminate_zeros()
+        category_delta.sort_indices()
+        org_scores = self.org_score + (category_delta @ self._segment_to_org).toarray()
+
+        # IHI only for (scenario, org) pairs with changed category scores
+        ihi = np.tile(self.ihi, (n_scenarios, 1))
+        changed = category_delta.tocoo()
+        if changed.nnz:
+            pair_key, pair = np.unique(
+                changed.row * len(self.org_id) + self._segment_org[changed.col],
+                return_inverse=True
+            )
+            pair_scenario, pair_org = np.divmod(pair_key, len(self.org_id))
+            matrix = self._category_matrix[pair_org]
+            np.add.at(matrix, (pair, self.category[changed.col] - 1), changed.data)
+            ihi[pair_scenario, pair_org] = self.scorer.integration_graph.health(matrix)
+
+        return ScenarioResult(
+            names=names,
+            org_id=self.org_id,
+            org_scores=org_scores,
+            ihi=ihi,
+            category_org=self.category_org,
+            category=self.category,
+            baseline_category_scores=self.category_score,
+            category_delta=category_delta,
+            gaps=self._changed_gaps(item_delta, names),
+            baseline_org_scores=self.org_score,
+            baseline_ihi=self.ihi
+        )
+
+    def _changed_gaps(self, item_delta: sparse.csr_matrix, names: List[str]) -> pd.DataFrame:
+        """Gap rows of every item whose score changes, by scenario then priority."""
+        changed = item_delta.tocoo()
+        keep = changed.data != 0
+        scenario, row, delta = changed.row[keep], changed.col[keep], changed.data[keep]
+
+        score = self.item_score[row] + delta
+        gap = np.maximum(0.0, self.target[row] - score)
+        priority = gap * self._factor[row]
+        order = np.lexsort((row, -priority, scenario))
+
+        table = self.table
+        return pd.DataFrame({
+            'scenario': np.asarray(names, dtype=object)[scenario[order]],
+            'org_id': table.org_id[row[order]],
+            'category': table.category[row[order]],
+            'item': table.item[row[order]],
+            'current_score': self.item_score[row[order]],
+            'scenario_score': score[order],
+            'target_score': self.target[row[order]],
+            'priority_before': self.priority[row[order]],
+            'priority_after': priority[order],
+            'status': classify_gap_status(gap[order])
+        })
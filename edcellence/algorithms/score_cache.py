@@ -0,0 +1,175 @@
+"""
+Item Score Cache
+================
+
+Optional bounded LRU memoization of item scores for the ADLI, LeTCI and
+organizational scorers.
+
+Rubric-based assessments produce many identical indicator vectors, so scores
+are cached under the key
+
+    (weights fingerprint, scoring method, quantized indicator tuple)
+
+where indicators are rounded to ``decimals`` places (or used exactly when
+``decimals`` is None). Entries are computed from the quantized indicators, so
+every input mapping to a key gets the same entry regardless of call order.
+Each entry holds the item score and its dimension
+breakdown. Lookups are thread-safe. Setting ``enabled = False`` (or using
+``disabled()``) bypasses the cache entirely for benchmarking.
+
+Example:
+    >>> from edcellence.algorithms import ADLIScorer
+    >>> cache = ScoreCache(maxsize=1024)
+    >>> scorer = ADLIScorer(cache=cache)
+    >>> indicators = {'P_A': 0.75, 'P_D': 0.45, 'P_L': 0.60, 'P_I': 0.55}
+    >>> scorer.compute_score(indicators), scorer.compute_score(indicators)
+    (59.0, 59.0)
+    >>> cache.stats()['hits'], cache.stats()['misses']
+    (1, 1)
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class ScoreCache:
+    """
+    Thread-safe LRU cache of item score entries with hit/miss statistics.
+
+    Attributes:
+        maxsize: Maximum number of entries before the least recently used is evicted
+        decimals: Decimal places indicators are rounded to when building keys
+        enabled: If False, every lookup computes directly and nothing is recorded
+        hits, misses, evictions: Running counters since the last reset_stats()
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 65536,
+        decimals: Optional[int] = 9,
+        enabled: bool = True
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of cached entries (must be positive)
+            decimals: Indicator quantization used for keys; None keys on exact
+                      values, which skips rounding for pre-quantized rubric data
+            enabled: Start enabled or disabled
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self.enabled = enabled
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(
+        self,
+        fingerprint: Hashable,
+        method: str,
+        values: List[float],
+        compute: Callable[[List[float]], T]
+    ) -> T:
+        """
+        Return the cached entry for an indicator vector, computing it on a miss.
+
+        Args:
+            fingerprint: Hashable identity of the scorer weights
+            method: Scoring method ('ADLI' or 'LeTCI')
+            values: Validated indicator values in the scorer's key order
+            compute: Function producing the entry from the quantized values
+
+        Returns:
+            Cached or freshly computed entry. Entries are shared between
+            callers and must not be mutated.
+        """
+        if not self.enabled:
+            return compute(values)
+
+        if self.decimals is None:
+            quantized = tuple(values)
+        else:
+            quantized = tuple([round(v, self.decimals) for v in values])
+        key = (fingerprint, method, quantized)
+
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                return self._entries[key]
+
+        entry = compute(list(quantized))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Snapshot of the cache counters.
+
+        Returns:
+            Dict with hits, misses, evictions, size, maxsize and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def clear(self):
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        """Reset hit/miss/eviction counters."""
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    @contextmanager
+    def disabled(self) -> Iterator['ScoreCache']:
+        """Temporarily bypass the cache, e.g. for benchmarking."""
+        previous = self.enabled
+        self.enabled = False
+        try:
+            yield self
+        finally:
+            self.enabled = previous
+
+    def __repr__(self) -> str:
+        state = 'enabled' if self.enabled else 'disabled'
+        return f"ScoreCache(size={len(self)}, maxsize={self.maxsize}, {state})"
+
+
+def weights_fingerprint(weight_vector) -> Tuple[float, ...]:
+    """Hashable fingerprint of a compiled weight vector."""
+    return tuple(float(w) for w in weight_vector)
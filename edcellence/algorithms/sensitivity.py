@@ -0,0 +1,351 @@
+"""
+Weight Sensitivity Sweeps
+=========================
+
+Score a whole portfolio under thousands of alternative ADLI, LeTCI and
+category weightings at once and report how organizational scores, maturity
+bands and improvement priorities shift.
+
+Item and category scores are linear in the weights, so the portfolio is first
+reduced to the mean indicator vector of every (org, category) segment. For K
+weight sets the category scores then come from one matrix product per
+scoring method,
+
+    S_cat = 100 · M · Wᵀ           (segments × 4) · (4 × K)
+
+and organizational scores from a sparse segment → org sum of S_cat weighted
+by each set's category weights. Weight sets are processed in chunks of at
+most ``chunk_size`` sets and SWEEP_CHUNK_CELLS segment scores to bound
+memory. Scores are not rounded between stages, so
+they may differ from the rounded scalar pipeline by about 0.01.
+
+Candidate weights are projected onto the probability simplex, so arbitrary
+grids or random perturbations always yield valid weightings.
+
+Example:
+    >>> from edcellence.data import load_sample_data
+    >>> table = ItemTable.from_organization_data(load_sample_data())
+    >>> adli = sample_simplex_weights(1000, center=(0.30, 0.30, 0.20, 0.20), seed=0)
+    >>> result = sweep_weights(table, adli_weights=adli)
+    >>> result.org_scores.shape
+    (1000, 1)
+"""
+
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Optional, Sequence
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.stats import rankdata
+
+from .item_table import ItemTable
+from .rollup import segment_index
+from .organizational_scoring import MATURITY_THRESHOLDS, OrganizationalScorer
+
+# Upper bound on (weight sets × segments) score cells held per chunk
+SWEEP_CHUNK_CELLS = 4_000_000
+
+
+def project_to_simplex(weights: np.ndarray) -> np.ndarray:
+    """
+    Euclidean projection of each row onto the probability simplex.
+
+    Args:
+        weights: (K, d) candidate weight vectors (or a single (d,) vector)
+
+    Returns:
+        Array of the same shape with non-negative rows summing to 1
+    """
+    v = np.atleast_2d(np.asarray(weights, dtype=np.float64))
+    d = v.shape[1]
+    u = -np.sort(-v, axis=1)
+    css = np.cumsum(u, axis=1) - 1.0
+    positive = u - css / np.arange(1, d + 1) > 0
+    rho = d - 1 - np.argmax(positive[:, ::-1], axis=1)
+    theta = css[np.arange(len(v)), rho] / (rho + 1)
+    projected = np.maximum(v - theta[:, None], 0.0)
+    return projected.reshape(np.shape(weights))
+
+
+def simplex_grid(dims: int, step: float = 0.05) -> np.ndarray:
+    """
+    All weight vectors on a regular simplex grid.
+
+    Args:
+        dims: Number of weights
+        step: Grid spacing; 1/step must be an integer
+
+    Returns:
+        (K, dims) array of weight vectors summing to 1
+    """
+    n = int(round(1.0 / step))
+    if not np.isclose(n * step, 1.0):
+        raise ValueError(f"1/step must be an integer, got step={step}")
+
+    # Compositions of n into dims parts: choose dims - 1 bar positions among
+    # n + dims - 1 slots (stars and bars)
+    bars = np.array(list(combinations(range(n + dims - 1), dims - 1)), dtype=np.int64)
+    bars = bars.reshape(-1, dims - 1)
+    edges = np.column_stack([np.full(len(bars), -1), bars, np.full(len(bars), n + dims - 1)])
+    points = np.diff(edges, axis=1) - 1
+    return points / n
+
+
+def sample_simplex_weights(
+    n: int,
+    center: Sequence[float],
+    concentration: float = 100.0,
+    seed: Optional[int] = None
+) -> np.ndarray:
+    """
+    Random weight vectors around ``center`` from a Dirichlet distribution.
+
+    Args:
+        n: Number of weight sets
+        center: Mean weight vector (projected onto the simplex)
+        concentration: Higher values keep samples closer to ``center``
+        seed: Optional RNG seed
+
+    Returns:
+        (n, len(center)) array of weight vectors summing to 1
+    """
+    mean = project_to_simplex(np.asarray(center, dtype=np.float64))
+    alpha = np.maximum(mean * concentration, 1e-3)
+    return np.random.default_rng(seed).dirichlet(alpha, size=n)
+
+
+@dataclass
+class SweepResult:
+    """Organizational scores and priorities under K alternative weightings.
+
+    Attributes:
+        adli_weights, letci_weights: (K, 4) weight sets
+        category_weights: (K, 7) weight sets (column c - 1 is category c)
+        org_id: (O,) organization ids
+        baseline_org_scores: (O,) scores under the scorer's weights
+        org_scores: (K, O) scores under each weight set
+        maturity_codes: (K, O) maturity band index (see MATURITY_LEVELS)
+        baseline_maturity_codes: (O,) band index under the scorer's weights
+        top_priority: (K, O) category with the largest gap to target in each
+                      organization (0 if every category meets its target)
+        baseline_top_priority: (O,) top-priority category under the baseline
+        priority_top_k_overlap: (K,) share of the baseline top-K gaps that stay
+                                in each set's top-K
+    """
+    adli_weights: np.ndarray
+    letci_weights: np.ndarray
+    category_weights: np.ndarray
+    org_id: np.ndarray
+    baseline_org_scores: np.ndarray
+    org_scores: np.ndarray
+    maturity_codes: np.ndarray
+    baseline_maturity_codes: np.ndarray
+    top_priority: np.ndarray
+    baseline_top_priority: np.ndarray
+    priority_top_k_overlap: np.ndarray
+
+    def summary(self) -> pd.DataFrame:
+        """
+        One row per weight set describing the shift from the baseline.
+
+        Returns:
+            DataFrame with mean_shift, max_abs_shift, band_changes (number of
+            organizations changing maturity band), org_rank_correlation
+            (Spearman correlation of the organization ranking with the
+            baseline), priority_changes (organizations whose top-priority
+            category changes) and priority_top_k_overlap
+        """
+        shift = self.org_scores - self.baseline_org_scores
+        return pd.DataFrame({
+            'mean_shift': shift.mean(axis=1),
+            'max_abs_shift': np.abs(shift).max(axis=1),
+            'band_changes': (self.maturity_codes != self.baseline_maturity_codes).sum(axis=1),
+            'org_rank_correlation': _rank_correlation(self.org_scores, self.baseline_org_scores),
+            'priority_changes': (self.top_priority != self.baseline_top_priority).sum(axis=1),
+            'priority_top_k_overlap': self.priority_top_k_overlap
+        })
+
+    def org_frame(self) -> pd.DataFrame:
+        """
+        One row per organization describing its spread across weight sets.
+
+        Returns:
+            DataFrame with baseline, min, p5, p95, max score and the share of
+            weight sets that change its maturity band or top-priority category
+        """
+        p5, p95 = np.percentile(self.org_scores, [5, 95], axis=0)
+        return pd.DataFrame({
+            'org_id': self.org_id,
+            'baseline': self.baseline_org_scores,
+            'min': self.org_scores.min(axis=0),
+            'p5': p5,
+            'p95': p95,
+            'max': self.org_scores.max(axis=0),
+            'band_change_rate': (self.maturity_codes != self.baseline_maturity_codes).mean(axis=0),
+            'priority_change_rate': (self.top_priority != self.baseline_top_priority).mean(axis=0)
+        })
+
+
+def _rank_correlation(values: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+    """Spearman correlation of each row of ``values`` with ``baseline``."""
+    if values.shape[1] < 2:
+        return np.full(len(values), np.nan)
+    ranks = rankdata(values, axis=1)
+    base = rankdata(baseline)
+    ranks = ranks - ranks.mean(axis=1, keepdims=True)
+    base = base - base.mean()
+    denominator = np.sqrt((ranks ** 2).sum(axis=1) * (base ** 2).sum())
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (ranks @ base) / denominator
+
+
+def _top_k_mask(values: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Mark the ``top_k`` largest entries of every row.
+
+    Ties at the boundary are broken by column order, as in
+    gap_analysis.top_k_indices, so equal rows always select the same entries.
+    """
+    n = values.shape[1]
+    kth = np.partition(values, n - top_k, axis=1)[:, n - top_k, None]
+    above = values > kth
+    tied = values == kth
+    remaining = top_k - above.sum(axis=1, keepdims=True)
+    return above | (tied & (np.cumsum(tied, axis=1) <= remaining))
+
+
+def _weight_sets(weights: Optional[np.ndarray], default: np.ndarray, k: int) -> np.ndarray:
+    """Project supplied weight sets, or repeat the default, to shape (k, d)."""
+    if weights is None:
+        return np.tile(default, (k, 1))
+    weights = project_to_simplex(np.atleast_2d(np.asarray(weights, dtype=np.float64)))
+    if weights.shape[1] != len(default):
+        raise ValueError(f"Expected weight sets with {len(default)} columns, "
+                         f"got {weights.shape[1]}")
+    if len(weights) == 1:
+        return np.tile(weights, (k, 1))
+    if len(weights) != k:
+        raise ValueError(f"All weight set arrays must have the same length, "
+                         f"got {len(weights)} and {k}")
+    return weights
+
+
+def sweep_weights(
+    table: ItemTable,
+    adli_weights: Optional[np.ndarray] = None,
+    letci_weights: Optional[np.ndarray] = None,
+    category_weights: Optional[np.ndarray] = None,
+    scorer: Optional[OrganizationalScorer] = None,
+    top_k: int = 10,
+    chunk_size: int = 2048
+) -> SweepResult:
+    """
+    Score a portfolio under many weight sets and compare with the baseline.
+
+    Each weight argument is a (K, d) array of candidate weights (projected onto
+    the simplex), a single (d,) vector applied to all K sets, or None to keep
+    the scorer's weights. K is the largest number of sets supplied.
+
+    Args:
+        table: Items with normalized indicators, possibly many organizations
+        adli_weights: (K, 4) ADLI weights in ADLIScorer.INDICATOR_KEYS order
+        letci_weights: (K, 4) LeTCI weights in LeTCIScorer.INDICATOR_KEYS order
+        category_weights: (K, 7) category weights, column c - 1 for category c
+        scorer: Baseline scorer; defaults to OrganizationalScorer()
+        top_k: Number of largest (org, category) gaps compared with the baseline
+        chunk_size: Weight sets processed per chunk; lowered so a chunk holds
+                    at most SWEEP_CHUNK_CELLS segment scores
+
+    Returns:
+        SweepResult
+
+    Raises:
+        ValueError: If the table is empty, weight arrays disagree in size or
+                    indicators are invalid.
+    """
+    if len(table) == 0:
+        raise ValueError("table has no items")
+    scorer = scorer or OrganizationalScorer()
+    scorer.score_item_table(table)  # validates categories and indicators
+
+    base_adli = scorer.adli_scorer.weight_vector
+    base_letci = scorer.letci_scorer.weight_vector
+    base_category = np.array([scorer.category_weights[c] for c in range(1, 8)])
+
+    sizes = [len(np.atleast_2d(w)) for w in (adli_weights, letci_weights, category_weights)
+             if w is not None]
+    k = max(sizes, default=1)
+    adli = _weight_sets(adli_weights, base_adli, k)
+    letci = _weight_sets(letci_weights, base_letci, k)
+    categories = _weight_sets(category_weights, base_category, k)
+
+    # Segment means of indicators, targets and the segment → org sum matrix
+    segment_org, segment_category, segment = segment_index(table.org_id, table.category)
+    n_segments = len(segment_org)
+    counts = np.bincount(segment)
+    means = np.column_stack([
+        np.bincount(segment, weights=table.indicators[:, j]) for j in range(4)
+    ]) / counts[:, None]
+    target = np.bincount(segment, weights=np.nan_to_num(table.target, nan=100.0)) / counts
+    org_id, org_index = np.unique(segment_org, return_inverse=True)
+    to_org = sparse.csr_matrix(
+        (np.ones(n_segments), (org_index, np.arange(n_segments))),
+        shape=(len(org_id), n_segments)
+    )
+    process = segment_category <= 6
+    process_means, results_means = 100 * means[process], 100 * means[~process]
+
+    def category_scores(a: np.ndarray, l: np.ndarray) -> np.ndarray:
+        scores = np.empty((n_segments, len(a)))
+        scores[process] = process_means @ a.T
+        scores[~process] = results_means @ l.T
+        return scores
+
+    def org_scores(scores: np.ndarray, c: np.ndarray) -> np.ndarray:
+        return np.asarray(to_org @ (scores * c[:, segment_category - 1].T)).T
+
+    base_scores = category_scores(base_adli[None], base_letci[None])
+    baseline = org_scores(base_scores, base_category[None])[0]
+
+    # Segments are sorted by (org, category), so each organization's segments
+    # are contiguous and in category order
+    org_start = np.flatnonzero(np.r_[True, np.diff(org_index) != 0])
+    position = np.arange(n_segments)
+
+    def top_priority(gaps: np.ndarray) -> np.ndarray:
+        largest = np.maximum.reduceat(gaps, org_start, axis=1)
+        at_largest = np.where(gaps == largest[:, org_index], position, n_segments)
+        first = np.minimum.reduceat(at_largest, org_start, axis=1)
+        return np.where(largest > 0, segment_category[first], 0).astype(np.int8)
+
+    k_gaps = min(top_k, n_segments)
+    base_gap = np.maximum(0.0, target - base_scores[:, 0])
+    base_priority = top_priority(base_gap[None])[0]
+    base_top = _top_k_mask(base_gap[None], k_gaps)[0]
+
+    rows_per_chunk = max(1, min(chunk_size, SWEEP_CHUNK_CELLS // n_segments))
+    results, priorities, overlaps = [], [], []
+    for start in range(0, k, rows_per_chunk):
+        rows = slice(start, start + rows_per_chunk)
+        scores = category_scores(adli[rows], letci[rows])
+        results.append(org_scores(scores, categories[rows]))
+
+        gaps = np.maximum(0.0, target[:, None] - scores).T
+        priorities.append(top_priority(gaps))
+        overlaps.append((_top_k_mask(gaps, k_gaps) & base_top).sum(axis=1) / k_gaps)
+
+    org_matrix = np.concatenate(results)
+    return SweepResult(
+        adli_weights=adli,
+        letci_weights=letci,
+        category_weights=categories,
+        org_id=org_id,
+        baseline_org_scores=baseline,
+        org_scores=org_matrix,
+        maturity_codes=np.digitize(org_matrix, MATURITY_THRESHOLDS).astype(np.int8),
+        baseline_maturity_codes=np.digitize(baseline, MATURITY_THRESHOLDS).astype(np.int8),
+        top_priority=np.concatenate(priorities),
+        baseline_top_priority=base_priority,
+        priority_top_k_overlap=np.concatenate(overlaps)
+    )
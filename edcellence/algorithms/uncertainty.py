@@ -0,0 +1,291 @@
+"""
+Monte Carlo Uncertainty
+=======================
+
+Uncertainty bands on category and organizational scores from assessor
+uncertainty on each indicator.
+
+Every draw perturbs all indicators of an ItemTable under a noise model and
+propagates them through the full pipeline as array operations:
+
+    X̃[d]        perturbed (items × 4) indicators, kept in [0, 1]
+    S_item[d]   = 100 · Σ_k W[i,k] · X̃[d,i,k]      (ADLI or LeTCI weights per row)
+    S_cat[d]    = S_item[d] · A                    (A: items → (org, category) means)
+    S_org[d]    = S_cat[d] · C                     (C: category weights per org)
+    IHI[d]      = IntegrationGraph.health(S_cat[d])
+
+Draws are processed in chunks so that at most ``chunk_size × items × 4``
+perturbed indicators are held in memory. Each chunk has its own RNG stream
+spawned from one ``np.random.SeedSequence``, so a seed reproduces the same
+draws whether chunks are run sequentially or distributed over processes
+(see UncertaintyEngine.simulate_chunk).
+
+Propagated scores are not rounded, so bands are not quantized to 0.01.
+
+Noise models (``scale`` may be a scalar or broadcast to (items, 4)):
+    'normal':  X + N(0, scale²), clipped to [0, 1]
+    'uniform': X + U(-scale, scale), clipped to [0, 1]
+    'beta':    Beta with mean X and standard deviation ``scale`` at X = 0.5;
+               stays inside [0, 1] without clipping
+
+Example:
+    >>> from edcellence.data import load_sample_data
+    >>> table = ItemTable.from_organization_data(load_sample_data())
+    >>> result = simulate_uncertainty(table, n_draws=500, scale=0.05, seed=7)
+    >>> frame = result.org_intervals()
+    >>> bool(frame['p5'].iloc[0] < frame['p50'].iloc[0] < frame['p95'].iloc[0])
+    True
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .item_table import ItemTable, indicator_weights
+from .organizational_scoring import OrganizationalScorer
+from .rollup import _category_weight_lookup, segment_index
+
+NOISE_MODELS = ('normal', 'uniform', 'beta')
+
+# Upper bound on perturbed indicator values held per chunk (64 MB of float64)
+MAX_CHUNK_VALUES = 8_000_000
+
+# Indicator values are kept this far inside (0, 1) for the beta model
+_BETA_EPS = 1e-6
+
+
+@dataclass
+class UncertaintyResult:
+    """Simulated draws of category scores, organization scores and IHI.
+
+    Attributes:
+        category_org: (S,) organization of each (org, category) segment
+        category: (S,) category of each segment
+        org_id: (O,) organization ids
+        category_draws: (draws × S) category scores
+        org_draws: (draws × O) organizational scores
+        ihi_draws: (draws × O) Integration Health Index values
+        percentiles: Percentiles reported by the interval tables
+    """
+    category_org: np.ndarray
+    category: np.ndarray
+    org_id: np.ndarray
+    category_draws: np.ndarray
+    org_draws: np.ndarray
+    ihi_draws: np.ndarray
+    percentiles: Tuple[float, ...] = (5, 50, 95)
+
+    @property
+    def n_draws(self) -> int:
+        return len(self.org_draws)
+
+    def _summary(self, draws: np.ndarray, prefix: str = '') -> dict:
+        """Mean, standard deviation and percentiles of each column of draws."""
+        columns = {f'{prefix}mean': draws.mean(axis=0), f'{prefix}std': draws.std(axis=0)}
+        for q, values in zip(self.percentiles, np.percentile(draws, self.percentiles, axis=0)):
+            columns[f'{prefix}p{q:g}'] = values
+        return columns
+
+    def category_intervals(self) -> pd.DataFrame:
+        """Per (org, category) mean, std and percentile interval."""
+        return pd.DataFrame({
+            'org_id': self.category_org,
+            'category': self.category,
+            **self._summary(self.category_draws)
+        })
+
+    def org_intervals(self) -> pd.DataFrame:
+        """Per organization score and IHI mean, std and percentile intervals."""
+        return pd.DataFrame({
+            'org_id': self.org_id,
+            **self._summary(self.org_draws),
+            **self._summary(self.ihi_draws, prefix='ihi_')
+        })
+
+
+class UncertaintyEngine:
+    """
+    Chunked Monte Carlo propagation of indicator noise through the pipeline.
+
+    The engine compiles the item weights and the item → category → org
+    aggregation matrices once; simulate_chunk can then be called for any
+    chunk index, in any order or process.
+    """
+
+    def __init__(
+        self,
+        table: ItemTable,
+        scorer: Optional[OrganizationalScorer] = None,
+        noise: str = 'normal',
+        scale: Union[float, np.ndarray] = 0.05,
+        n_draws: int = 1000,
+        chunk_size: Optional[int] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            table: Items with normalized indicators (categories 1-7)
+            scorer: Scorer providing weights and the integration graph;
+                    defaults to OrganizationalScorer()
+            noise: One of NOISE_MODELS
+            scale: Noise scale (scalar, or broadcastable to (items, 4))
+            n_draws: Total number of draws
+            chunk_size: Draws per chunk; if None, chosen so a chunk holds at
+                        most MAX_CHUNK_VALUES perturbed indicator values
+            seed: Seed of the root SeedSequence
+
+        Raises:
+            ValueError: If the noise model, scale or draw counts are invalid,
+                        or any indicator is out of range.
+        """
+        if noise not in NOISE_MODELS:
+            raise ValueError(f"noise must be one of {NOISE_MODELS}, got {noise!r}")
+        if n_draws < 1:
+            raise ValueError(f"n_draws must be at least 1, got {n_draws}")
+        if len(table) == 0:
+            raise ValueError("table has no items")
+
+        self.scorer = scorer or OrganizationalScorer()
+        # Validates categories and indicators
+        self.baseline = self.scorer.score_item_table(table)
+        self.table = table
+        self.noise = noise
+        self.n_draws = n_draws
+
+        n = len(table)
+        self.scale = np.broadcast_to(np.asarray(scale, dtype=np.float64), (n, 4))
+        if (self.scale < 0).any():
+            raise ValueError("scale must be non-negative")
+        if noise == 'beta' and (self.scale >= 0.5).any():
+            raise ValueError("beta noise requires scale < 0.5")
+
+        self.chunk_size = chunk_size or max(1, MAX_CHUNK_VALUES // (4 * n))
+        self.n_chunks = -(-n_draws // self.chunk_size)
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self._chunk_seeds = self.seed_sequence.spawn(self.n_chunks)
+
+        # Per-row weight vectors (ADLI for process rows, LeTCI for results rows)
+        self._weights = indicator_weights(
+            table, self.scorer.adli_scorer.weight_vector, self.scorer.letci_scorer.weight_vector
+        )
+
+        # items → (org, category) segment means
+        self.category_org, self.category, segment = segment_index(table.org_id, table.category)
+        n_segments = len(self.category)
+        counts = np.bincount(segment)
+        self._item_to_segment = sparse.csr_matrix(
+            (1.0 / counts[segment], (np.arange(n), segment)), shape=(n, n_segments)
+        )
+
+        # (org, category) segments → organizations, weighted by category
+        self.org_id, segment_org = np.unique(self.category_org, return_inverse=True)
+        self._segment_to_org = sparse.csr_matrix(
+            (_category_weight_lookup(self.scorer.category_weights, self.category),
+             (np.arange(n_segments), segment_org)),
+            shape=(n_segments, len(self.org_id))
+        )
+        self._segment_org = segment_org
+
+    def _perturb(self, rng: np.random.Generator, draws: int) -> np.ndarray:
+        """Draw perturbed indicators of shape (draws, items, 4)."""
+        x = self.table.indicators
+        if self.noise == 'normal':
+            return np.clip(x + rng.normal(size=(draws,) + x.shape) * self.scale, 0.0, 1.0)
+        if self.noise == 'uniform':
+            noise = rng.uniform(-1.0, 1.0, size=(draws,) + x.shape) * self.scale
+            return np.clip(x + noise, 0.0, 1.0)
+
+        # Beta with mean x and variance x(1-x)/(k+1); sd = scale at x = 0.5
+        mean = np.clip(x, _BETA_EPS, 1.0 - _BETA_EPS)
+        with np.errstate(divide='ignore'):
+            concentration = np.where(self.scale > 0, 0.25 / self.scale ** 2 - 1.0, np.inf)
+        finite = np.isfinite(concentration)
+        k = np.where(finite, concentration, 1.0)
+        draws_ = rng.beta(mean * k, (1.0 - mean) * k, size=(draws,) + x.shape)
+        return np.where(finite, draws_, x)
+
+    def simulate_chunk(self, index: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Simulate one chunk of draws with its own RNG stream.
+
+        Args:
+            index: Chunk index in [0, n_chunks)
+
+        Returns:
+            (category_draws, org_draws, ihi_draws) for this chunk
+        """
+        if not 0 <= index < self.n_chunks:
+            raise ValueError(f"Chunk index must be in [0, {self.n_chunks}), got {index}")
+        draws = min(self.chunk_size, self.n_draws - index * self.chunk_size)
+        rng = np.random.default_rng(self._chunk_seeds[index])
+
+        indicators = self._perturb(rng, draws)
+        item_scores = np.einsum('dnk,nk->dn', indicators, self._weights)
+        category_scores = np.asarray(item_scores @ self._item_to_segment)
+        org_scores = np.asarray(category_scores @ self._segment_to_org)
+
+        # IHI over a (draws × orgs × 7) matrix; absent categories stay NaN
+        graph = self.scorer.integration_graph
+        matrix = np.full((draws, len(self.org_id), graph.n_nodes), np.nan)
+        matrix[:, self._segment_org, self.category - 1] = category_scores
+        ihi = graph.health(matrix.reshape(-1, graph.n_nodes)).reshape(draws, -1)
+
+        return category_scores, org_scores, ihi
+
+    def run(self, percentiles: Sequence[float] = (5, 50, 95)) -> UncertaintyResult:
+        """
+        Simulate all chunks sequentially.
+
+        Args:
+            percentiles: Percentiles reported by the interval tables
+
+        Returns:
+            UncertaintyResult with all draws
+        """
+        chunks = [self.simulate_chunk(i) for i in range(self.n_chunks)]
+        return UncertaintyResult(
+            category_org=self.category_org,
+            category=self.category,
+            org_id=self.org_id,
+            category_draws=np.concatenate([c[0] for c in chunks]),
+            org_draws=np.concatenate([c[1] for c in chunks]),
+            ihi_draws=np.concatenate([c[2] for c in chunks]),
+            percentiles=tuple(percentiles)
+        )
+
+
+def simulate_uncertainty(
+    table: ItemTable,
+    scorer: Optional[OrganizationalScorer] = None,
+    noise: str = 'normal',
+    scale: Union[float, np.ndarray] = 0.05,
+    n_draws: int = 1000,
+    percentiles: Sequence[float] = (5, 50, 95),
+    chunk_size: Optional[int] = None,
+    seed: Optional[int] = None
+) -> UncertaintyResult:
+    """
+    Monte Carlo uncertainty bands for category and organizational scores.
+
+    Args:
+        table: Items with normalized indicators
+        scorer: Optional scorer (weights and integration graph)
+        noise: Noise model, one of NOISE_MODELS
+        scale: Noise scale per indicator (scalar or broadcastable to (items, 4))
+        n_draws: Number of draws
+        percentiles: Percentiles reported by the interval tables
+        chunk_size: Draws per chunk (bounded automatically if None)
+        seed: Seed for reproducible draws
+
+    Returns:
+        UncertaintyResult
+    """
+    engine = UncertaintyEngine(
+        table, scorer=scorer, noise=noise, scale=scale, n_draws=n_draws,
+        chunk_size=chunk_size, seed=seed
+    )
+    return engine.run(percentiles)
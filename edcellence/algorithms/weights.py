@@ -0,0 +1,199 @@
+"""
+Compiled Weight Vectors
+=======================
+
+Frozen, pre-validated weight objects for the ADLI, LeTCI and category
+aggregation steps.
+
+Each object validates once at construction and compiles its values to a
+read-only NumPy vector. Instances are immutable and hashable, so they can be
+used as cache keys and shared freely between threads.
+
+Example:
+    >>> weights = ADLIWeights(w_A=0.40, w_D=0.30, w_L=0.15, w_I=0.15)
+    >>> weights.vector
+    array([0.4 , 0.3 , 0.15, 0.15])
+    >>> hash(weights) == hash(ADLIWeights.from_dict(weights.as_dict()))
+    True
+"""
+
+from dataclasses import Field, dataclass, field, fields
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Mapping, Optional, Tuple, Type, TypeVar, Union, cast
+import numpy as np
+
+
+def _validate(values: Tuple[float, ...], keys: Tuple, label: str) -> None:
+    """Check that weights sum to 1.0 and each lies in [0, 1]."""
+    weight_sum = sum(values)
+    if not np.isclose(weight_sum, 1.0, atol=1e-6):
+        raise ValueError(f"{label} must sum to 1.0, got {weight_sum}")
+
+    for key, value in zip(keys, values):
+        if not 0 <= value <= 1:
+            raise ValueError(f"Weight {key}={value} out of range [0,1]")
+
+
+def _read_only(values: Tuple[float, ...]) -> np.ndarray:
+    """Compile values into an immutable float64 vector."""
+    vector = np.array(values, dtype=np.float64)
+    vector.flags.writeable = False
+    return vector
+
+
+D = TypeVar('D', bound='_DimensionWeights')
+
+
+class _DimensionWeights:
+    """Shared behaviour of the four-dimension ADLI/LeTCI weight objects."""
+
+    # Provided by the @dataclass subclasses
+    __dataclass_fields__: ClassVar[Dict[str, 'Field[Any]']]
+    _vector: np.ndarray
+
+    def __post_init__(self):
+        values = self.as_tuple()
+        _validate(values, self.keys(), "Weights")
+        # Frozen dataclass: cache the compiled vector outside the dataclass fields
+        object.__setattr__(self, '_vector', _read_only(values))
+
+    @classmethod
+    def keys(cls) -> Tuple[str, ...]:
+        """Weight keys in indicator column order."""
+        return tuple(f.name for f in fields(cls))
+
+    @classmethod
+    def from_dict(cls: Type[D], weights: Dict[str, float]) -> D:
+        """
+        Build from a weights dictionary such as ``ADLIScorer.DEFAULT_WEIGHTS``.
+
+        Raises:
+            ValueError: If keys are missing or unknown, or the weights are invalid.
+        """
+        missing = set(cls.keys()) - weights.keys()
+        if missing:
+            raise ValueError(f"Missing weights: {missing}")
+        unknown = weights.keys() - set(cls.keys())
+        if unknown:
+            raise ValueError(f"Unknown weights: {unknown}")
+        return cls(**{key: float(weights[key]) for key in cls.keys()})
+
+    def as_tuple(self) -> Tuple[float, ...]:
+        """Weights in indicator column order."""
+        return tuple(getattr(self, key) for key in self.keys())
+
+    def as_dict(self) -> Dict[str, float]:
+        """Weights as a new, mutable dictionary."""
+        return dict(zip(self.keys(), self.as_tuple()))
+
+    @property
+    def vector(self) -> np.ndarray:
+        """Read-only weight vector aligned with the scorer's INDICATOR_KEYS."""
+        return self._vector
+
+
+@dataclass(frozen=True)
+class ADLIWeights(_DimensionWeights):
+    """Validated ADLI dimension weights (Approach, Deployment, Learning, Integration)."""
+    w_A: float = 0.30
+    w_D: float = 0.30
+    w_L: float = 0.20
+    w_I: float = 0.20
+
+
+@dataclass(frozen=True)
+class LeTCIWeights(_DimensionWeights):
+    """Validated LeTCI dimension weights (Levels, Trends, Comparisons, Integration)."""
+    w_Lv: float = 0.35
+    w_Tr: float = 0.25
+    w_Cp: float = 0.25
+    w_I: float = 0.15
+
+
+@dataclass(frozen=True)
+class CategoryWeights:
+    """Validated weights of the seven BEB-EdPEx categories, ordered 1-7."""
+    values: Tuple[float, ...] = (1/7,) * 7
+    _vector: np.ndarray = field(init=False, repr=False, compare=False)
+
+    N_CATEGORIES: ClassVar[int] = 7
+
+    def __post_init__(self):
+        values = tuple(float(v) for v in self.values)
+        if len(values) != self.N_CATEGORIES:
+            raise ValueError(f"Expected {self.N_CATEGORIES} category weights, got {len(values)}")
+        _validate(values, tuple(range(1, self.N_CATEGORIES + 1)), "Category weights")
+        object.__setattr__(self, 'values', values)
+        object.__setattr__(self, '_vector', _read_only(values))
+
+    @classmethod
+    def from_dict(cls, weights: Dict[int, float]) -> 'CategoryWeights':
+        """
+        Build from a {category: weight} dictionary covering categories 1-7.
+
+        Raises:
+            ValueError: If a category is missing or the weights are invalid.
+        """
+        categories = range(1, cls.N_CATEGORIES + 1)
+        missing = set(categories) - weights.keys()
+        if missing:
+            raise ValueError(f"Missing category weights: {missing}")
+        return cls(tuple(weights[c] for c in categories))
+
+    def as_dict(self) -> Dict[int, float]:
+        """Weights as a new {category: weight} dictionary."""
+        return dict(enumerate(self.values, start=1))
+
+    @property
+    def vector(self) -> np.ndarray:
+        """Read-only weight vector; element ``c - 1`` is the weight of category c."""
+        return self._vector
+
+
+W = TypeVar('W', ADLIWeights, LeTCIWeights, CategoryWeights)
+
+# Caches are keyed by type name: the frozen dataclass types are not Hashable to mypy
+_WEIGHT_TYPES: Dict[str, Union[Type[ADLIWeights], Type[LeTCIWeights], Type[CategoryWeights]]] = {
+    weights_type.__name__: weights_type
+    for weights_type in (ADLIWeights, LeTCIWeights, CategoryWeights)
+}
+
+
+@lru_cache(maxsize=None)
+def _default_weights(type_name: str) -> Union[ADLIWeights, LeTCIWeights, CategoryWeights]:
+    """Shared default instance of each weights type."""
+    return _WEIGHT_TYPES[type_name]()
+
+
+@lru_cache(maxsize=256)
+def _weights_from_items(
+    type_name: str,
+    items: Tuple
+) -> Union[ADLIWeights, LeTCIWeights, CategoryWeights]:
+    """Validate and compile a weights dictionary once per distinct content."""
+    return _WEIGHT_TYPES[type_name].from_dict(dict(items))
+
+
+def compile_weights(weights: Optional[Union[Mapping, W]], weights_type: Type[W]) -> W:
+    """
+    Resolve optional dict weights to a shared, compiled weights object.
+
+    Dictionaries with identical content resolve to the same instance, so
+    repeated calls skip validation entirely.
+
+    Args:
+        weights: None/empty (defaults), a weights dict, or a weights object
+        weights_type: ADLIWeights, LeTCIWeights or CategoryWeights
+
+    Returns:
+        Instance of ``weights_type``
+
+    Raises:
+        ValueError: If the weights are invalid.
+    """
+    if isinstance(weights, weights_type):
+        return weights
+    if not weights:
+        return cast(W, _default_weights(weights_type.__name__))
+    items = tuple(sorted(cast(Mapping, weights).items()))
+    return cast(W, _weights_from_items(weights_type.__name__, items))
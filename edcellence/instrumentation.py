@@ -0,0 +1,284 @@
+"""
+Pipeline Instrumentation
+========================
+
+Opt-in timing of the public scoring and visualization stages.
+
+Stages are marked with the ``instrumented`` decorator. While instrumentation
+is disabled (the default) a decorated call costs one flag check. Once
+enabled, every call records its latency and, if it succeeds, the number of
+items it processed; calls that raise are counted as errors. ``snapshot``
+returns call and error counts, cumulative time, latency percentiles and item
+totals per stage, and ``write_prometheus`` exports the
+same data in Prometheus text format (e.g. for the node exporter's textfile
+collector).
+
+Percentiles are computed over the most recent ``LATENCY_WINDOW`` calls of each
+stage, so memory stays bounded in long-running processes.
+
+Example:
+    >>> from edcellence import instrumentation
+    >>> from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+    >>> instrumentation.enable()
+    >>> scorer = OrganizationalScorer()
+    >>> _ = scorer.compute_item_score(1, 1, {'P_A': 0.8, 'P_D': 0.7, 'P_L': 0.6, 'P_I': 0.5})
+    >>> instrumentation.snapshot()['item_score']['calls']
+    1
+    >>> instrumentation.disable()
+    >>> instrumentation.reset()
+"""
+
+import functools
+import os
+import tempfile
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable, Dict, Iterator, Optional
+import numpy as np
+
+# Number of most recent latencies kept per stage for percentiles
+LATENCY_WINDOW = 10000
+
+# Reported latency percentiles
+PERCENTILES = (50, 90, 99)
+
+_enabled = False
+_lock = Lock()
+
+
+class _StageStats:
+    """Running statistics of one pipeline stage."""
+
+    __slots__ = ('calls', 'errors', 'seconds', 'items', 'max_seconds', 'latencies')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.items = 0
+        self.max_seconds = 0.0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def add(self, seconds: float, items: int, failed: bool):
+        self.calls += 1
+        self.errors += failed
+        self.seconds += seconds
+        self.items += items
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.latencies.append(seconds)
+
+
+_stages: Dict[str, _StageStats] = {}
+
+
+def enable():
+    """Start recording instrumented calls."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording; decorated calls go straight to the wrapped function."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Return True while instrumentation is recording."""
+    return _enabled
+
+
+def reset():
+    """Discard all recorded statistics."""
+    with _lock:
+        _stages.clear()
+
+
+def record(stage: str, seconds: float, items: int = 1, failed: bool = False):
+    """
+    Record one call of a stage.
+
+    Args:
+        stage: Stage name
+        seconds: Wall-clock duration of the call
+        items: Number of items processed by the call
+        failed: True if the call raised
+    """
+    with _lock:
+        stats = _stages.get(stage)
+        if stats is None:
+            stats = _stages[stage] = _StageStats()
+        stats.add(seconds, items, failed)
+
+
+@contextmanager
+def timed(stage: str, items: int = 1) -> Iterator[None]:
+    """
+    Time a block of code as one call of ``stage`` (no-op while disabled).
+
+    Args:
+        stage: Stage name
+        items: Number of items processed by the block if it succeeds
+    """
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        record(stage, time.perf_counter() - start, 0, failed=True)
+        raise
+    record(stage, time.perf_counter() - start, items)
+
+
+def instrumented(
+    stage: Optional[str] = None,
+    items: Optional[Callable[..., int]] = None
+) -> Callable:
+    """
+    Decorator recording the latency and item count of every call.
+
+    Args:
+        stage: Stage name; defaults to the function's qualified name
+        items: Optional function receiving the call's arguments and returning
+               the number of items processed; defaults to 1 per call. It is
+               only called after the wrapped call succeeds; failed calls are
+               recorded as errors with 0 items.
+
+    Returns:
+        Decorator
+
+    Example:
+        >>> @instrumented('double', items=lambda values: len(values))
+        ... def double(values):
+        ...     return [2 * v for v in values]
+    """
+    def decorator(func: Callable) -> Callable:
+        name = stage or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                record(name, time.perf_counter() - start, 0, failed=True)
+                raise
+            elapsed = time.perf_counter() - start
+            record(name, elapsed, items(*args, **kwargs) if items else 1)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """
+    Return the recorded statistics of every stage.
+
+    Returns:
+        {stage: {'calls', 'errors', 'items', 'total_seconds', 'mean_seconds',
+        'max_seconds', 'p50_seconds', 'p90_seconds', 'p99_seconds'}}
+    """
+    with _lock:
+        stages = {
+            name: (stats.calls, stats.errors, stats.items, stats.seconds,
+                   stats.max_seconds, np.array(stats.latencies))
+            for name, stats in _stages.items()
+        }
+
+    result = {}
+    for name, (calls, errors, items, seconds, max_seconds, latencies) in sorted(stages.items()):
+        entry = {
+            'calls': calls,
+            'errors': errors,
+            'items': items,
+            'total_seconds': seconds,
+            'mean_seconds': seconds / calls,
+            'max_seconds': max_seconds
+        }
+        for q, value in zip(PERCENTILES, np.percentile(latencies, PERCENTILES)):
+            entry[f'p{q}_seconds'] = float(value)
+        result[name] = entry
+    return result
+
+
+def to_prometheus(prefix: str = 'edcellence') -> str:
+    """
+    Format the current snapshot in Prometheus text exposition format.
+
+    Latencies are exported as a summary (quantiles plus _sum and _count),
+    items and errors as counters, all labelled by stage.
+
+    Args:
+        prefix: Metric name prefix
+
+    Returns:
+        Prometheus text
+    """
+    stats = snapshot()
+    latency = f'{prefix}_stage_latency_seconds'
+    items = f'{prefix}_stage_items_total'
+    errors = f'{prefix}_stage_errors_total'
+
+    lines = [
+        f'# HELP {latency} Latency of instrumented pipeline stages.',
+        f'# TYPE {latency} summary'
+    ]
+    for stage, entry in stats.items():
+        label = _escape_label(stage)
+        for q in PERCENTILES:
+            lines.append(
+                f'{latency}{{stage="{label}",quantile="{q / 100}"}} {entry[f"p{q}_seconds"]!r}'
+            )
+        lines.append(f'{latency}_sum{{stage="{label}"}} {entry["total_seconds"]!r}')
+        lines.append(f'{latency}_count{{stage="{label}"}} {entry["calls"]}')
+
+    lines += [
+        f'# HELP {items} Items processed by instrumented pipeline stages.',
+        f'# TYPE {items} counter'
+    ]
+    for stage, entry in stats.items():
+        lines.append(f'{items}{{stage="{_escape_label(stage)}"}} {entry["items"]}')
+
+    lines += [
+        f'# HELP {errors} Failed calls of instrumented pipeline stages.',
+        f'# TYPE {errors} counter'
+    ]
+    for stage, entry in stats.items():
+        lines.append(f'{errors}{{stage="{_escape_label(stage)}"}} {entry["errors"]}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def write_prometheus(path: str, prefix: str = 'edcellence'):
+    """
+    Write the Prometheus text to ``path`` atomically.
+
+    The file is written to a temporary file in the same directory and renamed,
+    so a collector never reads a partial file.
+
+    Args:
+        path: Output file, typically ``<textfile directory>/edcellence.prom``
+        prefix: Metric name prefix
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(to_prometheus(prefix))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -34,6 +34,8 @@ import networkx as nx
 from matplotlib.patches import Circle, Rectangle, FancyArrow
 import matplotlib.patches as mpatches
 
+from ..instrumentation import instrumented
+
 
 class AdvancedVisualizer:
     """
@@ -55,6 +57,7 @@ class AdvancedVisualizer:
         plt.rcParams['savefig.dpi'] = 300
         plt.rcParams['font.family'] = 'DejaVu Sans'
 
+    @instrumented()
     def plot_distribution_comparison(
         self,
         data_dict: Dict[str, List[float]],
@@ -128,6 +131,7 @@ class AdvancedVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_correlation_matrix(
         self,
         correlation_data: pd.DataFrame,
@@ -178,6 +182,7 @@ class AdvancedVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_category_network(
         self,
         category_scores: Dict[int, float],
@@ -270,6 +275,7 @@ class AdvancedVisualizer:
 
         return fig
 
+    @instrumented()
     def create_sunburst_chart(
         self,
         hierarchical_data: Dict,
@@ -316,6 +322,7 @@ class AdvancedVisualizer:
 
         return fig
 
+    @instrumented()
     def create_sankey_diagram(
         self,
         flow_data: Dict[str, List],
@@ -364,6 +371,7 @@ class AdvancedVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_temporal_decomposition(
         self,
         time_series: pd.DataFrame,
@@ -428,6 +436,7 @@ class AdvancedVisualizer:
 
         return fig
 
+    @instrumented()
     def create_3d_scatter_interactive(
         self,
         data: pd.DataFrame,
@@ -490,6 +499,7 @@ class AdvancedVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_statistical_summary(
         self,
         data_dict: Dict[str, List[float]],
@@ -579,6 +589,7 @@ class AdvancedVisualizer:
 
         return fig
 
+    @instrumented()
     def create_parallel_coordinates(
         self,
         data: pd.DataFrame,
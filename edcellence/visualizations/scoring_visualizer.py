@@ -24,6 +24,8 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 
+from ..instrumentation import instrumented
+
 # Configure visualization defaults
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 8)
@@ -69,6 +71,7 @@ class ScoringVisualizer:
         if style != 'default':
             plt.style.use(style)
 
+    @instrumented()
     def plot_category_scores_radar(
         self,
         category_scores: Dict[int, float],
@@ -128,6 +131,7 @@ class ScoringVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_adli_breakdown(
         self,
         adli_scores: Dict[str, float],
@@ -172,6 +176,7 @@ class ScoringVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_letci_breakdown(
         self,
         letci_scores: Dict[str, float],
@@ -216,6 +221,7 @@ class ScoringVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_gap_analysis_heatmap(
         self,
         gap_df: pd.DataFrame,
@@ -265,6 +271,7 @@ class ScoringVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_3d_category_surface(
         self,
         historical_data: Dict[str, Dict[int, float]],
@@ -310,6 +317,7 @@ class ScoringVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_priority_matrix(
         self,
         gap_df: pd.DataFrame,
@@ -371,6 +379,7 @@ class ScoringVisualizer:
 
         return fig
 
+    @instrumented()
     def create_interactive_scorecard(
         self,
         scorecard_data: Dict,
@@ -447,6 +456,7 @@ class ScoringVisualizer:
 
         return fig
 
+    @instrumented()
     def plot_trend_analysis(
         self,
         trend_data: pd.DataFrame,
@@ -0,0 +1,198 @@
+"""
+Tests for the vectorized batch scoring APIs.
+
+Batch results are checked against the scalar dictionary API, which remains
+the reference implementation.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from edcellence.algorithms import ADLIScorer, LeTCIScorer, IndicatorRangeError
+
+
+class TestADLIBatchScoring:
+    """Tests for ADLIScorer.compute_score_batch."""
+
+    def setup_method(self):
+        self.scorer = ADLIScorer()
+        rng = np.random.default_rng(0)
+        self.matrix = rng.random((200, 4))
+
+    def test_matches_scalar_path(self):
+        """Batch scores should equal compute_score row by row."""
+        batch = self.scorer.compute_score_batch(self.matrix)
+        for row, score in zip(self.matrix, batch):
+            indicators = dict(zip(ADLIScorer.INDICATOR_KEYS, row))
+            assert score == pytest.approx(self.scorer.compute_score(indicators), abs=0.01)
+
+    def test_accepts_dataframe(self):
+        """DataFrame input should be scored by column name, not position."""
+        df = pd.DataFrame(self.matrix, columns=ADLIScorer.INDICATOR_KEYS)
+        df = df[['P_I', 'P_L', 'P_D', 'P_A']].assign(extra=1.0)
+        np.testing.assert_array_equal(
+            self.scorer.compute_score_batch(df), self.scorer.compute_score_batch(self.matrix)
+        )
+
+    def test_reports_every_offending_row(self):
+        """Range errors should list all invalid rows, including NaN."""
+        matrix = self.matrix.copy()
+        matrix[3, 0] = 1.5
+        matrix[7, 2] = -0.1
+        matrix[11, 3] = np.nan
+        with pytest.raises(IndicatorRangeError) as excinfo:
+            self.scorer.compute_score_batch(matrix)
+        assert list(excinfo.value.rows) == [3, 7, 11]
+        assert excinfo.value.columns == ['P_A', 'P_L', 'P_I']
+
+    def test_rejects_wrong_shape(self):
+        """Matrices without four columns should be rejected."""
+        with pytest.raises(ValueError):
+            self.scorer.compute_score_batch(np.zeros((5, 3)))
+
+    def test_missing_dataframe_column(self):
+        """DataFrames missing an indicator column should be rejected."""
+        df = pd.DataFrame(self.matrix[:, :3], columns=['P_A', 'P_D', 'P_L'])
+        with pytest.raises(ValueError, match='Missing indicators'):
+            self.scorer.compute_score_batch(df)
+
+
+class TestLeTCIBatchScoring:
+    """Tests for LeTCIScorer.compute_score_batch."""
+
+    def setup_method(self):
+        self.scorer = LeTCIScorer()
+        rng = np.random.default_rng(1)
+        self.matrix = rng.random((200, 4))
+
+    def test_matches_scalar_path(self):
+        """Batch scores should equal compute_score row by row."""
+        batch = self.scorer.compute_score_batch(self.matrix)
+        for row, score in zip(self.matrix, batch):
+            indicators = dict(zip(LeTCIScorer.INDICATOR_KEYS, row))
+            assert score == pytest.approx(self.scorer.compute_score(indicators), abs=0.01)
+
+    def test_custom_weights_compiled(self):
+        """Custom weights should be honoured in batch mode."""
+        scorer = LeTCIScorer({'w_Lv': 1.0, 'w_Tr': 0.0, 'w_Cp': 0.0, 'w_I': 0.0})
+        np.testing.assert_allclose(
+            scorer.compute_score_batch(self.matrix), np.round(100 * self.matrix[:, 0], 2)
+        )
+
+    def test_accepts_dataframe(self):
+        """DataFrame input should use the R_* columns."""
+        df = pd.DataFrame(self.matrix, columns=LeTCIScorer.INDICATOR_KEYS)
+        np.testing.assert_array_equal(
+            self.scorer.compute_score_batch(df), self.scorer.compute_score_batch(self.matrix)
+        )
+
+    def test_range_error(self):
+        """Out-of-range results indicators should raise IndicatorRangeError."""
+        matrix = self.matrix.copy()
+        matrix[0, 1] = 2.0
+        with pytest.raises(IndicatorRangeError):
+            self.scorer.compute_score_batch(matrix)
+
+
+class TestBatchDiagnosticBreakdown:
+    """Tests for get_diagnostic_breakdown_batch on both scorers."""
+
+    @pytest.mark.parametrize('scorer_cls', [ADLIScorer, LeTCIScorer])
+    def test_matches_scalar_breakdown(self, scorer_cls):
+        """Each row should equal the scalar get_diagnostic_breakdown values."""
+        scorer = scorer_cls()
+        matrix = np.random.default_rng(2).random((50, 4))
+        batch = scorer.get_diagnostic_breakdown_batch(matrix)
+        assert batch.shape == (50, 5)
+        for row, values in zip(matrix, batch):
+            expected = scorer.get_diagnostic_breakdown(dict(zip(scorer.INDICATOR_KEYS, row)))
+            np.testing.assert_allclose(values, list(expected.values()), atol=0.01)
+
+    @pytest.mark.parametrize('scorer_cls', [ADLIScorer, LeTCIScorer])
+    def test_total_matches_batch_scores(self, scorer_cls):
+        """The Total column should equal compute_score_batch."""
+        scorer = scorer_cls()
+        matrix = np.random.default_rng(3).random((500, 4))
+        np.testing.assert_array_equal(
+            scorer.get_diagnostic_breakdown_batch(matrix)[:, 4],
+            scorer.compute_score_batch(matrix)
+        )
+
+    def test_frame_uses_visualizer_labels(self):
+        """DataFrame output should carry the labels the visualizers expect."""
+        frame = ADLIScorer().get_diagnostic_breakdown_batch(
+            np.array([[0.75, 0.45, 0.60, 0.55]]), as_frame=True
+        )
+        assert list(frame.columns) == ['Approach', 'Deployment', 'Learning', 'Integration', 'Total']
+        assert frame.loc[0, 'Total'] == pytest.approx(59.0)
+
+
+class TestBatchTrendNormalization:
+    """Tests for LeTCIScorer.normalize_trend_batch."""
+
+    def setup_method(self):
+        self.scorer = LeTCIScorer()
+        rng = np.random.default_rng(5)
+        self.histories = rng.uniform(10, 100, size=(300, 8))
+        # Ragged histories: NaN-pad each row at the front to a random length
+        for row, length in enumerate(rng.integers(0, 9, size=300)):
+            self.histories[row, :8 - length] = np.nan
+
+    @pytest.mark.parametrize('periods', [1, 2, 3, 5])
+    def test_matches_polyfit_path(self, periods):
+        """Closed-form slopes should reproduce normalize_trend for every series."""
+        batch = self.scorer.normalize_trend_batch(self.histories, periods=periods)
+        for row, score in zip(self.histories, batch):
+            history = list(row[~np.isnan(row)])
+            assert score == pytest.approx(
+                self.scorer.normalize_trend(history, periods=periods), abs=1e-9
+            )
+
+    def test_decay_weighting(self):
+        """Decay should emphasise recent periods; decay=1 equals unweighted."""
+        history = np.array([[50.0, 50.0, 50.0, 60.0, 50.0]])
+        unweighted = self.scorer.normalize_trend_batch(history, periods=5)
+        np.testing.assert_allclose(
+            self.scorer.normalize_trend_batch(history, periods=5, decay=1.0), unweighted
+        )
+        recent = self.scorer.normalize_trend_batch(history, periods=5, decay=0.2)
+        assert recent[0] != pytest.approx(unweighted[0])
+
+    def test_invalid_arguments(self):
+        """Non-2-D input and invalid decay should be rejected."""
+        with pytest.raises(ValueError):
+            self.scorer.normalize_trend_batch(np.arange(5.0))
+        with pytest.raises(ValueError):
+            self.scorer.normalize_trend_batch(self.histories, decay=1.5)
+
+
+class TestBatchLevelComparisonNormalization:
+    """Tests for normalize_level_batch and normalize_comparison_batch."""
+
+    def setup_method(self):
+        self.scorer = LeTCIScorer()
+        rng = np.random.default_rng(6)
+        self.actual = rng.uniform(0, 200, size=500)
+        self.benchmark = rng.uniform(-20, 150, size=500)
+        self.max_value = rng.uniform(50, 150, size=500)
+
+    def test_level_matches_scalar(self):
+        """Array levels should equal normalize_level row by row."""
+        batch = self.scorer.normalize_level_batch(self.actual, 80.0, self.max_value)
+        for a, m, value in zip(self.actual, self.max_value, batch):
+            assert value == pytest.approx(self.scorer.normalize_level(a, 80.0, m))
+
+    def test_level_rejects_non_positive_max(self):
+        """Every row with a non-positive max_value should be reported."""
+        max_value = self.max_value.copy()
+        max_value[[4, 9]] = [0.0, -1.0]
+        with pytest.raises(ValueError, match=r'\[4, 9\]'):
+            self.scorer.normalize_level_batch(self.actual, 80.0, max_value)
+
+    def test_comparison_matches_scalar(self):
+        """Array comparisons should equal normalize_comparison, incl. invalid benchmarks."""
+        batch = self.scorer.normalize_comparison_batch(self.actual, self.benchmark)
+        assert (self.benchmark <= 0).any()
+        for a, b, value in zip(self.actual, self.benchmark, batch):
+            assert value == pytest.approx(self.scorer.normalize_comparison(a, b))
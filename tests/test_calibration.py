@@ -0,0 +1,94 @@
+"""
+Tests for weight calibration against expert scores.
+"""
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import ItemTable, calibrate_weights
+from edcellence.data import load_sample_data
+
+
+def _synthetic_table(weights, n=2000, noise=0.0, category=1, seed=0):
+    """Items whose expert scores follow the given weights plus noise."""
+    rng = np.random.default_rng(seed)
+    indicators = rng.uniform(0, 1, (n, 4))
+    score = 100 * indicators @ np.asarray(weights) + rng.normal(0, noise, n)
+    return ItemTable(org_id=np.zeros(n), category=np.full(n, category), item=np.arange(n),
+                     indicators=indicators, score=score)
+
+
+class TestCalibrateWeights:
+    """Tests for the simplex-constrained least-squares calibrator."""
+
+    def test_recovers_weights(self):
+        """Noise-free scores should recover the generating weights exactly."""
+        truth = [0.35, 0.25, 0.0, 0.40]
+        result = calibrate_weights(_synthetic_table(truth), n_bootstrap=0)
+        np.testing.assert_allclose(list(result.adli.weights.values()), truth, atol=1e-9)
+        assert result.adli.rmse == pytest.approx(0.0, abs=1e-7)
+        assert result.letci is None
+
+    def test_kkt_optimality(self):
+        """Fits should satisfy the simplex KKT conditions, also at the boundary."""
+        for seed in range(20):
+            rng = np.random.default_rng(seed)
+            truth = rng.dirichlet(np.full(4, 0.4))
+            table = _synthetic_table(truth, n=40, noise=8.0, category=7, seed=seed)
+            fit = calibrate_weights(table, n_bootstrap=0).letci
+            weights = np.array(list(fit.weights.values()))
+            assert weights.min() >= 0 and weights.sum() == pytest.approx(1.0)
+
+            x = table.indicators
+            gradient = 2 * 100 * x.T @ (100 * x @ weights - table.score)
+            active = weights > 1e-9
+            multiplier = gradient[active].mean()
+            np.testing.assert_allclose(gradient[active], multiplier, rtol=1e-6, atol=1e-4)
+            assert (gradient[~active] >= multiplier - 1e-4).all()
+
+    def test_bootstrap_intervals(self):
+        """Bootstrap intervals should be reproducible and cover the truth."""
+        truth = [0.3, 0.3, 0.2, 0.2]
+        table = _synthetic_table(truth, noise=5.0)
+        result = calibrate_weights(table, n_bootstrap=300, seed=4)
+        intervals = result.adli.intervals(level=0.99)
+        assert result.adli.bootstrap.shape == (300, 4)
+        assert ((intervals['lower'] <= truth) & (truth <= intervals['upper'])).all()
+        assert (intervals['std'] > 0).all()
+
+        again = calibrate_weights(table, n_bootstrap=300, seed=4)
+        np.testing.assert_array_equal(again.adli.bootstrap, result.adli.bootstrap)
+        with pytest.raises(ValueError):
+            calibrate_weights(table, n_bootstrap=0).adli.intervals()
+
+    def test_sample_data_diagnostics_and_scorer(self):
+        """Calibrated scorers should reproduce the fitted scores of the sample data."""
+        table = ItemTable.from_organization_data(load_sample_data())
+        result = calibrate_weights(table, n_bootstrap=50, seed=0)
+
+        summary = result.summary()
+        assert summary['method'].tolist() == ['ADLI', 'LeTCI']
+        assert summary['n_items'].sum() == len(table)
+        assert {'rmse', 'mae', 'max_abs_residual', 'bias', 'r_squared'} <= set(summary.columns)
+
+        residuals = result.residual_frame(table)
+        assert len(residuals) == len(table)
+        np.testing.assert_allclose(residuals['expert'] - residuals['fitted'],
+                                   residuals['residual'])
+
+        scored = result.scorer().score_item_table(table)
+        fitted = np.concatenate([result.adli.fitted, result.letci.fitted])
+        rows = np.concatenate([result.adli.rows, result.letci.rows])
+        np.testing.assert_allclose(scored.score[rows], fitted, atol=0.01)
+
+    def test_unusable_rows_and_invalid_input(self):
+        """Rows without expert scores are skipped; invalid input is rejected."""
+        table = _synthetic_table([0.25] * 4, n=50)
+        table.score[:10] = np.nan
+        assert calibrate_weights(table, n_bootstrap=0).adli.diagnostics()['n_items'] == 40
+
+        table.indicators[20, 0] = 1.5
+        with pytest.raises(ValueError):
+            calibrate_weights(table, n_bootstrap=0)
+        with pytest.raises(ValueError):
+            calibrate_weights(table, n_bootstrap=-1)
@@ -0,0 +1,142 @@
+"""
+Tests for vectorized gap analysis and top-K prioritization.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from edcellence.algorithms import (
+    ItemTable, classify_gap_status, gap_frame, stream_gap_analysis, StreamingGapAnalyzer
+)
+from edcellence.algorithms.gap_analysis import top_k_indices
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+
+
+class TestVectorizedGapAnalysis:
+    """Tests for gap_frame and OrganizationalScorer.compute_gap_analysis."""
+
+    def setup_method(self):
+        self.scorer = OrganizationalScorer()
+        rng = np.random.default_rng(8)
+        self.n = 400
+        self.category = rng.integers(1, 8, size=self.n)
+        self.item = np.arange(self.n)
+        self.current = rng.uniform(40, 100, size=self.n).round(0)
+        self.target = rng.uniform(70, 100, size=self.n).round(0)
+        self.criticality = rng.choice([0.25, 0.5, 1.0], size=self.n)
+
+    def test_status_thresholds(self):
+        """Status should follow the 10/20 thresholds (exclusive lower bounds)."""
+        statuses = classify_gap_status(np.array([0.0, 10.0, 10.5, 20.0, 20.5]))
+        assert statuses.tolist() == ['On Track', 'On Track', 'Monitor', 'Monitor', 'Critical']
+
+    def test_top_k_matches_full_sort(self):
+        """top_k should return the head of the full ranking, ties included."""
+        full = gap_frame(self.category, self.item, self.current, self.target,
+                         criticality=self.criticality)
+        top = gap_frame(self.category, self.item, self.current, self.target,
+                        criticality=self.criticality, top_k=25)
+        assert len(top) == 25
+        pd.testing.assert_frame_equal(top, full.head(25))
+
+    def test_dict_input_matches_table_input(self):
+        """Nested dicts and ItemTable input should give the same priorities."""
+        current = {1: {1: 70, 2: 75}, 2: {1: 60, 2: 65}}
+        targets = {1: {1: 85, 2: 85}, 2: {1: 80}}
+        criticality = {(2, 1): 0.9}
+        from_dict = self.scorer.compute_gap_analysis(current, targets, criticality=criticality)
+        table = ItemTable.from_score_dicts(current, targets)
+        crit = np.where((table.category == 2) & (table.item == 1), 0.9, 0.5)
+        from_table = self.scorer.compute_gap_analysis(table, criticality=crit)
+        assert from_table.columns[0] == 'org_id'
+        np.testing.assert_allclose(from_table['priority'], from_dict['priority'])
+        assert from_dict.iloc[0][['category', 'item']].tolist() == [2, 1]
+        # Missing target defaults to 100
+        assert from_dict.set_index(['category', 'item']).loc[(2, 2), 'gap'] == 35
+
+    def test_unscored_items_are_on_track(self):
+        """NaN current scores should have a zero gap and rank last, as max(0, nan)."""
+        frame = gap_frame([1, 1, 2], [1, 2, 1], [np.nan, 70.0, 50.0])
+        assert frame['item'].tolist() == [1, 2, 1]
+        assert frame['category'].tolist() == [2, 1, 1]
+        assert frame['gap'].iloc[-1] == 0.0
+        assert frame['status'].tolist() == ['Critical', 'Critical', 'On Track']
+        assert classify_gap_status(np.array([np.nan])).tolist() == ['On Track']
+
+    def test_nan_priorities_rank_last(self):
+        """Top-K should return K rows with NaN priorities ranked after all others."""
+        priority = np.array([5.0, np.nan, 3.0, 7.0, np.nan])
+        assert top_k_indices(priority, 2).tolist() == [3, 0]
+        assert top_k_indices(priority, 4).tolist() == [3, 0, 2, 1]
+        assert top_k_indices(priority).tolist() == [3, 0, 2, 1, 4]
+
+    def test_empty_table(self):
+        """Empty inputs should return an empty frame with the standard columns."""
+        result = self.scorer.compute_gap_analysis(ItemTable.empty())
+        assert len(result) == 0
+        assert 'priority' in result.columns
+
+
+class TestStreamingGapAnalysis:
+    """Tests for bounded-memory streaming gap analysis."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(12)
+        self.n = 1000
+        self.category = rng.integers(1, 8, size=self.n)
+        self.item = np.arange(self.n)
+        self.current = rng.uniform(40, 100, size=self.n).round(0)
+        self.target = rng.uniform(70, 100, size=self.n).round(0)
+        self.criticality = rng.choice([0.25, 0.5, 1.0], size=self.n)
+        self.risk = rng.choice([0.5, 1.0], size=self.n)
+
+    def _chunks(self, size):
+        for start in range(0, self.n, size):
+            rows = slice(start, start + size)
+            yield (self.category[rows], self.item[rows], self.current[rows],
+                   self.target[rows], self.criticality[rows], self.risk[rows])
+
+    def test_top_k_matches_in_memory(self):
+        """Streamed top-K should equal the in-memory top-K, ties included."""
+        expected = gap_frame(self.category, self.item, self.current, self.target,
+                             self.criticality, self.risk, top_k=30)
+        for size in (7, 100, 5000):
+            result = stream_gap_analysis(self._chunks(size), top_k=30)
+            pd.testing.assert_frame_equal(result.top, expected)
+
+    def test_summary_covers_all_items(self):
+        """Status counts and category totals should include items beyond the top-K."""
+        full = gap_frame(self.category, self.item, self.current, self.target,
+                         self.criticality, self.risk)
+        summary = stream_gap_analysis(self._chunks(64), top_k=10).summary
+
+        assert summary['n_items'] == self.n
+        assert summary['n_beyond_top_k'] == self.n - 10
+        assert summary['status_counts'] == full['status'].value_counts().reindex(
+            ['On Track', 'Monitor', 'Critical'], fill_value=0).to_dict()
+        totals = full.groupby('category')['gap'].sum()
+        for category, total in totals.items():
+            assert summary['category_gap_totals'][category] == pytest.approx(total)
+
+    def test_dataframe_chunks(self):
+        """DataFrame chunks should give the same result as array chunks."""
+        frames = (
+            pd.DataFrame({'category': c, 'item': i, 'current_score': cur,
+                          'target_score': t, 'criticality': k, 'risk': r})
+            for c, i, cur, t, k, r in self._chunks(250)
+        )
+        result = stream_gap_analysis(frames, top_k=15)
+        expected = stream_gap_analysis(self._chunks(250), top_k=15)
+        pd.testing.assert_frame_equal(result.top, expected.top)
+
+    def test_empty_stream(self):
+        """An empty stream should return an empty frame and zero counts."""
+        result = StreamingGapAnalyzer(top_k=5).result()
+        assert result.top.empty
+        assert result.summary['n_items'] == 0
+
+    def test_invalid_top_k(self):
+        """top_k must be positive."""
+        with pytest.raises(ValueError):
+            StreamingGapAnalyzer(top_k=0)
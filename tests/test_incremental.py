@@ -0,0 +1,103 @@
+"""
+Tests for dirty-propagation incremental scorecards.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from edcellence.algorithms import IncrementalScorecard
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+from edcellence.data import load_sample_data
+
+
+class TestIncrementalScorecard:
+    """Tests that incremental results match a full recomputation."""
+
+    def setup_method(self):
+        self.data = load_sample_data()
+        self.scorer = OrganizationalScorer()
+        self.card = IncrementalScorecard(
+            self.data, self.scorer, category_targets=self.data['targets_2025']
+        )
+
+    def _from_scratch(self):
+        """Rescore every item, category and scorecard from the edited indicators."""
+        item_scores = {}
+        for (category, item), indicators in self.card._indicators.items():
+            item_scores.setdefault(category, {})[item] = self.scorer.compute_item_score(
+                category, item, indicators).score
+        category_scores = {
+            category: self.scorer.adli_scorer.compute_category_score(items)
+            for category, items in item_scores.items()
+        }
+        return item_scores, self.scorer.generate_scorecard(category_scores)
+
+    def test_initial_state_matches_full_computation(self):
+        """The freshly built scorecard should equal generate_scorecard."""
+        _, expected = self._from_scratch()
+        assert self.card.scorecard() == expected
+
+    def test_random_edits_match_full_computation(self):
+        """After many edits every result should match a full recomputation."""
+        rng = np.random.default_rng(15)
+        keys = list(self.card._indicators)
+        for _ in range(50):
+            category, item = keys[rng.integers(len(keys))]
+            indicator_keys = ('P_A', 'P_D', 'P_L', 'P_I') if category <= 6 else (
+                'R_Lv', 'R_Tr', 'R_Cp', 'R_I')
+            self.card.set_indicator(category, item, indicator_keys[rng.integers(4)],
+                                    float(rng.uniform()))
+            if rng.uniform() < 0.3:
+                item_scores, expected = self._from_scratch()
+                assert self.card.scorecard() == expected
+
+        item_scores, expected = self._from_scratch()
+        assert self.card.scorecard() == expected
+        assert self.card.item_score(1, 1) == item_scores[1][1]
+
+    def test_single_edit_touches_only_its_path(self):
+        """One edit should rescore one item, one category and its incident edges."""
+        before = dict(self.card.recompute_counts)
+        self.card.set_indicator(3, 2, 'P_D', 0.99)
+        self.card.scorecard()
+        after = self.card.recompute_counts
+
+        assert after['items'] - before['items'] == 1
+        assert after['categories'] - before['categories'] == 1
+        # Customers (3) has no integration edges
+        assert after['edges'] == before['edges']
+
+    def test_unchanged_value_stops_propagation(self):
+        """Re-setting an indicator to its current value should not touch categories."""
+        value = self.card._indicators[(2, 1)]['P_A']
+        before = dict(self.card.recompute_counts)
+        self.card.set_indicator(2, 1, 'P_A', value)
+        self.card.organizational_score()
+        assert self.card.recompute_counts['categories'] == before['categories']
+
+    def test_gap_analysis_tracks_edits(self):
+        """The gap table should reflect edited scores and targets."""
+        self.card.set_indicator(7, 1, 'R_Lv', 0.1)
+        self.card.set_target(1, 2, 99.0)
+
+        item_scores, _ = self._from_scratch()
+        targets = {
+            category: {item: float(self.data['targets_2025'][str(category)])
+                       for item in items}
+            for category, items in item_scores.items()
+        }
+        targets[1][2] = 99.0
+        expected = self.scorer.compute_gap_analysis(item_scores, targets)
+        pd.testing.assert_frame_equal(self.card.gap_analysis(), expected)
+        pd.testing.assert_frame_equal(self.card.gap_analysis(top_k=5), expected.head(5))
+
+    def test_rejected_edit_leaves_state(self):
+        """Invalid edits should raise without marking anything dirty."""
+        with pytest.raises(ValueError):
+            self.card.set_indicator(1, 1, 'P_A', 1.5)
+        with pytest.raises(ValueError):
+            self.card.set_indicator(1, 1, 'R_Lv', 0.5)
+        with pytest.raises(ValueError):
+            self.card.set_indicator(1, 99, 'P_A', 0.5)
+        assert not self.card.is_dirty
@@ -0,0 +1,92 @@
+"""
+Tests for opt-in pipeline instrumentation.
+"""
+
+import pytest
+import numpy as np
+import matplotlib.pyplot as plt
+
+from edcellence import instrumentation
+from edcellence.algorithms import ItemTable
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+from edcellence.data import load_sample_data
+
+
+class TestInstrumentation:
+    """Tests for stage recording, snapshots and Prometheus export."""
+
+    def setup_method(self):
+        instrumentation.reset()
+        instrumentation.enable()
+        self.scorer = OrganizationalScorer()
+        self.table = ItemTable.from_organization_data(load_sample_data())
+
+    def teardown_method(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_records_nothing(self):
+        """Nothing should be recorded while disabled."""
+        instrumentation.disable()
+        self.scorer.score_item_table(self.table)
+        assert instrumentation.snapshot() == {}
+
+    def test_pipeline_stages_recorded(self):
+        """Stage calls, items and latency statistics should be recorded."""
+        scored = self.scorer.score_item_table(self.table)
+        rollup = self.scorer.compute_rollups(scored)
+        self.scorer.generate_scorecard_batch(rollup.category_matrix())
+        self.scorer.compute_gap_analysis(scored)
+        self.scorer.generate_scorecard({1: 70, 2: 80})
+
+        stats = instrumentation.snapshot()
+        assert stats['item_score_table']['items'] == len(self.table)
+        assert stats['rollup']['calls'] == 1
+        assert stats['scorecard_batch']['items'] == 1
+        assert stats['gap_analysis']['items'] == len(self.table)
+        assert stats['scorecard']['calls'] == 1
+        assert stats['ihi']['calls'] == 1  # nested inside generate_scorecard
+        entry = stats['rollup']
+        assert 0 < entry['p50_seconds'] <= entry['max_seconds'] <= entry['total_seconds']
+
+    def test_failed_calls_are_recorded(self):
+        """Calls that raise should still be timed and counted as errors."""
+        with pytest.raises(ValueError):
+            self.scorer.compute_item_score(1, 1, {'P_A': 2.0, 'P_D': 0, 'P_L': 0, 'P_I': 0})
+        entry = instrumentation.snapshot()['item_score']
+        assert (entry['calls'], entry['errors'], entry['items']) == (1, 1, 0)
+
+    def test_item_callback_does_not_mask_errors(self):
+        """The original exception should propagate without running the item callback."""
+        @instrumentation.instrumented('parse', items=lambda text: len(text.split()))
+        def parse(text):
+            return int(text)
+
+        assert parse('7') == 7
+        with pytest.raises(ValueError):
+            parse('seven')
+        with pytest.raises(TypeError):
+            parse(None)
+        entry = instrumentation.snapshot()['parse']
+        assert (entry['calls'], entry['errors'], entry['items']) == (3, 2, 1)
+
+    def test_visualizer_methods_instrumented(self, visualizer):
+        """Visualizer methods should be recorded under their qualified names."""
+        visualizer.plot_category_scores_radar({c: 70.0 for c in range(1, 8)})
+        plt.close('all')
+        assert 'ScoringVisualizer.plot_category_scores_radar' in instrumentation.snapshot()
+
+    def test_prometheus_export(self, tmp_path):
+        """The Prometheus file should contain a summary and an items counter."""
+        with instrumentation.timed('custom "stage"', items=5):
+            np.arange(10).sum()
+        path = tmp_path / 'edcellence.prom'
+        instrumentation.write_prometheus(str(path))
+
+        text = path.read_text()
+        assert '# TYPE edcellence_stage_latency_seconds summary' in text
+        assert 'edcellence_stage_latency_seconds_count{stage="custom \\"stage\\""} 1' in text
+        assert 'edcellence_stage_items_total{stage="custom \\"stage\\""} 5' in text
+        assert 'edcellence_stage_errors_total{stage="custom \\"stage\\""} 0' in text
+        assert 'quantile="0.99"' in text
+        assert list(tmp_path.iterdir()) == [path]
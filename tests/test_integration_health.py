@@ -0,0 +1,80 @@
+"""
+Tests for the sparse-incidence Integration Health Index.
+"""
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import IntegrationGraph
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+
+
+class TestIntegrationGraph:
+    """Tests for IntegrationGraph.health and its scorer integration."""
+
+    def setup_method(self):
+        self.scorer = OrganizationalScorer()
+        self.graph = IntegrationGraph.from_categories()
+        rng = np.random.default_rng(14)
+        self.matrix = rng.uniform(20, 100, size=(300, 7))
+
+    def test_matches_scalar_ihi(self):
+        """Batch IHI should match compute_integration_health_index row by row."""
+        ihi = self.graph.health(self.matrix)
+        for value, scores in zip(ihi, self.matrix):
+            expected = self.scorer.compute_integration_health_index(
+                dict(enumerate(scores.tolist(), start=1)))
+            assert value == pytest.approx(expected)
+
+    def test_missing_nodes_skip_edges(self):
+        """Edges touching a NaN node should be skipped like absent categories."""
+        self.matrix[::3, 1] = np.nan
+        self.matrix[::5, 3] = np.nan
+        ihi = self.scorer.compute_integration_health_index_batch(self.matrix)
+        for value, scores in zip(ihi, self.matrix):
+            present = {c: s for c, s in enumerate(scores.tolist(), start=1) if not np.isnan(s)}
+            assert value == pytest.approx(self.scorer.compute_integration_health_index(present))
+
+    def test_no_present_edges(self):
+        """Organizations without any present edge should score 0.0."""
+        row = np.full(7, np.nan)
+        row[2] = 80.0  # Customers has no edges
+        assert self.graph.health(row).tolist() == [0.0]
+
+    def test_edge_weights(self):
+        """Weighted IHI should be the weighted mean of edge coherences."""
+        graph = IntegrationGraph([('a', 'b'), ('b', 'c')], edge_weights=[3.0, 1.0])
+        ihi = graph.health(np.array([[80.0, 60.0, 60.0]]))
+        assert ihi[0] == pytest.approx((3 * 0.8 + 1 * 1.0) / 4)
+        assert graph.nodes == ('a', 'b', 'c')
+
+    def test_health_gradient_matches_finite_differences(self):
+        """The gradient should match one-sided finite differences, also at ties."""
+        self.matrix[::4, 1] = np.nan
+        self.matrix[1, [0, 1]] = 70.0  # tied edge Leadership → Strategy
+        gradient = self.graph.health_gradient(self.matrix)
+        step = 1e-6
+        for c in range(7):
+            shifted = self.matrix.copy()
+            shifted[:, c] += step
+            numeric = (self.graph.health(shifted) - self.graph.health(self.matrix)) / step
+            np.testing.assert_allclose(gradient[:, c], np.nan_to_num(numeric), atol=1e-6)
+        assert (gradient[::4, 1] == 0).all()
+        assert gradient[1, 0] < 0 and gradient[1, 1] < 0
+
+    def test_scorecard_batch_uses_graph(self):
+        """generate_scorecard_batch should report the graph IHI."""
+        frame = self.scorer.generate_scorecard_batch(self.matrix)
+        np.testing.assert_allclose(
+            frame['integration_health_index'], self.graph.health(self.matrix).round(3))
+
+    def test_invalid_graphs(self):
+        """Unknown nodes, bad weights and mismatched matrices should be rejected."""
+        with pytest.raises(ValueError):
+            IntegrationGraph([(1, 9)], nodes=[1, 2])
+        with pytest.raises(ValueError):
+            IntegrationGraph([(1, 2)], edge_weights=[1.0, 2.0])
+        with pytest.raises(ValueError):
+            IntegrationGraph([(1, 2)], edge_weights=[-1.0])
+        with pytest.raises(ValueError):
+            self.graph.health(np.zeros((2, 6)))
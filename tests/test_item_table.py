@@ -0,0 +1,86 @@
+"""
+Tests for the columnar ItemTable and its use by the scorers.
+"""
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import ADLIScorer, LeTCIScorer, ItemTable, IndicatorRangeError
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+
+
+class TestItemTableConversion:
+    """Tests for converting JSON and nested dicts to ItemTable."""
+
+    def test_from_sample_data(self, sample_data):
+        """Sample JSON should convert to one row per item."""
+        table = ItemTable.from_organization_data(
+            sample_data, category_targets=sample_data['targets_2025']
+        )
+        assert len(table) == 21
+        assert table.category.dtype == np.int32
+        assert table.indicators.shape == (21, 4)
+        assert table.indicators.flags['C_CONTIGUOUS']
+        assert not np.isnan(table.indicators).any()
+        assert table.target[table.category == 7][0] == 95
+
+    def test_from_score_dicts_round_trip(self):
+        """Nested score dicts should survive a round trip."""
+        current = {1: {1: 70.0, 2: 75.0}, 2: {1: 60.0}}
+        targets = {1: {1: 85.0, 2: 85.0}, 2: {1: 80.0}}
+        table = ItemTable.from_score_dicts(current, targets)
+        assert table.to_score_dict() == current
+        assert table.to_score_dict('target') == targets
+
+    def test_from_organizations_numbers_orgs(self, sample_data):
+        """Multiple organizations should receive consecutive org ids."""
+        table = ItemTable.from_organizations([sample_data, sample_data])
+        assert len(table) == 42
+        assert set(table.org_id.tolist()) == {0, 1}
+
+    def test_missing_columns_default_to_nan(self):
+        """Omitted score/target columns should be NaN arrays of the table's length."""
+        table = ItemTable(org_id=[0, 0], category=[1, 7], item=[1, 1],
+                          indicators=np.zeros((2, 4)))
+        assert table.score.shape == table.target.shape == (2,)
+        assert np.isnan(table.score).all() and np.isnan(table.target).all()
+        assert np.isnan(table.take(slice(1, None)).target).all()
+
+    def test_mismatched_lengths_rejected(self):
+        """Columns of different lengths should be rejected."""
+        with pytest.raises(ValueError):
+            ItemTable(org_id=[0], category=[1, 2], item=[1, 2], indicators=np.zeros((2, 4)))
+
+
+class TestScorersAcceptItemTable:
+    """Tests for native ItemTable support in the scorers."""
+
+    def test_scores_match_expert_sample(self, sample_data):
+        """Scoring the sample table should match the scalar scorers."""
+        table = ItemTable.from_organization_data(sample_data)
+        scored = OrganizationalScorer().score_item_table(table)
+        adli, letci = ADLIScorer(), LeTCIScorer()
+        for row in range(len(table)):
+            if table.category[row] <= 6:
+                keys, scorer = ADLIScorer.INDICATOR_KEYS, adli
+            else:
+                keys, scorer = LeTCIScorer.INDICATOR_KEYS, letci
+            expected = scorer.compute_score(dict(zip(keys, table.indicators[row])))
+            assert scored.score[row] == pytest.approx(expected, abs=0.01)
+
+    def test_adli_scores_only_process_rows(self, sample_data):
+        """ADLIScorer should leave results rows as NaN."""
+        table = ItemTable.from_organization_data(sample_data)
+        scores = ADLIScorer().compute_score_batch(table)
+        assert np.isnan(scores[table.results_mask]).all()
+        assert not np.isnan(scores[table.process_mask]).any()
+
+    def test_range_error_uses_table_rows(self, sample_data):
+        """Range errors should report row indices of the whole table."""
+        table = ItemTable.from_organization_data(sample_data)
+        last = len(table) - 1
+        assert table.category[last] == 7
+        table.indicators[last, 0] = 1.2
+        with pytest.raises(IndicatorRangeError) as excinfo:
+            LeTCIScorer().compute_score_batch(table)
+        assert list(excinfo.value.rows) == [last]
@@ -0,0 +1,64 @@
+"""
+Tests for the closed-form marginal-gain index.
+"""
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import ItemTable, ScenarioEngine, marginal_gain_index
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+from edcellence.data import load_sample_data
+
+
+class TestMarginalGainIndex:
+    """Tests for org score and IHI derivatives per indicator."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(24)
+        self.table = ItemTable.from_organizations([load_sample_data()] * 3)
+        self.table.indicators = np.clip(
+            self.table.indicators + rng.normal(0, 0.1, self.table.indicators.shape), 0.05, 0.95)
+        self.scorer = OrganizationalScorer()
+        self.index = marginal_gain_index(self.table, self.scorer)
+
+    def test_matches_perturbation(self):
+        """Derivatives should match perturbing each indicator one at a time."""
+        engine = ScenarioEngine(self.table, self.scorer)
+        step = 1e-4
+        n = len(self.table)
+        cells = np.arange(n * 4)
+        result = engine.run_deltas(np.arange(n * 4), cells // 4, cells % 4, np.full(n * 4, step))
+
+        org_row = np.searchsorted(engine.org_id, self.table.org_id)
+        rows = np.repeat(org_row, 4)
+        d_org = (result.org_scores[cells, rows] - engine.org_score[rows]) / step
+        d_ihi = (result.ihi[cells, rows] - engine.ihi[rows]) / step
+        np.testing.assert_allclose(self.index.d_org_score.ravel(), d_org, rtol=1e-6)
+        np.testing.assert_allclose(self.index.d_ihi.ravel(), d_ihi, atol=1e-6)
+
+    def test_frame_is_sorted_index(self):
+        """The frame should hold every indicator, sorted by the chosen column."""
+        frame = self.index.frame()
+        assert len(frame) == 4 * len(self.table)
+        assert frame['d_org_score'].is_monotonic_decreasing
+        assert set(frame.loc[frame['category'] == 7, 'indicator']) == {
+            'R_Lv', 'R_Tr', 'R_Cp', 'R_I'}
+
+        top = self.index.top(5, by='org_gain_to_max')
+        np.testing.assert_allclose(top['org_gain_to_max'],
+                                   top['d_org_score'] * (1 - top['value']))
+        assert top['org_gain_to_max'].is_monotonic_decreasing
+        with pytest.raises(ValueError):
+            self.index.frame(by='value')
+
+    def test_item_weights(self):
+        """Custom item weights should scale each item's derivative."""
+        segment = self.table.org_id * 10 + self.table.category
+        first = np.unique(segment, return_index=True)[1]
+        weights = np.zeros(len(self.table))
+        weights[first] = 1.0
+        index = marginal_gain_index(self.table, self.scorer, item_weights=weights)
+        assert (index.d_org_score[weights == 0] == 0).all()
+        np.testing.assert_allclose(
+            index.d_org_score[first],
+            self.index.d_org_score[first] * np.bincount(segment)[segment[first]][:, None])
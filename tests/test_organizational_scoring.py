@@ -10,12 +10,18 @@ Tests validate all core algorithms:
 - Scorecard generation
 """
 
+import sys
+
 import pytest
 import numpy as np
 import pandas as pd
 
 # Import from edcellence package
-from edcellence.algorithms.organizational_scoring import OrganizationalScorer, ScoreResult
+from edcellence.algorithms import ItemTable
+from edcellence.data import load_sample_data
+from edcellence.algorithms.organizational_scoring import (
+    ITEM_RESULT_DTYPE, OrganizationalScorer, ScoreResult, ScoreResultSet
+)
 
 
 class TestADLIScoring:
@@ -282,6 +288,16 @@ class TestMaturityLevels:
             assert isinstance(level, str)
             assert len(level) > 0
 
+    def test_nan_is_lowest_band(self):
+        """NaN scores and IHI should fall in the lowest band."""
+        assert self.scorer.maturity_level(np.nan).startswith('Initial')
+        assert self.scorer.interpret_ihi(np.nan).startswith('Poor')
+
+        scores = {1: np.nan, 2: 65, 3: 82, 4: 70, 5: 75, 6: 70, 7: 78}
+        scorecard = self.scorer.generate_scorecard(scores, include_ihi=True)
+        assert scorecard['maturity_level'].startswith('Initial')
+        assert scorecard['ihi_interpretation'].startswith('Poor')
+
 
 class TestDataValidation:
     """Tests for input validation and edge cases."""
@@ -303,5 +319,155 @@ class TestDataValidation:
         assert len(result) == 0
 
 
+class TestFusedItemScoring:
+    """Tests for the single-pass and batch item scoring paths."""
+
+    def setup_method(self):
+        self.scorer = OrganizationalScorer()
+
+    def test_confidence_ignores_extra_keys(self):
+        """Confidence should use only the four scored indicators."""
+        indicators = {'P_A': 0.6, 'P_D': 0.6, 'P_L': 0.6, 'P_I': 0.6}
+        plain = self.scorer.compute_item_score(1, 1, indicators)
+        extra = self.scorer.compute_item_score(1, 1, {**indicators, 'note_weight': 40.0})
+        assert plain.confidence == pytest.approx(1.0)
+        assert extra.confidence == pytest.approx(plain.confidence)
+
+    def test_invalid_indicator_raises(self):
+        """Out-of-range indicators should still raise ValueError."""
+        with pytest.raises(ValueError):
+            self.scorer.compute_item_score(1, 1, {'P_A': 1.2, 'P_D': 0.6, 'P_L': 0.6, 'P_I': 0.6})
+
+    def test_batch_matches_item_scoring(self, sample_data):
+        """Batch records should match compute_item_score for every item."""
+        table = ItemTable.from_organization_data(sample_data)
+        records = self.scorer.compute_item_score_batch(table)
+        assert len(records) == len(table)
+        for record in records:
+            cat, item = int(record['category']), int(record['item'])
+            indicators = sample_data['categories'][str(cat)]['items'][str(item)]['indicators']
+            result = self.scorer.compute_item_score(cat, item, indicators)
+            assert record['score'] == pytest.approx(result.score, abs=0.01)
+            assert record['confidence'] == pytest.approx(result.confidence)
+            np.testing.assert_allclose(record['breakdown'], list(result.breakdown.values()),
+                                       atol=0.01)
+
+
+class TestBatchScorecard:
+    """Tests for the multi-organization scorecard."""
+
+    def setup_method(self):
+        self.scorer = OrganizationalScorer()
+        rng = np.random.default_rng(13)
+        self.matrix = rng.uniform(20, 100, size=(200, 7)).round(1)
+
+    def test_matches_scalar_scorecards(self):
+        """Every row should match generate_scorecard on the same scores."""
+        frame = self.scorer.generate_scorecard_batch(self.matrix)
+        assert len(frame) == len(self.matrix)
+
+        for row, scores in zip(frame.itertuples(), self.matrix):
+            scalar = self.scorer.generate_scorecard(dict(enumerate(scores.tolist(), start=1)))
+            assert row.organizational_score == pytest.approx(scalar['organizational_score'])
+            assert row.confidence == pytest.approx(scalar['confidence'])
+            assert row.integration_health_index == pytest.approx(
+                scalar['integration_health_index'])
+            assert row.ihi_interpretation == scalar['ihi_interpretation']
+            assert row.maturity_level == scalar['maturity_level']
+
+    def test_bands_are_ordered_categoricals(self):
+        """Band columns should be ordered categoricals with every level listed."""
+        frame = self.scorer.generate_scorecard_batch(self.matrix)
+        for column in ('maturity_level', 'ihi_interpretation'):
+            assert isinstance(frame[column].dtype, pd.CategoricalDtype)
+            assert frame[column].cat.ordered
+        assert frame['maturity_level'].cat.categories[-1].startswith('Advanced')
+
+    def test_band_boundaries(self):
+        """Thresholds should be inclusive lower bounds, as in the scalar path."""
+        matrix = np.repeat(np.array([[39.99], [40.0], [60.0], [75.0], [90.0]]), 7, axis=1)
+        levels = self.scorer.generate_scorecard_batch(matrix)['maturity_level']
+        assert [level.split(' ')[0] for level in levels] == [
+            'Initial', 'Emerging', 'Developing', 'Mature', 'Advanced'
+        ]
+
+    def test_missing_categories(self):
+        """NaN categories should be skipped like missing dict keys."""
+        scores = {1: 75, 2: 65, 4: 70, 7: 78}
+        row = np.full((1, 7), np.nan)
+        for category, score in scores.items():
+            row[0, category - 1] = score
+
+        frame = self.scorer.generate_scorecard_batch(row, org_ids=[42])
+        scalar = self.scorer.generate_scorecard(scores)
+        assert frame['org_id'].iloc[0] == 42
+        assert frame['organizational_score'].iloc[0] == pytest.approx(
+            scalar['organizational_score'])
+        assert frame['integration_health_index'].iloc[0] == pytest.approx(
+            scalar['integration_health_index'])
+
+    def test_without_ihi(self):
+        """include_ihi=False should omit the IHI columns."""
+        frame = self.scorer.generate_scorecard_batch(self.matrix, include_ihi=False)
+        assert 'integration_health_index' not in frame.columns
+
+    def test_invalid_shape(self):
+        """Matrices without seven columns should be rejected."""
+        with pytest.raises(ValueError):
+            self.scorer.generate_scorecard_batch(np.zeros((3, 6)))
+
+
+class TestScoreResultStorage:
+    """Tests for slotted ScoreResult records and ScoreResultSet."""
+
+    def setup_method(self):
+        self.scorer = OrganizationalScorer()
+        self.data = load_sample_data()
+        self.table = ItemTable.from_organization_data(self.data)
+        self.results = self.scorer.compute_item_results(self.table)
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_score_result_has_slots(self):
+        """ScoreResult instances should not carry a per-instance __dict__."""
+        result = ScoreResult(score=1.0, category=1, item=1, breakdown={})
+        assert not hasattr(result, '__dict__')
+
+    def test_rows_match_scalar_results(self):
+        """Materialized rows should equal compute_item_score results."""
+        assert len(self.results) == len(self.table)
+        for result in self.results:
+            indicators = self.data['categories'][str(result.category)]['items'][
+                str(result.item)]['indicators']
+            expected = self.scorer.compute_item_score(result.category, result.item, indicators)
+            assert isinstance(result, ScoreResult)
+            assert result.score == pytest.approx(expected.score, abs=0.01)
+            assert result.breakdown == pytest.approx(expected.breakdown, abs=0.01)
+            assert result.confidence == pytest.approx(expected.confidence)
+            assert result.metadata == expected.metadata
+
+    def test_subsets_stay_array_backed(self):
+        """Slices and masks should return ScoreResultSets sharing the row data."""
+        results_only = self.results[self.results.category == 7]
+        assert isinstance(results_only, ScoreResultSet)
+        assert len(results_only) == 3
+        assert results_only[0].metadata == {'method': 'LeTCI'}
+        assert len(self.results[:5]) == 5
+
+    def test_records_round_trip(self):
+        """to_records/from_records should preserve every column."""
+        records = self.results.to_records()
+        assert records.dtype == ITEM_RESULT_DTYPE
+        again = ScoreResultSet.from_records(records)
+        np.testing.assert_array_equal(again.breakdown, self.results.breakdown)
+        np.testing.assert_array_equal(again.item, self.results.item)
+        assert list(self.results.to_frame().columns[:5]) == [
+            'org_id', 'category', 'item', 'score', 'confidence']
+
+    def test_mismatched_lengths(self):
+        """Parallel arrays must have equal lengths."""
+        with pytest.raises(ValueError):
+            ScoreResultSet(np.zeros(3), np.ones(2), np.ones(3), np.ones(3), np.zeros((3, 5)))
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,86 @@
+"""
+Tests for sharded, process-pool corpus scoring.
+"""
+
+import json
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from edcellence.algorithms import ItemTable, rollup_scores, score_corpus
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+from edcellence.data import load_sample_data
+
+
+class TestParallelScoring:
+    """Tests that sharded scoring matches single-process scoring."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(19)
+        self.scorer = OrganizationalScorer()
+        self.organizations = []
+        for _ in range(6):
+            data = load_sample_data()
+            for category in data['categories'].values():
+                for item in category['items'].values():
+                    item['indicators'] = {
+                        key: round(float(rng.uniform()), 2) for key in item['indicators']
+                    }
+            self.organizations.append(data)
+        self.table = ItemTable.from_organizations(
+            self.organizations, category_targets=self.organizations[0]['targets_2025'])
+
+    def _expected(self, top_k):
+        scored = self.scorer.score_item_table(self.table)
+        rollup = self.scorer.compute_rollups(scored)
+        return rollup, self.scorer.compute_gap_analysis(scored, top_k=top_k)
+
+    def test_in_process_matches_single_pass(self):
+        """Shard merging should reproduce the single-pass rollup and top-K."""
+        rollup, gap = self._expected(top_k=10)
+        result = score_corpus(self.table, shard_size=17, max_workers=1, top_k=10)
+
+        assert result.n_workers == 1 and result.n_shards == 8
+        assert result.n_items == len(self.table)
+        np.testing.assert_allclose(result.rollup.org_score, rollup.org_score, atol=1e-9)
+        np.testing.assert_allclose(result.rollup.category_score, rollup.category_score, atol=1e-9)
+        pd.testing.assert_frame_equal(result.gap, gap)
+
+    def test_process_pool_matches_in_process(self):
+        """Results should not depend on the number of workers."""
+        serial = score_corpus(self.table, shard_size=20, max_workers=1, top_k=15)
+        pooled = score_corpus(self.table, shard_size=20, max_workers=2, top_k=15)
+
+        assert pooled.n_workers == 2
+        np.testing.assert_array_equal(pooled.rollup.org_score, serial.rollup.org_score)
+        pd.testing.assert_frame_equal(pooled.gap, serial.gap)
+
+    def test_file_corpus(self, tmp_path):
+        """A list of JSON files should score like the equivalent table."""
+        paths = []
+        for i, data in enumerate(self.organizations):
+            path = tmp_path / f'org_{i}.json'
+            path.write_text(json.dumps(data))
+            paths.append(path)
+
+        result = score_corpus(paths, shard_size=4, max_workers=2, top_k=10,
+                              targets_key='targets_2025')
+        rollup, gap = self._expected(top_k=10)
+        np.testing.assert_allclose(result.rollup.org_score, rollup.org_score, atol=1e-9)
+        np.testing.assert_array_equal(result.gap['priority'], gap['priority'])
+
+    def test_custom_weights(self):
+        """Category weights should be applied to the merged rollup."""
+        weights = {1: 0.4, 2: 0.1, 3: 0.1, 4: 0.1, 5: 0.1, 6: 0.1, 7: 0.1}
+        result = score_corpus(self.table, category_weights=weights, shard_size=50,
+                              max_workers=1)
+        scored = self.scorer.score_item_table(self.table)
+        expected = rollup_scores(scored.score, scored.category, scored.org_id,
+                                 category_weights=weights)
+        np.testing.assert_allclose(result.rollup.org_score, expected.org_score, atol=1e-9)
+
+    def test_empty_corpus(self):
+        """An empty corpus should be rejected."""
+        with pytest.raises(ValueError):
+            score_corpus([])
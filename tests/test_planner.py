@@ -0,0 +1,127 @@
+"""
+Tests for budget-constrained improvement planning.
+"""
+
+from itertools import product
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import ItemTable, plan_improvements
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+from edcellence.data import load_sample_data
+
+
+class TestPlanImprovements:
+    """Tests for knapsack and IHI planning paths."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(11)
+        self.table = ItemTable.from_organizations([load_sample_data()] * 2)
+        self.table.indicators = np.clip(
+            self.table.indicators + rng.normal(0, 0.1, self.table.indicators.shape), 0, 1)
+        self.costs = rng.integers(1, 20, len(self.table)).astype(float)
+        self.scorer = OrganizationalScorer()
+
+    def _org_scores(self, table):
+        """Organization scores of a table from the rollup pipeline."""
+        scored = self.scorer.score_item_table(table)
+        rollup = self.scorer.compute_rollups(scored)
+        return rollup.org_score
+
+    def test_exact_org_score_matches_brute_force(self):
+        """The DP should find the best subset of a small instance."""
+        sub = self.table.take(np.arange(12))
+        costs = self.costs[:12]
+        plan = plan_improvements(sub, costs, deltas=0.2, budget=30, method='exact')
+
+        single = np.array([
+            plan_improvements(sub, np.where(np.arange(12) == i, 0.0, 1e9), 0.2, 0).gain
+            for i in range(12)
+        ])
+        best = max(
+            single @ mask for mask in map(np.array, product([0, 1], repeat=12))
+            if costs @ mask <= 30
+        )
+        assert plan.method == 'exact'
+        assert plan.gain == pytest.approx(best)
+        assert plan.total_cost <= 30
+        assert plan.gain <= plan.upper_bound + 1e-9
+
+    def test_plan_gain_matches_rescoring(self):
+        """Applying the funded deltas should raise org scores by the planned gain."""
+        plan = plan_improvements(self.table, self.costs, deltas=0.1, budget=60)
+        improved = self.table.take(np.arange(len(self.table)))
+        improved.indicators = self.table.indicators.copy()
+        improved.indicators[plan.selected] = np.clip(
+            improved.indicators[plan.selected] + 0.1, 0, 1)
+
+        gain = self._org_scores(improved) - self._org_scores(self.table)
+        np.testing.assert_allclose(plan.org_frame()['gain'], gain, atol=0.02)
+        assert list(plan.items.columns) == [
+            'org_id', 'category', 'item', 'cost', 'current_score', 'planned_score',
+            'target_score', 'score_gain']
+
+    def test_greedy_is_close_to_exact_and_bound(self):
+        """Greedy should stay within the budget and near the exact optimum."""
+        exact = plan_improvements(self.table, self.costs, 0.1, 50, method='exact')
+        greedy = plan_improvements(self.table, self.costs, 0.1, 50, method='greedy')
+        assert greedy.method == 'greedy'
+        assert greedy.total_cost <= 50
+        assert greedy.gain <= exact.gain + 1e-9
+        assert greedy.gain >= 0.9 * exact.gain
+        assert exact.gain <= exact.upper_bound + 1e-9
+
+    def test_cap_at_target(self):
+        """Capped gains should never lift an item above its target."""
+        self.table.target = np.full(len(self.table), 70.0)
+        plan = plan_improvements(self.table, self.costs, 0.3, 1000, cap_at_target=True)
+        items = plan.items
+        assert (items['planned_score'] <= np.maximum(items['current_score'], 70.0) + 1e-9).all()
+        assert (items['current_score'] < 70.0).all()
+
+    def test_ihi_exact_and_greedy(self):
+        """IHI plans should improve the index and greedy should not beat exact."""
+        sub = self.table.take(np.r_[0:6, 21:27])
+        costs = self.costs[:12]
+        exact = plan_improvements(sub, costs, 0.3, 25, objective='ihi', method='exact')
+        greedy = plan_improvements(sub, costs, 0.3, 25, objective='ihi', method='greedy')
+        assert exact.gain > 0
+        assert greedy.gain <= exact.gain + 1e-12
+        assert np.isnan(exact.upper_bound)
+
+        ihi = self.scorer.compute_integration_health_index_batch(
+            self.scorer.compute_rollups(self.scorer.score_item_table(sub)).category_matrix())
+        np.testing.assert_allclose(exact.before, ihi, atol=1e-3)
+
+    def test_auto_falls_back_to_greedy(self):
+        """Instances too large for the exact paths should be solved greedily."""
+        plan = plan_improvements(self.table, self.costs, 0.1, 50, objective='ihi')
+        assert plan.method == 'greedy'
+        with pytest.raises(ValueError):
+            plan_improvements(self.table, self.costs, 0.1, 50, objective='ihi', method='exact')
+
+    def test_large_budget_funds_every_candidate(self):
+        """Budgets beyond the total candidate cost should not size the DP table."""
+        empty = plan_improvements(self.table, self.costs, deltas=0.0, budget=1e12)
+        assert empty.method == 'exact' and not empty.selected.any()
+        assert empty.gain == 0.0
+
+        plan = plan_improvements(self.table, self.costs, deltas=0.1, budget=1e12)
+        assert plan.method == 'exact' and (plan.items['score_gain'] > 0).all()
+        assert plan.gain == pytest.approx(plan.upper_bound)
+
+    def test_invalid_arguments(self):
+        """Invalid objectives, costs, deltas and budgets should be rejected."""
+        with pytest.raises(ValueError):
+            plan_improvements(self.table, self.costs, 0.1, 10, objective='revenue')
+        with pytest.raises(ValueError):
+            plan_improvements(self.table, self.costs[:5], 0.1, 10)
+        with pytest.raises(ValueError):
+            plan_improvements(self.table, -self.costs, 0.1, 10)
+        with pytest.raises(ValueError):
+            plan_improvements(self.table, self.costs, np.nan, 10)
+        with pytest.raises(ValueError):
+            plan_improvements(self.table, self.costs, [0.1, 0.1, np.inf, 0.1], 10)
+        with pytest.raises(ValueError):
+            plan_improvements(self.table, self.costs, 0.1, -1)
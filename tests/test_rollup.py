@@ -0,0 +1,83 @@
+"""
+Tests for segmented category and organization rollups.
+"""
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import ADLIScorer, ItemTable, rollup_scores
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+from edcellence.algorithms.rollup import segment_index
+
+
+class TestSegmentedRollup:
+    """Tests for rollup_scores against the scalar aggregation path."""
+
+    def setup_method(self):
+        self.scorer = OrganizationalScorer()
+        rng = np.random.default_rng(4)
+        # Three orgs with ragged item counts per category
+        self.org_id = np.repeat([0, 1, 2], [30, 12, 21])
+        self.category = np.concatenate([
+            rng.integers(1, 8, size=30),
+            np.repeat(np.arange(1, 7), 2),
+            np.repeat(np.arange(1, 8), 3)
+        ])
+        self.scores = rng.uniform(40, 95, size=len(self.category))
+
+    def test_matches_scalar_path(self):
+        """Category and org scores should match the per-dict scalar methods."""
+        result = rollup_scores(self.scores, self.category, self.org_id,
+                               category_weights=self.scorer.category_weights)
+        adli = ADLIScorer()
+        for org in range(3):
+            in_org = self.org_id == org
+            expected_categories = {}
+            for cat in np.unique(self.category[in_org]):
+                rows = np.flatnonzero(in_org & (self.category == cat))
+                expected_categories[int(cat)] = adli.compute_category_score(
+                    {i: self.scores[i] for i in rows}
+                )
+                seg = (result.category_org == org) & (result.category == cat)
+                assert result.category_score[seg][0] == pytest.approx(
+                    expected_categories[cat], abs=0.01
+                )
+            expected_org = self.scorer.compute_organizational_score(expected_categories).score
+            assert result.org_score[org] == pytest.approx(expected_org, abs=0.01)
+
+    def test_segment_index_order(self):
+        """Segments should be numbered by org, then category, as in the rollup."""
+        segment_org, segment_category, segment = segment_index(self.org_id, self.category)
+        result = rollup_scores(self.scores, self.category, self.org_id)
+        np.testing.assert_array_equal(segment_org, result.category_org)
+        np.testing.assert_array_equal(segment_category, result.category)
+        np.testing.assert_array_equal(segment_org[segment], self.org_id)
+        np.testing.assert_array_equal(segment_category[segment], self.category)
+
+    def test_item_weights(self):
+        """Explicit item weights should be used within each segment."""
+        result = rollup_scores(np.array([80.0, 60.0, 50.0]), np.array([1, 1, 2]),
+                               item_weights=np.array([0.75, 0.25, 1.0]))
+        np.testing.assert_allclose(result.category_score, [75.0, 50.0])
+
+    def test_bad_item_weights_reported(self):
+        """Segments whose weights do not sum to 1 should all be reported."""
+        with pytest.raises(ValueError, match=r'\(0, 1\).*\(0, 2\)'):
+            rollup_scores(np.array([80.0, 60.0, 50.0]), np.array([1, 1, 2]),
+                          item_weights=np.array([0.5, 0.25, 0.5]))
+
+    def test_category_matrix(self):
+        """category_matrix should place scores by org row and category column."""
+        result = rollup_scores(self.scores, self.category, self.org_id)
+        matrix = result.category_matrix()
+        assert matrix.shape == (3, 7)
+        assert np.isnan(matrix[1, 6])
+        assert not np.isnan(matrix[2]).any()
+
+    def test_scorer_rollups_from_table(self, sample_data):
+        """compute_rollups should reproduce the sample organization's category means."""
+        table = ItemTable.from_organization_data(sample_data)
+        result = self.scorer.compute_rollups(self.scorer.score_item_table(table))
+        assert len(result.org_score) == 1
+        assert result.category.tolist() == list(range(1, 8))
+        assert np.all(result.item_count == 3)
@@ -0,0 +1,98 @@
+"""
+Tests for batched what-if scenarios.
+"""
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import ItemTable, Scenario, ScenarioEngine
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+from edcellence.data import load_sample_data
+
+
+class TestScenarioEngine:
+    """Tests for scenario batching against a compiled baseline."""
+
+    def setup_method(self):
+        self.scorer = OrganizationalScorer()
+        self.table = ItemTable.from_organizations([load_sample_data()] * 3)
+        self.engine = ScenarioEngine(self.table, self.scorer)
+
+    def _rerun(self, mask, column, delta):
+        """Full pipeline re-run with one indicator column shifted on masked rows."""
+        table = self.table.take(np.arange(len(self.table)))
+        table.indicators = self.table.indicators.copy()
+        table.indicators[mask, column] = np.clip(table.indicators[mask, column] + delta, 0, 1)
+        rollup = self.scorer.compute_rollups(self.scorer.score_item_table(table))
+        ihi = self.scorer.compute_integration_health_index_batch(rollup.category_matrix())
+        return rollup, ihi
+
+    def test_empty_scenario_is_baseline(self):
+        """A scenario without deltas should reproduce the baseline pipeline."""
+        rollup, ihi = self._rerun(np.zeros(len(self.table), dtype=bool), 0, 0.0)
+        result = self.engine.run([Scenario('baseline')])
+
+        np.testing.assert_allclose(result.org_scores[0], rollup.org_score, atol=0.01)
+        np.testing.assert_allclose(result.ihi[0], ihi, atol=1e-3)
+        assert result.category_delta.nnz == 0
+        assert len(result.gaps) == 0
+
+    def test_scenario_matches_full_rerun(self):
+        """Scenario scores should match re-running the pipeline on edited indicators."""
+        scenario = Scenario('deploy', {'P_D': 0.15}, category=2, org_id=1)
+        result = self.engine.run([scenario])
+        mask = (self.table.category == 2) & (self.table.org_id == 1)
+        rollup, ihi = self._rerun(mask, 1, 0.15)
+
+        np.testing.assert_allclose(result.org_scores[0], rollup.org_score, atol=0.02)
+        np.testing.assert_allclose(result.ihi[0], ihi, atol=1e-3)
+        np.testing.assert_allclose(result.category_scores(0), rollup.category_score, atol=0.02)
+
+        changed = result.category_frame()
+        assert changed[['org_id', 'category']].values.tolist() == [[1, 2]]
+        assert (result.org_scores[0, [0, 2]] == self.engine.org_score[[0, 2]]).all()
+
+    def test_batch_matches_individual_runs(self):
+        """Scenarios in one batch should not influence each other."""
+        scenarios = [
+            Scenario('deploy', {'P_D': 0.15}, category=2),
+            Scenario('trend', {'R_Tr': 0.2}, org_id=0),
+            Scenario('learn', {'P_L': -0.3, 'P_I': 0.1}, category=6, item=1),
+        ]
+        batch = self.engine.run(scenarios)
+        for i, scenario in enumerate(scenarios):
+            single = self.engine.run([scenario])
+            np.testing.assert_allclose(batch.org_scores[i], single.org_scores[0])
+            np.testing.assert_allclose(batch.ihi[i], single.ihi[0])
+        assert batch.org_frame()['scenario'].unique().tolist() == ['deploy', 'trend', 'learn']
+
+    def test_duplicate_deltas_are_summed_before_clipping(self):
+        """Entries for the same indicator should be summed and clipped once."""
+        row = int(np.flatnonzero(self.table.process_mask)[0])
+        x = self.table.indicators[row, 0]
+        result = self.engine.run_deltas(
+            scenario=[0, 0, 1], row=[row, row, row], column=[0, 0, 0],
+            delta=[0.6, -0.6, 2.0]
+        )
+        gaps = result.gaps
+        assert gaps['scenario'].tolist() == ['scenario_1']
+        weight = self.scorer.adli_scorer.weight_vector[0]
+        expected = self.engine.item_score[row] + 100 * weight * (1.0 - x)
+        assert gaps['scenario_score'].iloc[0] == pytest.approx(expected)
+
+    def test_changed_gap_priorities(self):
+        """Gap rows should cover exactly the changed items with new priorities."""
+        engine = ScenarioEngine(self.table, criticality={(2, 1): 1.0})
+        result = engine.run([Scenario('deploy', {'P_D': 0.15}, category=2, org_id=0)])
+        gaps = result.gaps
+        assert len(gaps) == ((self.table.category == 2) & (self.table.org_id == 0)).sum()
+        assert (gaps['priority_after'] < gaps['priority_before']).all()
+        assert gaps['priority_after'].is_monotonic_decreasing
+        top = gaps[gaps['item'] == 1].iloc[0]
+        assert top['priority_after'] == pytest.approx(
+            (top['target_score'] - top['scenario_score']) * 1.0 * 0.5)
+
+    def test_unknown_indicator(self):
+        """Scenarios with unknown indicator keys should be rejected."""
+        with pytest.raises(ValueError):
+            self.engine.run([Scenario('bad', {'P_X': 0.1})])
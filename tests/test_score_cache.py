@@ -0,0 +1,98 @@
+"""
+Tests for the LRU item score cache.
+"""
+
+import pytest
+
+from edcellence.algorithms import ADLIScorer, LeTCIScorer, ScoreCache
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+
+
+class TestScoreCache:
+    """Tests for ScoreCache and its scorer integration."""
+
+    def setup_method(self):
+        self.cache = ScoreCache(maxsize=4)
+        self.adli = {'P_A': 0.75, 'P_D': 0.45, 'P_L': 0.60, 'P_I': 0.55}
+        self.letci = {'R_Lv': 0.85, 'R_Tr': 0.90, 'R_Cp': 0.75, 'R_I': 0.70}
+
+    def test_cached_results_match_uncached(self):
+        """Cached scores and item results should equal the uncached path."""
+        cached = OrganizationalScorer(cache=self.cache)
+        plain = OrganizationalScorer()
+        for _ in range(3):
+            for category, indicators in ((1, self.adli), (7, self.letci)):
+                a = cached.compute_item_score(category, 1, indicators)
+                b = plain.compute_item_score(category, 1, indicators)
+                assert (a.score, a.breakdown, a.confidence, a.metadata) == (
+                    b.score, b.breakdown, b.confidence, b.metadata)
+        assert self.cache.stats()['hits'] == 4
+        assert self.cache.stats()['misses'] == 2
+
+    def test_breakdown_copies_are_independent(self):
+        """Mutating a returned breakdown must not corrupt the cache."""
+        scorer = OrganizationalScorer(cache=self.cache)
+        scorer.compute_item_score(1, 1, self.adli).breakdown['Total'] = -1
+        assert scorer.compute_item_score(1, 1, self.adli).breakdown['Total'] == 59.0
+
+    def test_keys_include_weights_and_method(self):
+        """Scorers with different weights or methods must not share entries."""
+        values = {'P_A': 0.5, 'P_D': 0.5, 'P_L': 0.5, 'P_I': 1.0}
+        default = ADLIScorer(cache=self.cache)
+        custom = ADLIScorer({'w_A': 0.1, 'w_D': 0.1, 'w_L': 0.1, 'w_I': 0.7}, cache=self.cache)
+        assert default.compute_score(values) == 60.0
+        assert custom.compute_score(values) == 85.0
+        assert self.cache.stats()['misses'] == 2
+
+    def test_lru_eviction(self):
+        """The least recently used entry should be evicted at maxsize."""
+        scorer = LeTCIScorer(cache=self.cache)
+        vectors = [dict(self.letci, R_I=v) for v in (0.1, 0.2, 0.3, 0.4)]
+        for indicators in vectors:
+            scorer.compute_score(indicators)
+        scorer.compute_score(vectors[0])                       # refresh 0.1
+        scorer.compute_score(dict(self.letci, R_I=0.5))        # evicts 0.2
+
+        stats = self.cache.stats()
+        assert stats['evictions'] == 1 and stats['size'] == 4
+        scorer.compute_score(vectors[0])
+        assert self.cache.stats()['hits'] == 2
+        scorer.compute_score(vectors[1])
+        assert self.cache.stats()['misses'] == 6
+
+    def test_quantization(self):
+        """Indicators equal after rounding to ``decimals`` should share an entry."""
+        scorer = ADLIScorer(cache=ScoreCache(decimals=3))
+        scorer.compute_score(self.adli)
+        scorer.compute_score(dict(self.adli, P_A=0.75 + 1e-6))
+        assert scorer.cache.stats()['hits'] == 1
+
+    def test_entries_do_not_depend_on_call_order(self):
+        """Entries should be computed from the quantized key, not the first caller."""
+        inputs = ([0.12341], [0.12339])
+        entries = []
+        for ordered in (inputs, inputs[::-1]):
+            cache = ScoreCache(decimals=3)
+            entries.append([cache.get_or_compute('w', 'ADLI', v, list) for v in ordered])
+        assert entries[0] == entries[1] == [[0.123], [0.123]]
+
+    def test_disabled(self):
+        """A disabled cache should neither store entries nor count lookups."""
+        scorer = ADLIScorer(cache=self.cache)
+        with self.cache.disabled():
+            assert scorer.compute_score(self.adli) == 59.0
+        assert len(self.cache) == 0
+        assert self.cache.stats()['misses'] == 0
+        assert self.cache.enabled
+
+    def test_invalid_indicators_not_cached(self):
+        """Validation should still run before the cache is consulted."""
+        scorer = ADLIScorer(cache=self.cache)
+        with pytest.raises(ValueError):
+            scorer.compute_score(dict(self.adli, P_A=1.5))
+        assert len(self.cache) == 0
+
+    def test_invalid_maxsize(self):
+        """maxsize must be positive."""
+        with pytest.raises(ValueError):
+            ScoreCache(maxsize=0)
@@ -0,0 +1,143 @@
+"""
+Tests for vectorized weight sensitivity sweeps.
+"""
+
+from math import comb
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import (
+    ItemTable,
+    project_to_simplex,
+    sample_simplex_weights,
+    simplex_grid,
+    sweep_weights,
+)
+from edcellence.algorithms.adli_scoring import ADLIScorer
+from edcellence.algorithms.letci_scoring import LeTCIScorer
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+from edcellence.data import load_sample_data
+
+
+class TestSimplexWeights:
+    """Tests for simplex projection, grids and random sampling."""
+
+    def test_projection(self):
+        """Projected rows should be non-negative, sum to 1 and keep valid rows."""
+        rng = np.random.default_rng(0)
+        weights = rng.normal(size=(50, 4))
+        projected = project_to_simplex(weights)
+        assert projected.shape == (50, 4)
+        assert (projected >= 0).all()
+        np.testing.assert_allclose(projected.sum(axis=1), 1.0)
+
+        valid = np.array([0.30, 0.30, 0.20, 0.20])
+        np.testing.assert_allclose(project_to_simplex(valid), valid)
+        np.testing.assert_allclose(project_to_simplex([0.2, 0.9]), [0.15, 0.85])
+
+    def test_grid(self):
+        """The grid should hold every composition of 1/step into dims parts."""
+        grid = simplex_grid(4, step=0.1)
+        assert grid.shape == (comb(13, 3), 4)
+        np.testing.assert_allclose(grid.sum(axis=1), 1.0)
+        assert len(np.unique(np.round(grid, 9), axis=0)) == len(grid)
+        with pytest.raises(ValueError):
+            simplex_grid(4, step=0.3)
+
+    def test_sampling(self):
+        """Dirichlet samples should be valid weights centred on the centre."""
+        center = (0.40, 0.30, 0.20, 0.10)
+        samples = sample_simplex_weights(5000, center, concentration=200, seed=1)
+        np.testing.assert_allclose(samples.sum(axis=1), 1.0)
+        np.testing.assert_allclose(samples.mean(axis=0), center, atol=0.005)
+
+
+class TestSweepWeights:
+    """Tests for portfolio scoring under many weight sets."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(3)
+        tables = []
+        for org_id in range(5):
+            table = ItemTable.from_organization_data(load_sample_data(), org_id)
+            table.indicators = np.clip(
+                table.indicators + rng.normal(0, 0.1, table.indicators.shape), 0, 1)
+            tables.append(table)
+        self.table = ItemTable.concat(tables)
+        self.scorer = OrganizationalScorer()
+
+    def _scalar_org_scores(self, adli, letci, category):
+        """Organization scores from the rounded scalar pipeline."""
+        scorer = OrganizationalScorer(
+            category_weights={c: category[c - 1] for c in range(1, 8)},
+            adli_weights=dict(zip(ADLIScorer.WEIGHT_KEYS, adli)),
+            letci_weights=dict(zip(LeTCIScorer.WEIGHT_KEYS, letci))
+        )
+        return scorer.compute_rollups(scorer.score_item_table(self.table)).org_score
+
+    def test_baseline_matches_pipeline(self):
+        """The baseline should reproduce the rollup and shift nothing by itself."""
+        rollup = self.scorer.compute_rollups(self.scorer.score_item_table(self.table))
+        result = sweep_weights(self.table, adli_weights=self.scorer.adli_scorer.weight_vector)
+
+        np.testing.assert_allclose(result.baseline_org_scores, rollup.org_score, atol=0.01)
+        np.testing.assert_allclose(result.org_scores[0], result.baseline_org_scores)
+        summary = result.summary()
+        assert summary['band_changes'].iloc[0] == 0
+        assert summary['priority_changes'].iloc[0] == 0
+        assert summary['priority_top_k_overlap'].iloc[0] == 1.0
+        assert summary['org_rank_correlation'].iloc[0] == pytest.approx(1.0)
+
+    def test_tied_gaps_keep_baseline_top_k(self):
+        """Baseline weights should keep the whole top-K when met targets tie at 0."""
+        self.table.target = np.where(self.table.org_id < 4, 0.0, 100.0)
+        weights = np.tile(self.scorer.adli_scorer.weight_vector, (3, 1))
+        for chunk_size in (1, 3):
+            result = sweep_weights(self.table, adli_weights=weights, top_k=10,
+                                   chunk_size=chunk_size)
+            np.testing.assert_array_equal(result.priority_top_k_overlap, 1.0)
+            np.testing.assert_array_equal(result.top_priority[0], result.baseline_top_priority)
+        assert (result.baseline_top_priority[:4] == 0).all()
+
+    def test_matches_scalar_pipeline_per_weight_set(self):
+        """Every swept weight set should agree with a scorer built from it."""
+        adli = sample_simplex_weights(4, (0.3, 0.3, 0.2, 0.2), concentration=20, seed=5)
+        letci = sample_simplex_weights(4, (0.3, 0.3, 0.2, 0.2), concentration=20, seed=6)
+        category = sample_simplex_weights(4, [1 / 7] * 7, concentration=50, seed=7)
+        result = sweep_weights(self.table, adli, letci, category)
+
+        assert result.org_scores.shape == (4, 5)
+        for k in range(4):
+            expected = self._scalar_org_scores(adli[k], letci[k], category[k])
+            np.testing.assert_allclose(result.org_scores[k], expected, atol=0.02)
+
+    def test_chunking_does_not_change_results(self):
+        """Results should not depend on the chunk size."""
+        adli = simplex_grid(4, step=0.25)
+        whole = sweep_weights(self.table, adli_weights=adli, top_k=5)
+        chunked = sweep_weights(self.table, adli_weights=adli, top_k=5, chunk_size=7)
+        np.testing.assert_allclose(chunked.org_scores, whole.org_scores)
+        np.testing.assert_array_equal(chunked.top_priority, whole.top_priority)
+        np.testing.assert_array_equal(chunked.maturity_codes, whole.maturity_codes)
+
+    def test_extreme_weights_shift_scores_and_priorities(self):
+        """Putting all weight on one category should move scores and priorities."""
+        category = np.eye(7)
+        result = sweep_weights(self.table, category_weights=category)
+        frame = result.org_frame()
+        assert list(frame.columns) == ['org_id', 'baseline', 'min', 'p5', 'p95', 'max',
+                                       'band_change_rate', 'priority_change_rate']
+        assert (frame['max'] - frame['min'] > 1.0).all()
+        assert (result.summary()['band_changes'] > 0).any()
+        assert set(np.unique(result.baseline_top_priority)) <= set(range(8))
+
+    def test_invalid_weight_sets(self):
+        """Mismatched set counts and widths should be rejected."""
+        with pytest.raises(ValueError):
+            sweep_weights(self.table, adli_weights=np.ones((3, 4)),
+                          letci_weights=np.ones((2, 4)))
+        with pytest.raises(ValueError):
+            sweep_weights(self.table, category_weights=np.ones((2, 6)))
+        with pytest.raises(ValueError):
+            sweep_weights(ItemTable.empty())
@@ -0,0 +1,41 @@
+"""
+Tests for incremental trend updates with TrendState.
+"""
+
+import json
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import LeTCIScorer, TrendState
+
+
+class TestTrendState:
+    """Tests for constant-time trend updates."""
+
+    def setup_method(self):
+        self.scorer = LeTCIScorer()
+        self.history = list(np.random.default_rng(7).uniform(20, 100, size=60))
+
+    @pytest.mark.parametrize('periods', [1, 2, 3, 5])
+    def test_matches_full_recompute(self, periods):
+        """Each append should match normalize_trend over the full history."""
+        state = TrendState(periods=periods)
+        for n, value in enumerate(self.history, start=1):
+            score = state.append(value)
+            assert score == pytest.approx(
+                self.scorer.normalize_trend(self.history[:n], periods=periods), abs=1e-9
+            )
+
+    def test_insufficient_data_is_neutral(self):
+        """A single observation should score 0.5."""
+        assert TrendState().append(80.0) == 0.5
+
+    def test_serialization_round_trip(self):
+        """Serialized state should be JSON-compatible and restore the same score."""
+        state = TrendState(periods=4, values=self.history)
+        payload = json.dumps(state.to_dict())
+        restored = TrendState.from_dict(json.loads(payload))
+        assert len(restored.to_dict()['window']) == 4
+        assert restored.score == pytest.approx(state.score)
+        assert restored.append(55.0) == pytest.approx(state.append(55.0))
@@ -0,0 +1,73 @@
+"""
+Tests for the Monte Carlo uncertainty engine.
+"""
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import ItemTable, UncertaintyEngine, simulate_uncertainty
+from edcellence.algorithms.organizational_scoring import OrganizationalScorer
+from edcellence.data import load_sample_data
+
+
+class TestUncertaintyEngine:
+    """Tests for noise propagation, chunking and reproducibility."""
+
+    def setup_method(self):
+        self.scorer = OrganizationalScorer()
+        self.table = ItemTable.from_organizations([load_sample_data()] * 3)
+        scored = self.scorer.score_item_table(self.table)
+        self.rollup = self.scorer.compute_rollups(scored)
+
+    def test_zero_noise_reproduces_deterministic_scores(self):
+        """Without noise every draw should equal the deterministic pipeline."""
+        result = simulate_uncertainty(self.table, self.scorer, scale=0.0, n_draws=5)
+        np.testing.assert_allclose(result.org_draws,
+                                   np.tile(self.rollup.org_score, (5, 1)), atol=0.01)
+        np.testing.assert_allclose(result.category_draws[0], self.rollup.category_score,
+                                   atol=0.01)
+        ihi = self.scorer.compute_integration_health_index_batch(
+            self.rollup.category_matrix())
+        np.testing.assert_allclose(result.ihi_draws[0], ihi, atol=1e-3)
+
+    @pytest.mark.parametrize('noise', ['normal', 'uniform', 'beta'])
+    def test_intervals_bracket_baseline(self, noise):
+        """Intervals should widen with noise and bracket the deterministic score."""
+        result = simulate_uncertainty(self.table, noise=noise, scale=0.05, n_draws=400, seed=1)
+        frame = result.org_intervals()
+        assert (frame['p5'] < self.rollup.org_score).all()
+        assert (frame['p95'] > self.rollup.org_score).all()
+        assert (frame['std'] > 0).all()
+        assert list(result.category_intervals().columns) == [
+            'org_id', 'category', 'mean', 'std', 'p5', 'p50', 'p95']
+
+    def test_seeded_chunks_are_reproducible(self):
+        """Chunks should be reproducible in any order for a fixed seed."""
+        engine = UncertaintyEngine(self.table, n_draws=100, chunk_size=30, seed=42)
+        assert engine.n_chunks == 4
+        forward = engine.run()
+        backward = [engine.simulate_chunk(i) for i in reversed(range(engine.n_chunks))][::-1]
+        np.testing.assert_array_equal(
+            forward.org_draws, np.concatenate([chunk[1] for chunk in backward]))
+        assert forward.n_draws == 100
+
+        again = simulate_uncertainty(self.table, n_draws=100, chunk_size=30, seed=42)
+        np.testing.assert_array_equal(again.org_draws, forward.org_draws)
+
+    def test_per_indicator_scale(self):
+        """Indicators with zero scale should not move."""
+        scale = np.zeros((len(self.table), 4))
+        scale[self.table.category == 7] = 0.1
+        result = simulate_uncertainty(self.table, scale=scale, n_draws=50, seed=3)
+        category_std = result.category_intervals().set_index(['org_id', 'category'])['std']
+        assert (category_std.xs(7, level='category') > 0).all()
+        assert np.allclose(category_std.drop(7, level='category'), 0.0)
+
+    def test_invalid_arguments(self):
+        """Unknown noise models and invalid scales should be rejected."""
+        with pytest.raises(ValueError):
+            UncertaintyEngine(self.table, noise='cauchy')
+        with pytest.raises(ValueError):
+            UncertaintyEngine(self.table, scale=-0.1)
+        with pytest.raises(ValueError):
+            UncertaintyEngine(self.table, noise='beta', scale=0.6)
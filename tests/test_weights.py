@@ -0,0 +1,89 @@
+"""
+Tests for compiled weight objects and the shared scorer cache.
+"""
+
+import pytest
+import numpy as np
+
+from edcellence.algorithms import (
+    ADLIScorer, ADLIWeights, CategoryWeights, LeTCIWeights,
+    compute_adli_score, get_adli_scorer, get_letci_scorer,
+)
+from edcellence.algorithms.organizational_scoring import get_organizational_scorer
+
+
+class TestWeightObjects:
+    """Tests for frozen, pre-validated weight objects."""
+
+    def test_defaults_match_scorer_defaults(self):
+        """Default weight objects should equal the scorers' DEFAULT_WEIGHTS."""
+        assert ADLIWeights().as_dict() == ADLIScorer.DEFAULT_WEIGHTS
+        np.testing.assert_allclose(CategoryWeights().vector, np.full(7, 1/7))
+
+    def test_invalid_weights_rejected(self):
+        """Weights not summing to 1.0 or out of range should be rejected."""
+        with pytest.raises(ValueError, match='sum to 1.0'):
+            ADLIWeights(w_A=0.5)
+        with pytest.raises(ValueError, match='out of range'):
+            LeTCIWeights(w_Lv=1.2, w_Tr=-0.2, w_Cp=0.0, w_I=0.0)
+        with pytest.raises(ValueError, match='Missing'):
+            ADLIWeights.from_dict({'w_A': 1.0})
+
+    def test_frozen_and_hashable(self):
+        """Weights should be immutable, hashable and equal by value."""
+        weights = ADLIWeights(0.4, 0.3, 0.15, 0.15)
+        with pytest.raises(AttributeError):
+            weights.w_A = 0.5
+        with pytest.raises(ValueError):
+            weights.vector[0] = 0.5
+        assert {weights: 1}[ADLIWeights.from_dict(weights.as_dict())] == 1
+
+
+class TestScorerCache:
+    """Tests for the process-wide scorer cache."""
+
+    def test_identical_weights_share_scorer(self):
+        """Dicts and weight objects with equal content should share a scorer."""
+        custom = {'w_A': 0.4, 'w_D': 0.3, 'w_L': 0.15, 'w_I': 0.15}
+        assert get_adli_scorer(custom) is get_adli_scorer(dict(custom))
+        assert get_adli_scorer(custom) is get_adli_scorer(ADLIWeights(0.4, 0.3, 0.15, 0.15))
+        assert get_letci_scorer() is get_letci_scorer(LeTCIWeights())
+
+    def test_cached_scorer_results(self):
+        """Convenience function should score with the requested weights."""
+        indicators = {'P_A': 1.0, 'P_D': 0.0, 'P_L': 0.0, 'P_I': 0.0}
+        assert compute_adli_score(indicators) == pytest.approx(30.0)
+        weights = {'w_A': 1.0, 'w_D': 0.0, 'w_L': 0.0, 'w_I': 0.0}
+        assert compute_adli_score(indicators, weights) == pytest.approx(100.0)
+
+    def test_organizational_scorer_cache(self):
+        """Organizational scorers should be shared for identical weights."""
+        scorer = get_organizational_scorer()
+        assert scorer is get_organizational_scorer(CategoryWeights(), ADLIWeights(), None)
+        assert scorer.adli_scorer is get_adli_scorer()
+
+    def test_shared_scorers_are_read_only(self):
+        """Shared scorers should reject changes to their weights and cache."""
+        scorer = get_organizational_scorer()
+        for shared in (scorer.adli_scorer, scorer.letci_scorer):
+            with pytest.raises(TypeError):
+                shared.weights[shared.WEIGHT_KEYS[0]] = 1.0
+            with pytest.raises(AttributeError):
+                shared.weights = {}
+            with pytest.raises(AttributeError):
+                shared.cache = None
+            np.testing.assert_array_equal(list(shared.weights.values()),
+                                          shared.weight_vector)
+        with pytest.raises(TypeError):
+            scorer.category_weights[1] = 1.0
+        with pytest.raises(AttributeError):
+            scorer.cache = None
+
+    def test_scorer_does_not_alias_caller_weights(self):
+        """Mutating the caller's dict should not change a built scorer."""
+        custom = {'w_A': 0.4, 'w_D': 0.3, 'w_L': 0.15, 'w_I': 0.15}
+        scorer = ADLIScorer(custom)
+        custom['w_A'] = 0.0
+        indicators = {'P_A': 1.0, 'P_D': 0.0, 'P_L': 0.0, 'P_I': 0.0}
+        assert scorer.compute_score(indicators) == pytest.approx(40.0)
+        assert scorer.compute_score_batch(np.array([[1.0, 0.0, 0.0, 0.0]]))[0] == 40.0